@@ -77,6 +77,8 @@ class ModelSettings(BaseModel):
     max_retries: PositiveInt
     allowed_providers: list[str]
     system_prompt: str
+    # explicit size class of the model for docstring prompts, classified automatically if not set
+    small_model: bool | None = None
 
     model_config = ConfigDict(extra="allow")
 
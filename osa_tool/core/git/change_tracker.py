@@ -0,0 +1,57 @@
+"""Registry of the repository paths written by operations, staged by a commit instead of the whole working tree."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+
+class ChangeTracker:
+    """
+    Paths created, modified, moved or deleted by operations.
+
+    Operations register every path they touch, including the old path of a move and deleted paths. A commit then
+    stages exactly these paths by pathspec, so staging does not rescan and hash the whole working tree and never
+    picks up untracked files that OSA did not write, such as build artifacts. A registered directory covers
+    everything below it.
+
+    Paths are kept absolute, so one tracker serves all repositories handled by a process.
+    """
+
+    def __init__(self):
+        self._paths: set[str] = set()
+        self._lock = threading.Lock()
+
+    def register(self, *paths: str | os.PathLike) -> None:
+        """Registers paths touched by an operation. Relative paths are resolved against the working directory."""
+        with self._lock:
+            self._paths.update(os.path.abspath(path) for path in paths)
+
+    def pending(self, root: str | os.PathLike) -> list[str]:
+        """Returns the registered paths inside the root directory, relative to it and in POSIX form."""
+        root = os.path.abspath(root)
+        with self._lock:
+            paths = [os.path.relpath(path, root) for path in self._paths if _is_inside(path, root)]
+        return sorted(path.replace(os.sep, "/") for path in paths)
+
+    def discard(self, root: str | os.PathLike) -> None:
+        """Forgets the registered paths inside the root directory once they are committed."""
+        root = os.path.abspath(root)
+        with self._lock:
+            self._paths = {path for path in self._paths if not _is_inside(path, root)}
+
+
+def _is_inside(path: str, root: str) -> bool:
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
+_change_tracker = ChangeTracker()
+
+
+def get_change_tracker() -> ChangeTracker:
+    return _change_tracker
+
+
+def track_changes(*paths: str | os.PathLike) -> None:
+    """Registers paths written by an operation with the process-wide change tracker."""
+    _change_tracker.register(*paths)
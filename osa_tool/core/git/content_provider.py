@@ -0,0 +1,92 @@
+"""Read-only access to the files of a repository commit, served from git objects without a checkout."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from git import Repo
+
+
+class GitContentProvider:
+    """
+    File listing and contents of one commit of a repository, read from its object store.
+
+    Blobs are read through the persistent `git cat-file --batch` process of GitPython, so reading many files
+    costs one process and no checkout I/O. Works on bare repositories and mirrors of the mirror cache as well as
+    working copies, where uncommitted changes are not seen.
+
+    The provider is thread-safe: concurrent analyses can share one instance and its cat-file process.
+    """
+
+    def __init__(self, git_dir: str | Path, rev: str = "HEAD"):
+        """
+        Args:
+            git_dir: A bare repository or a working copy.
+            rev: The commit, branch or tag to read. The commit it points to is resolved once.
+        """
+        self.repo = Repo(git_dir)
+        self.commit = self.repo.git.rev_parse("--verify", f"{rev}^{{commit}}")
+        self._blobs: Dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def list_files(self) -> List[str]:
+        """Returns the paths of the files of the commit, relative to the repository root and in POSIX form."""
+        return list(self._get_blobs())
+
+    def exists(self, path: str) -> bool:
+        return self._normalize(path) in self._get_blobs()
+
+    def read_bytes(self, path: str) -> bytes:
+        """
+        Returns the contents of a file of the commit.
+
+        Raises:
+            FileNotFoundError: If the commit has no such file.
+        """
+        blob_sha = self._get_blobs().get(self._normalize(path))
+        if blob_sha is None:
+            raise FileNotFoundError(f"{path} is not in commit {self.commit}")
+        with self._lock:
+            _, _, _, data = self.repo.git.get_object_data(blob_sha)
+        return data
+
+    def read_text(self, path: str) -> str:
+        """Returns the text of a file of the commit, decoded with the first encoding that fits like `read_file`."""
+        data = self.read_bytes(path)
+        for encoding in ("utf-8", "utf-16"):
+            try:
+                return data.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+        return data.decode("latin-1")
+
+    def close(self) -> None:
+        """Stops the cat-file processes of the repository."""
+        self.repo.close()
+
+    def __enter__(self) -> GitContentProvider:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_blobs(self) -> Dict[str, str]:
+        with self._lock:
+            if self._blobs is None:
+                blobs = {}
+                # "<mode> <type> <sha>\t<path>" records, submodules are commit entries and are skipped
+                for entry in self.repo.git.ls_tree("-r", "-z", self.commit).split("\0"):
+                    if not entry:
+                        continue
+                    info, path = entry.split("\t", 1)
+                    _, object_type, blob_sha = info.split()
+                    if object_type == "blob":
+                        blobs[path] = blob_sha
+                self._blobs = blobs
+            return self._blobs
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return Path(path).as_posix().lstrip("/").removeprefix("./")
@@ -2,12 +2,15 @@ import abc
 import os
 import re
 import time
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List
 
 import requests
 from dotenv import load_dotenv
-from git import GitCommandError, InvalidGitRepositoryError, Repo
+from git import Git, GitCommandError, InvalidGitRepositoryError, Repo
 
+from osa_tool.core.git.change_tracker import get_change_tracker
+from osa_tool.core.git.content_provider import GitContentProvider
 from osa_tool.core.git.metadata import (
     GitHubMetadataLoader,
     GitLabMetadataLoader,
@@ -15,9 +18,12 @@ from osa_tool.core.git.metadata import (
     LocalMetadataLoader,
     RepositoryMetadata,
 )
+from osa_tool.core.git.mirror_cache import MirrorCache
+from osa_tool.core.git.rate_limit import RateLimitDeferred
 from osa_tool.core.git.request_utils import request_with_retry
 from osa_tool.utils.logger import logger
 from osa_tool.utils.utils import (
+    delete_repository,
     get_base_repo_url,
     is_path,
     parse_folder_name,
@@ -43,14 +49,34 @@ class GitAgent(abc.ABC):
         metadata: Git repository metadata.
         base_branch: The name of the repository's branch.
         pr_report_body: A formatted message for a pull request.
+        clone_mode: How the repository is cloned, one of CLONE_MODES.
+        sparse_paths: Directories checked out in the "sparse" clone mode, besides the top-level files.
+        mirror_cache: Local cache of bare mirrors the repository is cloned from, if any.
     """
 
+    # full: the whole history of the branch; shallow: only the last commit (--depth 1);
+    # blobless: all commits, file contents are fetched on demand (--filter=blob:none);
+    # sparse: blobless with a sparse checkout of sparse_paths
+    CLONE_MODES = ("full", "shallow", "blobless", "sparse")
+
+    # forks are created asynchronously, pushes wait until the fork answers both the API and git
+    FORK_READY_TIMEOUT = 300.0
+    FORK_PROBE_INITIAL_DELAY = 0.25
+    FORK_PROBE_MAX_DELAY = 8.0
+
+    # larger sets of changed paths are staged through a pathspec file to stay below command-line length limits
+    PATHSPEC_ARGS_LIMIT = 100
+
     def __init__(
         self,
         repo_url: str,
         repo_branch_name: str = None,
         branch_name: str = "osa_tool",
         author: str = None,
+        clone_mode: str = "full",
+        sparse_paths: List[str] = None,
+        mirror_cache: MirrorCache = None,
+        metadata: RepositoryMetadata = None,
     ):
         """Initializes the agent with repository info.
 
@@ -59,7 +85,14 @@ class GitAgent(abc.ABC):
             repo_branch_name: The name of the repository's branch to be checked out.
             branch_name: The name of the branch to be created. Defaults to "osa_tool".
             author: The name of the author of the pull request.
+            clone_mode: How the repository is cloned, one of CLONE_MODES. Defaults to "full".
+            sparse_paths: Directories checked out in the "sparse" clone mode.
+            mirror_cache: Local cache of bare mirrors to clone the repository from instead of the remote.
+            metadata: Already loaded repository metadata, e.g. from a batch request. Loaded if not given.
         """
+        if clone_mode not in self.CLONE_MODES:
+            raise ValueError(f"Unknown clone mode '{clone_mode}', expected one of {', '.join(self.CLONE_MODES)}")
+
         load_dotenv()
         self.author = author
         self.repo_url = repo_url
@@ -68,9 +101,13 @@ class GitAgent(abc.ABC):
         self.repo = None
         self.token = self._get_token()
         self.fork_url = None
-        self.metadata = self._load_metadata(self.repo_url)
+        self.metadata = metadata or self._load_metadata(self.repo_url)
         self.base_branch = repo_branch_name or self.metadata.default_branch
         self.pr_report_body = ""
+        self.clone_mode = clone_mode
+        self.sparse_paths = sparse_paths or []
+        self.mirror_cache = mirror_cache
+        self._fork_pending = False
 
     @property
     def agent_signature(self) -> str:
@@ -265,6 +302,9 @@ class GitAgent(abc.ABC):
         if branch is None:
             branch = self.branch_name
 
+        if self._clone_from_mirror(self.fork_url or self.repo_url, branch):
+            return
+
         try:
             logger.info(f"Cloning existing branch '{branch}' from {self.fork_url or self.repo_url}...")
             self.repo = Repo.clone_from(
@@ -272,7 +312,9 @@ class GitAgent(abc.ABC):
                 to_path=self.clone_dir,
                 branch=branch,
                 single_branch=True,
+                **self._clone_options(),
             )
+            self._apply_sparse_checkout()
             logger.info(f"Successfully cloned branch '{branch}'")
         except GitCommandError as e:
             self._handle_git_error(e, f"cloning branch '{branch}'")
@@ -294,8 +336,12 @@ class GitAgent(abc.ABC):
 
         Note:
             The 'single_branch=True' parameter is used to clone only the requested
-            branch, which is more efficient than cloning all branches.
+            branch, which is more efficient than cloning all branches. The clone mode
+            may limit it further, see CLONE_MODES.
         """
+        if self._clone_from_mirror(self.repo_url, self.base_branch):
+            return
+
         try:
             logger.info(
                 f"Cloning the '{self.base_branch}' branch from {self.repo_url} into directory {self.clone_dir}..."
@@ -307,7 +353,9 @@ class GitAgent(abc.ABC):
                 to_path=self.clone_dir,
                 branch=self.base_branch,
                 single_branch=True,
+                **self._clone_options(),
             )
+            self._apply_sparse_checkout()
             logger.info("Cloning completed")
 
         except Exception as e:
@@ -321,7 +369,9 @@ class GitAgent(abc.ABC):
                     to_path=self.clone_dir,
                     branch=self.base_branch,
                     single_branch=True,
+                    **self._clone_options(),
                 )
+                self._apply_sparse_checkout()
                 logger.info("Cloning completed")
 
             except GitCommandError as e:
@@ -329,6 +379,120 @@ class GitAgent(abc.ABC):
             except Exception as e:
                 raise Exception(f"Unexpected error during cloning: {e}")
 
+    def _clone_from_mirror(self, url: str, branch: str) -> bool:
+        """
+        Clones the branch from the local mirror of the remote, the mirror is fetched incrementally first.
+
+        The clone is local, so the shallow and blobless clone modes do not apply to it: the objects are hardlinked
+        from the mirror. The origin remote points to the remote repository as after a regular clone.
+
+        Returns:
+            True if the repository was cloned, False if there is no mirror cache or it failed and the remote
+            has to be cloned directly.
+        """
+        if self.mirror_cache is None:
+            return False
+
+        try:
+            with self.mirror_cache.mirror(url, self._mirror_fetch_urls(url)) as mirror_path:
+                logger.info(f"Cloning the '{branch}' branch from the cached mirror {mirror_path}...")
+                self.repo = Repo.clone_from(
+                    url=str(mirror_path),
+                    to_path=self.clone_dir,
+                    branch=branch,
+                    single_branch=True,
+                    **({"sparse": True} if self.clone_mode == "sparse" else {}),
+                )
+            self.repo.git.remote("set-url", "origin", self._get_unauth_url(url))
+            self._apply_sparse_checkout()
+            logger.info("Cloning completed")
+            return True
+        except (GitCommandError, OSError) as e:
+            # the command line of a git error may contain the token
+            details = (e.stderr or "").strip() if isinstance(e, GitCommandError) else e
+            logger.warning(f"Failed to clone {url} from the mirror cache, cloning it directly: {details}")
+
+        self.repo = None
+        if os.path.exists(self.clone_dir):
+            delete_repository(self.clone_dir)
+        return False
+
+    def _mirror_fetch_urls(self, url: str) -> List[str]:
+        fetch_urls = [self._get_unauth_url(url)]
+        if self.token:
+            fetch_urls.append(self._get_auth_url(url))
+        return fetch_urls
+
+    @contextmanager
+    def content_provider(self, rev: str = None) -> Iterator[GitContentProvider]:
+        """
+        Opens the files of a commit for reading without a working-tree checkout.
+
+        With a mirror cache the commit is read from the cached mirror, which is fetched first, so report-only
+        analyses do not need a clone. The mirror stays locked while the provider is open, so it is not evicted
+        under a running analysis. Without a mirror cache the clone is read.
+
+        Args:
+            rev: The commit, branch or tag to read. Defaults to the base branch of the mirror or HEAD of the clone.
+
+        Raises:
+            ValueError: If there is neither a mirror cache nor a clone.
+        """
+        if self.mirror_cache is not None:
+            with self.mirror_cache.mirror(self.repo_url, self._mirror_fetch_urls(self.repo_url)) as mirror_path:
+                with GitContentProvider(mirror_path, rev or self.base_branch) as provider:
+                    yield provider
+            return
+
+        if self.repo is None:
+            raise ValueError("The repository is not cloned and there is no mirror cache to read it from.")
+        with GitContentProvider(self.repo.git_dir, rev or "HEAD") as provider:
+            yield provider
+
+    def _clone_options(self) -> dict:
+        """Returns the `git clone` options of the clone mode."""
+        if self.clone_mode == "shallow":
+            return {"depth": 1}
+        if self.clone_mode == "blobless":
+            return {"filter": "blob:none"}
+        if self.clone_mode == "sparse":
+            return {"filter": "blob:none", "sparse": True}
+        return {}
+
+    def _apply_sparse_checkout(self) -> None:
+        """Checks out sparse_paths in a sparse clone, only the top-level files are checked out after cloning."""
+        if self.clone_mode != "sparse":
+            return
+
+        if not self.sparse_paths:
+            logger.warning("Sparse clone without sparse paths: only the top-level files are checked out")
+            return
+
+        logger.info(f"Checking out sparse paths: {', '.join(self.sparse_paths)}")
+        self.repo.git.sparse_checkout("set", *self.sparse_paths)
+
+    def ensure_history(self, depth: int = None) -> None:
+        """
+        Fetches the history of a shallow clone for operations that read commits.
+
+        Other clone modes already have the whole history of the branch, so nothing is fetched for them.
+
+        Args:
+            depth: The number of commits from the tip that are needed. The whole history is fetched if None.
+        """
+        if self.repo is None or self.repo.git.rev_parse("--is-shallow-repository") != "true":
+            return
+
+        try:
+            if depth is None:
+                logger.info("Fetching the whole history of the shallow clone...")
+                self.repo.git.fetch("--unshallow")
+            else:
+                logger.info(f"Deepening the shallow clone to {depth} commits...")
+                self.repo.git.fetch(f"--depth={depth}")
+        except GitCommandError as e:
+            self._handle_git_error(e, "fetching repository history", raise_exception=False)
+
     def clone_repository(self) -> None:
         """
         Clones or initializes the Git repository in the local filesystem.
@@ -414,30 +578,85 @@ class GitAgent(abc.ABC):
             self.repo.git.checkout("-b", branch)
             logger.info(f"Switched to branch {branch}.")
 
+    def wait_for_fork(self, timeout: float = None) -> bool:
+        """
+        Waits until a fork created by create_fork is ready to be pushed to.
+
+        The fork is probed with exponential backoff starting at FORK_PROBE_INITIAL_DELAY: it is ready once the
+        platform API reports it and `git ls-remote` lists its branches. Forks are usually ready in a few seconds,
+        and work done between create_fork and the push overlaps with the wait.
+
+        Args:
+            timeout: The longest wait in seconds. Defaults to FORK_READY_TIMEOUT.
+
+        Returns:
+            True if the fork is ready, False if it is still not ready after the timeout.
+        """
+        if not self._fork_pending:
+            return True
+
+        deadline = time.monotonic() + (timeout if timeout is not None else self.FORK_READY_TIMEOUT)
+        delay = self.FORK_PROBE_INITIAL_DELAY
+        while True:
+            if self._fork_api_ready() and self._fork_git_ready():
+                logger.info(f"Fork {self.fork_url} is ready")
+                self._fork_pending = False
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Fork {self.fork_url} is not ready after waiting, pushing anyway")
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.FORK_PROBE_MAX_DELAY)
+
+    def _fork_api_ready(self) -> bool:
+        """Checks the fork through the platform API, platforms without a readiness status rely on git."""
+        return True
+
+    def _fork_git_ready(self) -> bool:
+        try:
+            git = Git()
+            with git.custom_environment(GIT_TERMINAL_PROMPT="0"):
+                return bool(git.ls_remote("--heads", self._get_auth_url(self.fork_url)).strip())
+        except GitCommandError:
+            return False
+
     def commit_and_push_changes(
         self,
         branch: str = None,
         commit_message: str = "osa_tool recommendations",
         force: bool = False,
+        paths: List[str] | None = None,
     ) -> bool:
         """Commits and pushes changes to the forked repository.
 
+        Only the paths registered with the change tracker are staged. The whole working tree is staged
+        if no operation registered its changes.
+
         Args:
             branch: The name of the branch to push changes to. Defaults to `branch_name`.
             commit_message: The commit message. Defaults to "osa_tool recommendations".
             force: Option to force push the commit. Defaults to `False`
+            paths: Paths to commit relative to the repository root, instead of the tracked changes.
         """
         if not self.fork_url:
             raise ValueError("Fork URL is not set. Please create a fork first.")
         if branch is None:
             branch = self.branch_name
 
+        tracked = paths is None
+        if tracked:
+            paths = get_change_tracker().pending(self.clone_dir)
+
         logger.info("Committing changes...")
-        self.repo.git.add(".")
+        self._stage_changes(paths)
 
         try:
             self.repo.git.commit("-m", commit_message)
             logger.info("Commit completed.")
+            if tracked:
+                get_change_tracker().discard(self.clone_dir)
         except GitCommandError as e:
             stderr = (e.stderr or "").lower()
 
@@ -450,7 +669,7 @@ class GitAgent(abc.ABC):
                 logger.warning("Git index corruption detected. Attempting to repair and retry...")
                 try:
                     self.repo.git.reset()  # reset to staging area
-                    self.repo.git.add(".")  # re-indexing all the files again
+                    self._stage_changes(paths)  # re-indexing the files again
                     self.repo.git.commit("-m", commit_message)
                     logger.info("Index repaired and changes committed.")
                 except GitCommandError as retry_e:
@@ -459,6 +678,7 @@ class GitAgent(abc.ABC):
             else:
                 self._handle_git_error(e, "git commit")
 
+        self.wait_for_fork()
         logger.info(f"Pushing changes to branch {branch} in fork...")
         self.repo.git.remote("set-url", "origin", self._get_auth_url(self.fork_url))
         try:
@@ -483,6 +703,52 @@ class GitAgent(abc.ABC):
             )
             return False
 
+    def _stage_changes(self, paths: List[str]) -> None:
+        """Stages the given paths with their deletions, or the whole working tree if there are none.
+
+        Pathspecs are taken literally. Large sets are passed through a pathspec file instead of the
+        command line. Paths that neither exist nor are tracked are skipped, as git rejects them. In a
+        sparse clone, files written outside of the sparse-checkout definition are staged as well.
+
+        Args:
+            paths: Paths relative to the repository root.
+        """
+        # git refuses paths outside of the sparse-checkout definition unless they are explicitly allowed
+        sparse = ["--sparse"] if self.clone_mode == "sparse" else []
+        if not paths:
+            self.repo.git.add(*sparse, ".")
+            return
+
+        env = {"GIT_LITERAL_PATHSPECS": "1"}
+        missing = [path for path in paths if not os.path.lexists(os.path.join(self.clone_dir, path))]
+        if missing:
+            tracked = [path for path in self.repo.git.ls_files("-z", "--", *missing, env=env).split("\0") if path]
+            # a deleted directory is matched by the files tracked below it
+            deleted = {path for path in missing if any(f == path or f.startswith(path + "/") for f in tracked)}
+            paths = [path for path in paths if path not in missing or path in deleted]
+            if not paths:
+                return
+
+        logger.debug(f"Staging {len(paths)} changed paths")
+        try:
+            if len(paths) > self.PATHSPEC_ARGS_LIMIT:
+                pathspec_file = os.path.join(self.repo.git_dir, "OSA_PATHSPEC")
+                with open(pathspec_file, "w", encoding="utf-8") as f:
+                    f.write("\0".join(paths))
+                try:
+                    self.repo.git.add(
+                        "-A", *sparse, f"--pathspec-from-file={pathspec_file}", "--pathspec-file-nul", env=env
+                    )
+                finally:
+                    os.remove(pathspec_file)
+            else:
+                self.repo.git.add("-A", *sparse, "--", *paths, env=env)
+        except GitCommandError as e:
+            # the other paths are staged, files ignored by the repository stay out of the commit like with `git add .`
+            if "ignored by one of your .gitignore files" not in (e.stderr or ""):
+                raise
+            logger.debug(f"Skipped ignored paths: {e.stderr.strip()}")
+
     def upload_report(
         self,
         report_filename: str,
@@ -506,7 +772,9 @@ class GitAgent(abc.ABC):
 
         with open(os.path.join(self.clone_dir, report_filename), "wb") as f:
             f.write(report_content)
-        self.commit_and_push_changes(branch=report_branch, commit_message=commit_message, force=True)
+        self.commit_and_push_changes(
+            branch=report_branch, commit_message=commit_message, force=True, paths=[report_filename]
+        )
 
         self.create_and_checkout_branch(self.branch_name)
 
@@ -641,6 +909,11 @@ class LocalGitAgent(GitAgent):
     def star_repository(self) -> None:
         pass
 
+    @contextmanager
+    def content_provider(self, rev: str = None) -> Iterator[GitContentProvider | None]:
+        """A local repository is analyzed as it is on disk, with uncommitted changes, so no provider is opened."""
+        yield None
+
     def create_pull_request(self, title: str = None, body: str = None) -> None:
         pass
 
@@ -681,10 +954,16 @@ class GitHubAgent(GitAgent):
         response = request_with_retry("post", url, headers=headers)
         if response.status_code in {200, 202}:
             self.fork_url = response.json()["html_url"]
+            self._fork_pending = True
             logger.info(f"GitHub fork created successfully: {self.fork_url}")
         else:
             self._handle_api_error(response, "creating GitHub fork")
 
+    def _fork_api_ready(self) -> bool:
+        url = f"{self.REPOS_API_BASE}/{get_base_repo_url(self.fork_url)}"
+        response = request_with_retry("get", url, headers={"Authorization": f"token {self.token}"})
+        return response.status_code == 200
+
     def star_repository(self) -> None:
         if not self.token:
             raise ValueError("GitHub token is required to star the repository.")
@@ -696,19 +975,22 @@ class GitHubAgent(GitAgent):
         }
 
         url = f"{self.API_BASE}/user/starred/{base_repo}"
-        response_check = request_with_retry("get", url, headers=headers)
+        try:
+            response_check = request_with_retry("get", url, headers=headers, priority="low")
 
-        if response_check.status_code == 204:
-            logger.info(f"GitHub repository '{base_repo}' is already starred.")
-            return
-        elif response_check.status_code != 404:
-            self._handle_api_error(response_check, "checking star status", raise_exception=False)
+            if response_check.status_code == 204:
+                logger.info(f"GitHub repository '{base_repo}' is already starred.")
+                return
+            elif response_check.status_code != 404:
+                self._handle_api_error(response_check, "checking star status", raise_exception=False)
 
-        response_star = request_with_retry("put", url, headers=headers)
-        if response_star.status_code == 204:
-            logger.info(f"GitHub repository '{base_repo}' has been starred successfully.")
-        else:
-            self._handle_api_error(response_star, "starring repository", raise_exception=False)
+            response_star = request_with_retry("put", url, headers=headers, priority="low")
+            if response_star.status_code == 204:
+                logger.info(f"GitHub repository '{base_repo}' has been starred successfully.")
+            else:
+                self._handle_api_error(response_star, "starring repository", raise_exception=False)
+        except RateLimitDeferred as e:
+            logger.warning(f"Starring the repository is skipped to save the API rate limit: {e}")
 
     def _check_github_branch_exists(self, branch: str) -> bool:
         """Check if branch exists on GitHub using API."""
@@ -911,10 +1193,8 @@ class GitHubAgent(GitAgent):
                     else:
                         logger.debug(f"Generated topic '{topic}' is not valid, skipping")
                 elif response.status_code == 403:
-                    logger.warning("Rate limit exceeded, waiting 60 seconds")
-                    time.sleep(60)
-
-                time.sleep(1)
+                    # the next request waits for the rate limit reset, see RateLimitLedger
+                    logger.warning(f"Rate limit exceeded while validating topic '{topic}'")
 
             except Exception as e:
                 logger.error(f"Error validating topic '{topic}': {e}")
@@ -994,11 +1274,20 @@ class GitLabAgent(GitAgent):
         if fork_response.status_code in {200, 201, 202}:
             fork_data = fork_response.json()
             self.fork_url = fork_data["web_url"]
+            self._fork_pending = True
             logger.info(f"GitLab fork created successfully: {self.fork_url}")
         else:
             logger.error(f"Failed to create GitLab fork: {fork_response.status_code} - {fork_response.text}")
             raise ValueError("Failed to create fork.")
 
+    def _fork_api_ready(self) -> bool:
+        gitlab_instance = re.match(r"(https?://[^/]*gitlab[^/]*)", self.fork_url).group(1)
+        project_path = get_base_repo_url(self.fork_url).replace("/", "%2F")
+        url = f"{gitlab_instance}{self.PROJECTS_API_PATH}/{project_path}"
+        response = request_with_retry("get", url, headers={"Authorization": f"Bearer {self.token}"})
+        # GitLab copies the repository into the fork in the background
+        return response.status_code == 200 and response.json().get("import_status") in (None, "none", "finished")
+
     def star_repository(self) -> None:
         if not self.token:
             raise ValueError("GitLab token is required to star the repository.")
@@ -1013,16 +1302,19 @@ class GitLabAgent(GitAgent):
         }
 
         url = f"{gitlab_instance}{self.PROJECTS_API_PATH}/{project_path}/star"
-        response = request_with_retry("post", url, headers=headers)
+        try:
+            response = request_with_retry("post", url, headers=headers, priority="low")
 
-        if response.status_code == 304:
-            logger.info(f"GitLab repository '{base_repo}' is already starred.")
-            return
-        elif response.status_code == 201:
-            logger.info(f"GitLab repository '{base_repo}' has been starred successfully.")
-            return
-        else:
-            logger.error(f"Failed to star GitLab repository: {response.status_code} - {response.text}")
+            if response.status_code == 304:
+                logger.info(f"GitLab repository '{base_repo}' is already starred.")
+                return
+            elif response.status_code == 201:
+                logger.info(f"GitLab repository '{base_repo}' has been starred successfully.")
+                return
+            else:
+                logger.error(f"Failed to star GitLab repository: {response.status_code} - {response.text}")
+        except RateLimitDeferred as e:
+            logger.warning(f"Starring the repository is skipped to save the API rate limit: {e}")
 
     def _check_gitlab_branch_exists(self, branch: str) -> bool:
         """Check if branch exists on GitLab using API."""
@@ -1228,9 +1520,8 @@ class GitLabAgent(GitAgent):
                     else:
                         logger.debug(f"Topic '{topic}' not found on GitLab, skipping")
                 elif response.status_code == 403:
-                    logger.warning("Rate limit exceeded, waiting 60 seconds")
-                    time.sleep(60)
-                time.sleep(1)
+                    # the next request waits for the rate limit reset, see RateLimitLedger
+                    logger.warning(f"Rate limit exceeded while validating topic '{topic}'")
             except Exception as e:
                 logger.error(f"Error validating topic '{topic}': {e}")
                 continue
@@ -1291,6 +1582,7 @@ class GitverseAgent(GitAgent):
         fork_response = request_with_retry("post", fork_url, json=body, headers=headers)
         if fork_response.status_code in {200, 201}:
             self.fork_url = f"{self.WEB_BASE}/{fork_response.json()['full_name']}"
+            self._fork_pending = True
             logger.info(f"Gitverse fork created successfully: {self.fork_url}")
         else:
             logger.error(f"Failed to create Gitverse fork: {fork_response.status_code} - {fork_response.text}")
@@ -1307,19 +1599,22 @@ class GitverseAgent(GitAgent):
             "User-Agent": "Mozilla/5.0",
         }
         url = f"{self.API_BASE}/user/starred/{base_repo}"
-        response_check = request_with_retry("get", url, headers=headers)
-        if response_check.status_code == 204:
-            logger.info(f"Gitverse repository '{base_repo}' is already starred.")
-            return
-        elif response_check.status_code != 404:
-            logger.error(f"Failed to check star status: {response_check.status_code} - {response_check.text}")
-            raise ValueError("Failed to check star status.")
+        try:
+            response_check = request_with_retry("get", url, headers=headers, priority="low")
+            if response_check.status_code == 204:
+                logger.info(f"Gitverse repository '{base_repo}' is already starred.")
+                return
+            elif response_check.status_code != 404:
+                logger.error(f"Failed to check star status: {response_check.status_code} - {response_check.text}")
+                raise ValueError("Failed to check star status.")
 
-        response_star = request_with_retry("put", url, headers=headers)
-        if response_star.status_code == 204:
-            logger.info(f"Gitverse repository '{base_repo}' has been starred successfully.")
-        else:
-            logger.error(f"Failed to star Gitverse repository: {response_star.status_code} - {response_star.text}")
+            response_star = request_with_retry("put", url, headers=headers, priority="low")
+            if response_star.status_code == 204:
+                logger.info(f"Gitverse repository '{base_repo}' has been starred successfully.")
+            else:
+                logger.error(f"Failed to star Gitverse repository: {response_star.status_code} - {response_star.text}")
+        except RateLimitDeferred as e:
+            logger.warning(f"Starring the repository is skipped to save the API rate limit: {e}")
 
     def _check_gitverse_branch_exists(self, branch: str) -> bool:
         """Check if branch exists on Gitverse using API."""
@@ -0,0 +1,144 @@
+"""On-disk cache of git-host API responses revalidated with conditional requests."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from osa_tool.utils.logger import logger
+
+# request headers that select a different representation of the same URL
+VARY_HEADERS = ("Accept", "Authorization", "PRIVATE-TOKEN")
+# response headers kept with the cached body
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    url: str
+    body: bytes
+    headers: dict[str, str]
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("Last-Modified")
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Builds a 200 response with the cached body, so callers handle it like a fresh one."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+        return response
+
+
+class HttpCache:
+    """
+    On-disk HTTP cache of GET responses with ETag / Last-Modified validators.
+
+    A response is served from the cache without a request while it is younger than `max_age` seconds. An older
+    entry is revalidated with If-None-Match / If-Modified-Since: a 304 answer costs no transfer and, on GitHub,
+    no rate limit, and the cached body is returned. Only successful responses with a validator are stored.
+
+    Entries are keyed by the URL with its query and by the request headers in VARY_HEADERS, so responses fetched
+    with different tokens are not mixed. The tokens themselves are only stored hashed.
+    """
+
+    def __init__(self, path: str | Path, max_age: float = 0.0):
+        """
+        Args:
+            path: The directory of the cache entries.
+            max_age: How many seconds a stored response is used without revalidation. 0 revalidates every time.
+        """
+        self.path = Path(path).expanduser()
+        self.max_age = max_age
+        self.hits = 0
+        self.revalidated = 0
+
+    def key(self, url: str, headers: dict | None = None, params: dict | None = None) -> str:
+        prepared_url = requests.Request("GET", url, params=params).prepare().url
+        vary = CaseInsensitiveDict(headers or {})
+        digest = hashlib.sha256(prepared_url.encode("utf-8"))
+        for name in VARY_HEADERS:
+            digest.update(b"\0" + name.encode("utf-8") + b"=" + str(vary.get(name, "")).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+        try:
+            with open(entry_path, mode="r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return CachedResponse(
+                url=entry["url"],
+                body=base64.b64decode(entry["body"]),
+                headers=entry["headers"],
+                stored_at=entry["stored_at"],
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable HTTP cache entry {entry_path}: {e}")
+            return None
+
+    def is_fresh(self, cached: CachedResponse) -> bool:
+        return time.time() - cached.stored_at < self.max_age
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """Stores a successful response that has a validator, other responses are not cached."""
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        if response.status_code != 200 or not ("ETag" in headers or "Last-Modified" in headers):
+            return
+        self._write(key, CachedResponse(response.url or "", response.content, headers, time.time()))
+
+    def refresh(self, key: str, cached: CachedResponse, response: requests.Response) -> None:
+        """Marks a revalidated entry as fresh, taking the new validators of the 304 response."""
+        for name in ("ETag", "Last-Modified"):
+            if name in response.headers:
+                cached.headers[name] = response.headers[name]
+        cached.stored_at = time.time()
+        self._write(key, cached)
+
+    def _write(self, key: str, cached: CachedResponse) -> None:
+        entry = {
+            "url": cached.url,
+            "body": base64.b64encode(cached.body).decode("ascii"),
+            "headers": cached.headers,
+            "stored_at": cached.stored_at,
+        }
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, mode="w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            temp_path.replace(entry_path)
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache entry {entry_path}: {e}")
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
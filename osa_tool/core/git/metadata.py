@@ -1,3 +1,4 @@
+import copy
 import os
 import re
 from abc import ABC, abstractmethod
@@ -192,7 +193,7 @@ class MetadataLoader(ABC):
         if not url:
             return []
         try:
-            response = requests.get(url=url, headers=headers)
+            response = request_with_retry("get", url=url, headers=headers)
             response.raise_for_status()
             return cls._parse_languages_payload(response.json())
         except Exception as exc:
@@ -204,7 +205,7 @@ class MetadataLoader(ABC):
         if not url:
             return {}
         try:
-            response = requests.get(url=url, headers=headers)
+            response = request_with_retry("get", url=url, headers=headers)
             response.raise_for_status()
             return cls._parse_language_stats_payload(response.json())
         except Exception as exc:
@@ -212,7 +213,200 @@ class MetadataLoader(ABC):
             return {}
 
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_API_URL = "https://api.github.com"
+# everything RepositoryMetadata needs, so a repository is loaded with one GraphQL request
+GITHUB_REPOSITORY_FIELDS = """
+fragment RepositoryFields on Repository {
+  name
+  nameWithOwner
+  owner { login url }
+  description
+  stargazerCount
+  forkCount
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  defaultBranchRef { name }
+  createdAt
+  updatedAt
+  pushedAt
+  diskUsage
+  url
+  sshUrl
+  primaryLanguage { name }
+  languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+  repositoryTopics(first: 100) { nodes { topic { name } } }
+  hasWikiEnabled
+  hasIssuesEnabled
+  hasProjectsEnabled
+  isPrivate
+  homepageUrl
+  licenseInfo { name key }
+}
+"""
+
+
 class GitHubMetadataLoader(MetadataLoader):
+    GRAPHQL_BATCH_SIZE = 20
+
+    @classmethod
+    def load_data(cls, repo_url: str) -> RepositoryMetadata:
+        """
+        Loads GitHub repository metadata with a single GraphQL request.
+
+        GraphQL requires a token, without it or if the request fails the REST API is used.
+        """
+        if cls._get_token():
+            try:
+                return cls._load_graphql_data(repo_url)
+            except Exception as exc:
+                logger.warning(f"GraphQL metadata request failed, falling back to the REST API: {exc}")
+        return super().load_data(repo_url)
+
+    @classmethod
+    def load_batch(cls, repo_urls: list[str], batch_size: int = None) -> dict[str, RepositoryMetadata]:
+        """
+        Loads metadata of many GitHub repositories, up to `batch_size` repositories per GraphQL request.
+
+        Args:
+            repo_urls: URLs of the GitHub repositories.
+            batch_size: Repositories per request. Defaults to GRAPHQL_BATCH_SIZE.
+
+        Returns:
+            dict[str, RepositoryMetadata]: Metadata by repository URL. Repositories that could not be loaded,
+            e.g. missing ones or malformed URLs, and all of them without a token are left out, the caller loads them
+            one by one.
+        """
+        if not cls._get_token():
+            return {}
+
+        # malformed URLs are left to the per-repository loading, which reports them for their repository only
+        repositories = []
+        for repo_url in repo_urls:
+            try:
+                owner, name = get_base_repo_url(repo_url).split("/", 1)
+            except ValueError as exc:
+                logger.warning(f"Skipping {repo_url} in the GraphQL batch: {exc}")
+                continue
+            repositories.append((repo_url, owner, name))
+
+        batch_size = batch_size or cls.GRAPHQL_BATCH_SIZE
+        result = {}
+        for start in range(0, len(repositories), batch_size):
+            batch = repositories[start : start + batch_size]
+            variables, selections = {}, []
+            for i, (_, owner, name) in enumerate(batch):
+                variables[f"owner{i}"], variables[f"name{i}"] = owner, name
+                selections.append(f"r{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...RepositoryFields }}")
+
+            arguments = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(len(batch)))
+            query = f"query({arguments}) {{ {' '.join(selections)} }}" + GITHUB_REPOSITORY_FIELDS
+            try:
+                data = cls._graphql_request(query, variables)
+            except Exception as exc:
+                logger.warning(f"GraphQL batch metadata request failed: {exc}")
+                continue
+
+            for i, (repo_url, _, _) in enumerate(batch):
+                if data.get(f"r{i}"):
+                    result[repo_url] = cls._parse_metadata(cls._graphql_to_rest(data[f"r{i}"]))
+
+        logger.info(f"Fetched GitHub metadata of {len(result)}/{len(repo_urls)} repositories with GraphQL")
+        return result
+
+    @classmethod
+    def _load_graphql_data(cls, repo_url: str) -> RepositoryMetadata:
+        base_url = get_base_repo_url(repo_url)
+        owner, name = base_url.split("/", 1)
+        query = (
+            "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { ...RepositoryFields } }"
+            + GITHUB_REPOSITORY_FIELDS
+        )
+        data = cls._graphql_request(query, {"owner": owner, "name": name})
+        if not data.get("repository"):
+            raise ValueError(f"Repository {base_url} not found")
+
+        logger.info(f"Successfully fetched GitHub metadata for repository: '{base_url}'")
+        return cls._parse_metadata(cls._graphql_to_rest(data["repository"]))
+
+    @classmethod
+    def _graphql_request(cls, query: str, variables: dict) -> dict:
+        """Sends a GraphQL query, errors of single repositories are logged and their data is null."""
+        headers = {"Authorization": f"bearer {cls._get_token()}"}
+        # queries do not change anything, so they are safe to retry
+        response = request_with_retry(
+            "post",
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=headers,
+            retry_on_write=True,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        for error in payload.get("errors") or []:
+            logger.warning(f"GraphQL error: {error.get('message')}")
+        if payload.get("data") is None:
+            raise ValueError("GraphQL response has no data")
+        return payload["data"]
+
+    @staticmethod
+    def _get_token() -> str:
+        return os.getenv("GIT_TOKEN", os.getenv("GITHUB_TOKEN", ""))
+
+    @staticmethod
+    def _graphql_to_rest(repository: dict) -> dict:
+        """Converts a GraphQL repository to the REST API shape read by _parse_metadata."""
+        full_name = repository["nameWithOwner"]
+        api_url = f"{GITHUB_API_URL}/repos/{full_name}"
+        owner = repository.get("owner") or {}
+        license_info = repository.get("licenseInfo")
+        language_stats = {
+            edge["node"]["name"]: edge["size"] for edge in (repository.get("languages") or {}).get("edges", [])
+        }
+
+        return {
+            "name": repository["name"],
+            "full_name": full_name,
+            "owner": {"login": owner.get("login", ""), "html_url": owner.get("url", "")},
+            "description": repository.get("description"),
+            "stargazers_count": repository.get("stargazerCount", 0),
+            "forks_count": repository.get("forkCount", 0),
+            # REST watchers_count is a legacy alias of the star count, the watchers of GraphQL are subscribers
+            "watchers_count": repository.get("stargazerCount", 0),
+            # the REST counter includes open pull requests
+            "open_issues_count": (repository.get("issues") or {}).get("totalCount", 0)
+            + (repository.get("pullRequests") or {}).get("totalCount", 0),
+            "default_branch": (repository.get("defaultBranchRef") or {}).get("name", ""),
+            "created_at": repository.get("createdAt", ""),
+            "updated_at": repository.get("updatedAt", ""),
+            "pushed_at": repository.get("pushedAt", ""),
+            "size": repository.get("diskUsage") or 0,
+            "clone_url": f"{repository['url']}.git",
+            "ssh_url": repository.get("sshUrl", ""),
+            "contributors_url": f"{api_url}/contributors",
+            "languages_url": f"{api_url}/languages",
+            "issues_url": f"{api_url}/issues",
+            "language": (repository.get("primaryLanguage") or {}).get("name"),
+            "languages": list(language_stats),
+            "language_stats": language_stats,
+            "topics": [node["topic"]["name"] for node in (repository.get("repositoryTopics") or {}).get("nodes", [])],
+            "has_wiki": repository.get("hasWikiEnabled", False),
+            "has_issues": repository.get("hasIssuesEnabled", False),
+            "has_projects": repository.get("hasProjectsEnabled", False),
+            "private": repository.get("isPrivate", False),
+            "homepage": repository.get("homepageUrl"),
+            "license": (
+                {
+                    "name": license_info["name"],
+                    "url": (
+                        f"{GITHUB_API_URL}/licenses/{license_info['key']}" if license_info["key"] != "other" else None
+                    ),
+                }
+                if license_info
+                else None
+            ),
+        }
+
     @classmethod
     def _load_platform_data(cls, repo_url: str, use_token: bool) -> RepositoryMetadata:
         """
@@ -320,23 +514,31 @@ LICENSE_NAMES = {"license", "copying", "license.md", "license.txt", "copying.md"
 
 
 class LocalMetadataLoader(MetadataLoader):
+    # metadata snapshots by repository path and HEAD commit, a repository is read once per commit
+    _snapshots: dict[tuple[str, str], RepositoryMetadata] = {}
+
     @classmethod
     def _load_platform_data(cls, repo_url: str, use_token: bool) -> RepositoryMetadata:
         cls.repo = Repo(repo_url)
         cls.repo_path = repo_url
 
+        snapshot_key = (os.path.realpath(repo_url), str(cls.repo.head.commit.hexsha))
+        if snapshot_key in cls._snapshots:
+            return copy.deepcopy(cls._snapshots[snapshot_key])
+
         basename = os.path.basename(repo_url)
         owner = cls._safe_git_config_value("user", "name", fallback=None)
         owner_email = cls._safe_git_config_value("user", "email", fallback="")
+        files = cls._list_files()
         dates = cls._load_dates()
-        size = cls._get_repository_size()
-        languages = cls._get_languages()
-        language_stats = cls._get_language_stats()
+        size = cls._get_repository_size(files)
+        language_stats = cls._get_language_stats(files)
+        languages = cls._get_languages(language_stats)
         remotes = cls._get_remotes()
         default_branch = cls._get_default_branch()
-        license_name = cls._find_license()
+        license_name = cls._find_license(files)
 
-        return RepositoryMetadata(
+        metadata = RepositoryMetadata(
             name=basename,
             full_name=basename,
             owner=owner,
@@ -368,6 +570,9 @@ class LocalMetadataLoader(MetadataLoader):
             license_name=license_name,
             license_url=None,
         )
+        # callers may change the lists of the metadata, so the snapshot shares none of them
+        cls._snapshots[snapshot_key] = copy.deepcopy(metadata)
+        return metadata
 
     @classmethod
     def _safe_git_config_value(cls, section: str, option: str, fallback: str | None) -> str | None:
@@ -377,11 +582,28 @@ class LocalMetadataLoader(MetadataLoader):
             return fallback
 
     @classmethod
-    def _find_license(cls) -> str | None:
-        files = [f for f in cls.repo.git.ls_files().split("\n") if "/" not in f]
+    def _list_files(cls) -> dict[str, int]:
+        """
+        Lists the files of the HEAD commit with their sizes in bytes.
+
+        The sizes are the blob sizes from one `git ls-tree` call, so no file is stat'ed or read.
+        Submodules are not included.
+        """
+        files = {}
+        for entry in cls.repo.git.ls_tree("-r", "-l", "-z", "HEAD").split("\0"):
+            if not entry:
+                continue
+            info, path = entry.split("\t", 1)
+            _, object_type, _, size = info.split()
+            if object_type == "blob":
+                files[path] = int(size)
+        return files
+
+    @classmethod
+    def _find_license(cls, files: dict[str, int]) -> str | None:
         license_file = None
         for f in files:
-            if f.lower() in LICENSE_NAMES:
+            if "/" not in f and f.lower() in LICENSE_NAMES:
                 license_file = f
                 break
 
@@ -403,8 +625,12 @@ class LocalMetadataLoader(MetadataLoader):
 
     @classmethod
     def _load_dates(cls) -> dict[str, str]:
-        first_commit_time = next(cls.repo.iter_commits(reverse=True, max_count=1)).committed_datetime
+        # a history may have several root commits, e.g. after merging unrelated histories
+        root_shas = cls.repo.git.rev_list("--max-parents=0", "HEAD").split()
         last_commit_time = cls.repo.head.commit.committed_datetime
+        first_commit_time = min(
+            (cls.repo.commit(sha).committed_datetime for sha in root_shas), default=last_commit_time
+        )
         time_format = "%Y-%m-%dT%H:%M:%SZ"
 
         return {
@@ -414,48 +640,25 @@ class LocalMetadataLoader(MetadataLoader):
         }
 
     @classmethod
-    def _get_repository_size(cls) -> int:
-        total_bytes = 0
-
-        files = cls.repo.git.ls_files().split("\n")
-
-        for file_path in files:
-            full_path = os.path.join(cls.repo_path, file_path)
-            if os.path.exists(full_path):
-                total_bytes += os.path.getsize(full_path)
-
-        return round(total_bytes / 1024)
+    def _get_repository_size(cls, files: dict[str, int]) -> int:
+        return round(sum(files.values()) / 1024)
 
     @classmethod
-    def _get_languages(cls) -> list[str]:
-        weights = cls._get_language_weights()
-        return sorted(weights, key=weights.get, reverse=True)
+    def _get_languages(cls, language_stats: dict[str, float]) -> list[str]:
+        return sorted(language_stats, key=language_stats.get, reverse=True)
 
     @classmethod
-    def _get_language_stats(cls) -> dict[str, float]:
-        weights = cls._get_language_weights()
-        return {language: float(weight) for language, weight in weights.items()}
-
-    @classmethod
-    def _get_language_weights(cls) -> Counter:
-        files = cls.repo.git.ls_files().split("\n")
+    def _get_language_stats(cls, files: dict[str, int]) -> dict[str, float]:
         weights = Counter()
 
-        for f in files:
-            if not f:
-                continue
-
-            abs_path = os.path.join(cls.repo_path, f)
-            if not os.path.isfile(abs_path):
-                continue
-
+        for f, size in files.items():
             name = os.path.basename(f).lower()
             ext = os.path.splitext(name)[1].lower()
             lang = FILE_MAP.get(name) or EXT_MAP.get(ext)
 
             if not lang and not ext:
                 try:
-                    with open(abs_path, "r", encoding="utf-8", errors="ignore") as file_obj:
+                    with open(os.path.join(cls.repo_path, f), "r", encoding="utf-8", errors="ignore") as file_obj:
                         first_line = file_obj.readline(200)
                     if first_line.startswith("#!") and "python" in first_line.lower():
                         lang = "Python"
@@ -463,9 +666,9 @@ class LocalMetadataLoader(MetadataLoader):
                     pass
 
             if lang:
-                weights[lang] += os.path.getsize(abs_path)
+                weights[lang] += size
 
-        return weights
+        return {language: float(weight) for language, weight in weights.items()}
 
     @classmethod
     def _get_remotes(cls) -> dict[str, str]:
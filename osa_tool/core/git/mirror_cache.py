@@ -0,0 +1,139 @@
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+from git import GitCommandError, Repo
+
+from osa_tool.utils.logger import logger
+from osa_tool.utils.utils import _remove_tree, file_lock
+
+# every branch and tag of the remote, fetched into the same refs of the bare mirror
+MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+LAST_USED_FILE = "osa-last-used"
+
+
+class MirrorCache:
+    """
+    Local cache of bare mirrors of remote repositories, shared by runs and processes.
+
+    A mirror is keyed by the remote URL and updated with an incremental `git fetch`, so a repeated run downloads
+    only the new objects. Working copies are cloned from the mirror locally: git hardlinks the object files
+    instead of copying them, so a clone is near-instant and takes little extra disk. Unlike `--reference`
+    alternates, such clones do not depend on the mirror and stay valid after it is evicted.
+
+    The total size of the mirrors is kept under the quota by evicting the least recently used ones.
+    Each mirror is locked while it is fetched or cloned, so concurrent processes do not corrupt or evict it.
+    """
+
+    def __init__(self, root: str | Path, quota_mb: int = 5120):
+        """
+        Args:
+            root: The directory of the mirrors.
+            quota_mb: The total size of the mirrors in megabytes, the least recently used mirrors above it are
+                evicted. Mirrors are not evicted if it is 0.
+        """
+        self.root = Path(root).expanduser()
+        self.quota_bytes = max(quota_mb, 0) * 1024 * 1024
+
+    def mirror_path(self, repo_url: str) -> Path:
+        """Returns the mirror directory of the remote, URLs differing only in a ".git" suffix share it."""
+        normalized = repo_url.strip().rstrip("/").removesuffix(".git").lower()
+        name = normalized.rsplit("/", 1)[-1] or "repository"
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+        return self.root / f"{name}-{digest}.git"
+
+    @contextmanager
+    def mirror(self, repo_url: str, fetch_urls: List[str]) -> Iterator[Path]:
+        """
+        Creates or updates the mirror of the remote and holds its lock while the block clones from it.
+
+        The mirror is fetched from the first URL that works, e.g. an unauthenticated URL and then one with a token.
+        The URLs are not stored in the mirror, so tokens are not written to disk.
+
+        Args:
+            repo_url: The remote URL the mirror is keyed by.
+            fetch_urls: URLs to fetch the mirror from, tried in order.
+
+        Yields:
+            Path: The directory of the bare mirror.
+
+        Raises:
+            GitCommandError: If the mirror could not be fetched from any of the URLs.
+        """
+        path = self.mirror_path(repo_url)
+        with file_lock(self._lock_path(path)):
+            self._fetch(path, repo_url, fetch_urls)
+            (path / LAST_USED_FILE).write_text(str(time.time()), encoding="utf-8")
+            yield path
+
+        self.evict(keep=path)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Removes the least recently used mirrors until the cache fits the quota, `keep` is never removed."""
+        if not self.quota_bytes or not self.root.is_dir():
+            return
+
+        mirrors = [(self._last_used(path), path, _directory_size(path)) for path in self.root.glob("*.git")]
+        total = sum(size for _, _, size in mirrors)
+
+        for _, path, size in sorted(mirrors, key=lambda mirror: mirror[0]):
+            if total <= self.quota_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+
+            with file_lock(self._lock_path(path)):
+                if not path.exists():
+                    continue
+                logger.info(f"Evicting repository mirror {path} ({size // (1024 * 1024)} MB) from the cache")
+                _remove_tree(path)
+            total -= size
+
+    def _fetch(self, path: Path, repo_url: str, fetch_urls: List[str]) -> None:
+        if path.exists():
+            logger.info(f"Updating the cached mirror of {repo_url}...")
+            repo = Repo(path)
+        else:
+            logger.info(f"Creating a cached mirror of {repo_url} in {path}...")
+            repo = Repo.init(path, bare=True, mkdir=True)
+
+        error = None
+        for url in fetch_urls:
+            try:
+                with repo.git.custom_environment(GIT_TERMINAL_PROMPT="0"):
+                    repo.git.fetch("--prune", "--force", url, *MIRROR_REFSPECS)
+                return
+            except GitCommandError as e:
+                error = e
+
+        # a mirror that was never fetched is not kept
+        if not any(path.joinpath("refs", "heads").iterdir()):
+            _remove_tree(path)
+        if error is not None:
+            raise error
+        raise ValueError(f"No URL to fetch {repo_url} from")
+
+    def _lock_path(self, path: Path) -> Path:
+        return path.with_name(path.name + ".lock")
+
+    @staticmethod
+    def _last_used(path: Path) -> float:
+        try:
+            return float((path / LAST_USED_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # mirrors without the marker are evicted first
+            return 0.0
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                pass
+    return total
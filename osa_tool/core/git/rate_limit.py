@@ -0,0 +1,179 @@
+"""Rate-limit budget of git-host APIs, shared by the requests of one or several processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Mapping
+from urllib.parse import urlsplit
+
+from osa_tool.utils.logger import logger
+from osa_tool.utils.utils import file_lock
+
+# GitHub and Gitverse send the X- prefixed headers, GitLab the plain ones
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+LIMIT_HEADERS = ("X-RateLimit-Limit", "RateLimit-Limit")
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+
+class RateLimitDeferred(Exception):
+    """A low-priority request was not sent to keep the rest of the rate-limit budget for the main work."""
+
+
+class RateLimitLedger:
+    """
+    Rate-limit budgets of git-host APIs, updated from the rate-limit headers of the responses.
+
+    A budget is kept per host, API resource (core, graphql, search) and token. Requests are paced once the
+    remaining budget drops below `pacing_fraction` of the limit: every request takes the next time slot, so the
+    rest of the budget is spread evenly until the reset instead of running out and stalling. Low-priority
+    requests are deferred when less than `low_priority_fraction` of the limit remains.
+
+    With a path the ledger is a JSON file guarded by a file lock, so the worker processes of the multi-repo
+    runner share one budget. Without it the ledger is kept in memory.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        pacing_fraction: float = 0.2,
+        low_priority_fraction: float = 0.1,
+        max_wait: float = 900.0,
+    ):
+        """
+        Args:
+            path: The ledger file shared by processes. The ledger is kept in memory if None.
+            pacing_fraction: Part of the limit below which requests are paced.
+            low_priority_fraction: Part of the limit below which low-priority requests are deferred.
+            max_wait: The longest wait for a time slot in seconds, a longer one is not waited for.
+        """
+        self.path = Path(path) if path else None
+        self.pacing_fraction = pacing_fraction
+        self.low_priority_fraction = low_priority_fraction
+        self.max_wait = max_wait
+        self._budgets: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str, headers: Mapping | None = None, priority: str = "normal") -> float:
+        """
+        Takes a request from the budget of the URL.
+
+        Returns:
+            float: Seconds to wait before sending the request, 0 if the budget is not low or not known yet.
+
+        Raises:
+            RateLimitDeferred: If the request is low-priority and the budget is low.
+        """
+        key = self._key(url, headers)
+        now = time.time()
+        with self._transaction() as budgets:
+            budget = budgets.get(key)
+            if not budget or budget["reset"] <= now:
+                budgets.pop(key, None)
+                return 0.0
+
+            limit, remaining = max(budget["limit"], 1), budget["remaining"]
+            if priority == "low" and remaining < limit * self.low_priority_fraction:
+                raise RateLimitDeferred(f"{remaining}/{limit} requests left until the rate limit reset of {key}")
+            if remaining >= limit * self.pacing_fraction:
+                budget["remaining"] = remaining - 1
+                return 0.0
+
+            # the budget is spread evenly over the time left until the reset
+            interval = (budget["reset"] - now) / max(remaining, 1)
+            slot = max(now, budget.get("next_slot", now))
+            if remaining <= 0:
+                slot = max(slot, budget["reset"])
+            budget["next_slot"] = slot + interval
+            budget["remaining"] = remaining - 1
+
+        delay = slot - now
+        if delay > self.max_wait:
+            logger.warning(f"Rate limit of {key} resets in {delay:.0f}s, not waiting for it")
+            return 0.0
+        return delay
+
+    def update(self, url: str, headers: Mapping | None, response_headers: Mapping) -> None:
+        """Updates the budget of the URL from the rate-limit headers of its response, if there are any."""
+        remaining = _int_header(response_headers, REMAINING_HEADERS)
+        reset = _int_header(response_headers, RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+
+        limit = _int_header(response_headers, LIMIT_HEADERS)
+        # GitLab sends the reset time as an epoch, some hosts the seconds until the reset
+        if reset < 10**9:
+            reset += int(time.time())
+
+        key = self._key(url, headers)
+        with self._transaction() as budgets:
+            budget = budgets.get(key)
+            if budget and budget["reset"] == reset:
+                # requests of other processes may have been taken from the budget since the response was sent
+                budget["remaining"] = min(budget["remaining"], remaining)
+                budget["limit"] = limit or budget["limit"]
+            else:
+                budgets[key] = {"limit": limit or remaining, "remaining": remaining, "reset": reset}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[dict[str, dict]]:
+        with self._lock:
+            if self.path is None:
+                yield self._budgets
+                return
+
+            with file_lock(self.path.with_name(self.path.name + ".lock")):
+                budgets = self._load()
+                yield budgets
+                self._save(budgets)
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable rate-limit ledger {self.path}: {e}")
+            return {}
+
+    def _save(self, budgets: dict[str, dict]) -> None:
+        now = time.time()
+        budgets = {key: budget for key, budget in budgets.items() if budget["reset"] > now}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, mode="w", encoding="utf-8") as f:
+            json.dump(budgets, f)
+
+    @staticmethod
+    def _key(url: str, headers: Mapping | None) -> str:
+        parts = urlsplit(url)
+        if parts.path.rstrip("/").endswith("/graphql"):
+            resource = "graphql"
+        elif "/search/" in parts.path:
+            resource = "search"
+        else:
+            resource = "core"
+
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        token = headers.get("authorization") or headers.get("private-token")
+        # the budget belongs to the token, which is not stored itself
+        identity = hashlib.sha256(str(token).encode("utf-8")).hexdigest()[:12] if token else "anonymous"
+        return f"{parts.netloc.lower()}/{resource}/{identity}"
+
+
+def _int_header(headers: Mapping, names: tuple[str, ...]) -> int | None:
+    for name in names:
+        try:
+            value = headers.get(name)
+        except AttributeError:
+            return None
+        if isinstance(value, (str, int)):
+            try:
+                return int(float(value))
+            except ValueError:
+                continue
+    return None
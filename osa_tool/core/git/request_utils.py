@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import os
 import random
+import threading
 import time
 from datetime import datetime
 from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 
 import requests
 from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
+from requests.adapters import HTTPAdapter
 
+from osa_tool.core.git.http_cache import HttpCache
+from osa_tool.core.git.rate_limit import RateLimitLedger
 from osa_tool.utils.logger import logger
 
 RETRYABLE_STATUS = {500, 502, 503, 504}
 RATE_LIMIT_STATUS = {429}
 RETRYABLE_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
 IDEMPOTENT_METHODS = {"get", "head", "options", "put", "delete"}
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_pid = os.getpid()
+_sessions_lock = threading.Lock()
+_http_cache: HttpCache | None = None
+_rate_limiter = RateLimitLedger()
 
 
 class RetryConfig(BaseModel):
@@ -35,6 +49,53 @@ class RetryConfig(BaseModel):
 DEFAULT_RETRY_CONFIG = RetryConfig()
 
 
+def get_session(url: str) -> requests.Session:
+    """Return the shared keep-alive session of the URL's host, created on first use.
+
+    Requests to the same git host reuse pooled connections instead of opening a new
+    TCP and TLS connection per call. Retries stay in ``request_with_retry``, so the
+    adapters do not retry on their own. A forked worker process starts with new
+    sessions, pooled sockets are never shared between processes.
+    """
+    global _sessions_pid
+
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}".lower()
+    with _sessions_lock:
+        if _sessions_pid != os.getpid():
+            _sessions.clear()
+            _sessions_pid = os.getpid()
+
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def close_sessions() -> None:
+    """Close the pooled connections of all shared sessions."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def set_http_cache(cache: HttpCache | None) -> None:
+    """Enable the conditional-request cache for GET requests of ``request_with_retry``, None disables it."""
+    global _http_cache
+    _http_cache = cache
+
+
+def set_rate_limiter(ledger: RateLimitLedger) -> None:
+    """Replace the rate-limit ledger, e.g. with a file-backed one shared by worker processes."""
+    global _rate_limiter
+    _rate_limiter = ledger
+
+
 def _is_rate_limited(response: requests.Response) -> bool:
     if response.status_code in RATE_LIMIT_STATUS:
         return True
@@ -67,6 +128,7 @@ def request_with_retry(
     *,
     retry_on_write: bool = False,
     config: RetryConfig | None = None,
+    priority: str = "normal",
     **request_kwargs,
 ) -> requests.Response:
     """Perform an HTTP request, retrying transient failures with exponential backoff.
@@ -75,13 +137,23 @@ def request_with_retry(
     5xx responses and timeouts are retried only for idempotent methods or when
     ``retry_on_write`` is set. The ``Retry-After`` header overrides the computed delay.
     The final response is returned unchanged, so the caller's existing status handling
-    still runs once retries are exhausted.
+    still runs once retries are exhausted. Connections are reused through the host's
+    shared session, see ``get_session``.
+
+    When an HTTP cache is set with ``set_http_cache``, GET responses are served from it
+    while fresh and revalidated with If-None-Match / If-Modified-Since afterwards; a 304
+    answer is returned to the caller as the cached 200 response.
+
+    Every attempt takes a request from the host's rate-limit budget, see
+    ``RateLimitLedger``: requests are paced when the budget runs low, and low-priority
+    requests are not sent at all then.
 
     Args:
         method (str): HTTP method, e.g. "get", "post", "put", "patch".
         url (str): Target URL.
         retry_on_write (bool): Allow retrying 5xx/timeout for non-idempotent methods.
         config (RetryConfig | None): Retry tunables; defaults to ``DEFAULT_RETRY_CONFIG``.
+        priority (str): "low" for optional requests like starring, deferred on a low budget.
         **request_kwargs: Forwarded to the request (headers, json, params, timeout).
 
     Returns:
@@ -89,16 +161,47 @@ def request_with_retry(
 
     Raises:
         requests.RequestException: If the final attempt raises a transport error.
+        RateLimitDeferred: If a low-priority request is not sent because the budget is low.
     """
     config = config or DEFAULT_RETRY_CONFIG
     request_kwargs.setdefault("timeout", config.request_timeout)
     write_allowed = retry_on_write or method.lower() in IDEMPOTENT_METHODS
 
+    cache = _http_cache if method.lower() == "get" else None
+    if cache is None:
+        return _send(method, url, config, write_allowed, priority, request_kwargs)
+
+    key = cache.key(url, request_kwargs.get("headers"), request_kwargs.get("params"))
+    cached = cache.get(key)
+    if cached is not None and cache.is_fresh(cached):
+        cache.hits += 1
+        return cached.to_response()
+    if cached is not None:
+        request_kwargs["headers"] = {**(request_kwargs.get("headers") or {}), **cached.conditional_headers()}
+
+    response = _send(method, url, config, write_allowed, priority, request_kwargs)
+    if cached is not None and response.status_code == 304:
+        cache.revalidated += 1
+        cache.refresh(key, cached, response)
+        return cached.to_response()
+    cache.store(key, response)
+    return response
+
+
+def _send(
+    method: str, url: str, config: RetryConfig, write_allowed: bool, priority: str, request_kwargs: dict
+) -> requests.Response:
+    session = get_session(url)
     slept = 0.0
     response: requests.Response | None = None
     for attempt in range(1, config.max_attempts + 1):
+        wait = _rate_limiter.acquire(url, request_kwargs.get("headers"), priority)
+        if wait > 0:
+            logger.info(f"Rate limit budget of {urlsplit(url).netloc} is low, pacing the request by {wait:.1f}s")
+            time.sleep(wait)
+
         try:
-            response = getattr(requests, method.lower())(url, **request_kwargs)
+            response = getattr(session, method.lower())(url, **request_kwargs)
         except RETRYABLE_EXCEPTIONS as exc:
             ambiguous = isinstance(exc, requests.Timeout)
             if attempt == config.max_attempts or (ambiguous and not write_allowed):
@@ -114,6 +217,7 @@ def request_with_retry(
             slept += delay
             continue
 
+        _rate_limiter.update(url, request_kwargs.get("headers"), response.headers)
         rate_limited = _is_rate_limited(response)
         server_error = response.status_code in RETRYABLE_STATUS
         if not rate_limited and not (server_error and write_allowed):
@@ -610,17 +610,14 @@ class ProtollmHandler(ModelHandler):
             **self._get_llm_params(),
         )
 
-    def _limit_tokens(
-        self,
-        text: str,
-        safety_buffer: int = 100,
-        mode: str = "middle-out",
-        reserved_tokens: int = 0,
-    ) -> str:
+    def available_input_tokens(self, safety_buffer: int = 100, reserved_tokens: int = 0) -> int:
         """
-        Limits text to fit within the model's context window.
+        Returns the number of user prompt tokens that fit into the model's context window.
 
-        Calculates: Available Input = Total Context - Max Output - Safety Buffer
+        Calculates: Available Input = Total Context - Max Output - Safety Buffer - Reserved Tokens
+
+        Raises:
+            ValueError: If the configured context window leaves no room for the input.
         """
         max_input_tokens = (
             self.model_settings.context_window - self.model_settings.max_tokens - safety_buffer - reserved_tokens
@@ -632,6 +629,21 @@ class ProtollmHandler(ModelHandler):
                 f"({self.model_settings.max_tokens}) + system tokens ({reserved_tokens}) "
                 f"+ safety buffer ({safety_buffer}). Reduce max_tokens or increase context_window."
             )
+        return max_input_tokens
+
+    def _limit_tokens(
+        self,
+        text: str,
+        safety_buffer: int = 100,
+        mode: str = "middle-out",
+        reserved_tokens: int = 0,
+    ) -> str:
+        """
+        Limits text to fit within the model's context window.
+
+        Calculates: Available Input = Total Context - Max Output - Safety Buffer
+        """
+        max_input_tokens = self.available_input_tokens(safety_buffer=safety_buffer, reserved_tokens=reserved_tokens)
 
         input_tokens = count_tokens(text, self.model_settings.encoder)
         if input_tokens <= max_input_tokens:
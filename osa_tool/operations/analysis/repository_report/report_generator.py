@@ -26,10 +26,12 @@ from osa_tool.utils.utils import extract_readme_content, resolve_repo_path
 
 
 class TextGenerator:
-    def __init__(self, config_manager: ConfigManager, metadata: RepositoryMetadata):
+    def __init__(
+        self, config_manager: ConfigManager, metadata: RepositoryMetadata, sourcerank: SourceRank | None = None
+    ):
         self.config_manager = config_manager
         self.model_settings = self.config_manager.get_model_settings("general")
-        self.sourcerank = SourceRank(self.config_manager)
+        self.sourcerank = sourcerank or SourceRank(self.config_manager)
         self.prompts = self.config_manager.get_prompts()
         self.metadata = metadata
         self.model_handler: ModelHandler = ModelHandlerFactory.build(self.model_settings)
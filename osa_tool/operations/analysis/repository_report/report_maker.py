@@ -37,8 +37,14 @@ from osa_tool.utils.utils import osa_project_root
 
 
 class AbstractReportGenerator(ABC):
-    def __init__(self, config_manager: ConfigManager, git_agent: GitAgent, run_scorecard: bool = False):
-        self.sourcerank = SourceRank(config_manager)
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        git_agent: GitAgent,
+        run_scorecard: bool = False,
+        sourcerank: SourceRank | None = None,
+    ):
+        self.sourcerank = sourcerank or SourceRank(config_manager)
         self.git_agent = git_agent
         self.metadata = self.git_agent.metadata
         self.repo_url = config_manager.get_git_settings().repository
@@ -412,8 +418,11 @@ class ReportGenerator(AbstractReportGenerator):
     def __init__(
         self, config_manager: ConfigManager, git_agent: GitAgent, create_fork: bool, run_scorecard: bool = False
     ):
-        super().__init__(config_manager, git_agent, run_scorecard)
-        self.text_generator = TextGenerator(config_manager, self.metadata)
+        # the report describes the analyzed commit, its tree is read from git objects instead of the checkout
+        with git_agent.content_provider() as provider:
+            sourcerank = SourceRank(config_manager, provider)
+        super().__init__(config_manager, git_agent, run_scorecard, sourcerank)
+        self.text_generator = TextGenerator(config_manager, self.metadata, sourcerank=self.sourcerank)
         self.create_fork = create_fork
         self.events: list[OperationEvent] = []
 
@@ -21,6 +21,7 @@ _REQUIRE_RE = re.compile(r"^(requirements\.txt|pyproject\.toml)$", re.IGNORECASE
 _TEST_DIR_RE = re.compile(r"^(tests?|__tests__|spec|specs|e2e)$", re.IGNORECASE)
 
 README_MIN_CHARS = 200
+MIN_COMMITS = 5
 APP_TYPES = {"app"}
 DATA_TYPES = {"algorithm_experiments", "model_training_experiments"}
 EXPERIMENT_TYPES = {"algorithm_experiments", "model_training_experiments"}
@@ -225,8 +226,8 @@ class VkrChecker:
         return {"applicable": True, "present": bool(verified), "files": verified}
 
     def check_commits(self) -> dict:
-        count = self._commit_count(threshold=5)
-        return {"present": count >= 5, "count": count}
+        count = self._commit_count(threshold=MIN_COMMITS)
+        return {"present": count >= MIN_COMMITS, "count": count}
 
     def check_syntax(self, flat_paths: list) -> dict:
         py_files = [p for p in flat_paths if p.endswith(".py")]
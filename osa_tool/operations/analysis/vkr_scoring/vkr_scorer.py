@@ -24,7 +24,7 @@ from osa_tool.core.git.git_agent import GitAgent
 from osa_tool.core.llm.llm import ModelHandlerFactory
 from osa_tool.utils.logger import logger
 
-from .checks import VkrChecker, VkrConfig, build_file_tree
+from .checks import MIN_COMMITS, VkrChecker, VkrConfig, build_file_tree
 from .claims import ClaimsPipeline
 from .scoring_engine import ScoringEngine
 
@@ -49,6 +49,9 @@ class VkrScorer:
         model_settings = config_manager.get_model_settings("validation")
         model_handler = ModelHandlerFactory.build(model_settings)
 
+        # the commits check counts one commit over the minimum, a shallow clone is deepened just enough
+        git_agent.ensure_history(depth=MIN_COMMITS + 1)
+
         self._vkr_config = VkrConfig(
             clone_dir=git_agent.clone_dir,
             repo_url=str(config_manager.config.git.repository),
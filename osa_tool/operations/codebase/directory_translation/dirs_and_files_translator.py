@@ -2,6 +2,7 @@ import os
 import re
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.core.llm.llm import ModelHandler, ModelHandlerFactory
 from osa_tool.core.models.event import OperationEvent, EventKind
 from osa_tool.utils.logger import logger
@@ -98,6 +99,7 @@ class RepositoryStructureTranslator:
                     new_name = rename_map[old_name]
                     new_path = os.path.join(os.path.dirname(old_path), new_name)
                     os.rename(old_path, new_path)
+                    track_changes(old_path, new_path)
                     renamed += 1
                     logger.info(f'Renamed: "{old_name}" → "{new_name}"')
         except Exception as e:
@@ -119,6 +121,7 @@ class RepositoryStructureTranslator:
         try:
             for old_path, new_path in rename_map.items():
                 os.rename(old_path, new_path)
+                track_changes(old_path, new_path)
                 renamed += 1
                 _, old_name = os.path.split(os.path.basename(old_path))
                 _, new_name = os.path.split(os.path.basename(new_path))
@@ -327,6 +330,7 @@ class RepositoryStructureTranslator:
             if updated_content != content:
                 with open(file_path, "w", encoding="utf-8") as f:
                     f.write(updated_content)
+                track_changes(file_path)
                 logger.info(f"Updated imports and paths in: {file_path}")
         except Exception as e:
             logger.error(f"Failed to update {file_path}", repr(e), exc_info=True)
@@ -4,11 +4,25 @@ from abc import ABC, abstractmethod
 class LanguageAdapter(ABC):
 
     EXTENSIONS = ()
+    # node types collected by the single-pass extraction of OSA_TreeSitter
+    CALL_TYPES = ()
+    IMPORT_TYPES = ()
+    # field of a function node that holds its body, calls are attributed to the function only inside it
+    BODY_FIELD = "body"
+
+    # parsers are built once per process and language, worker processes warm this cache up
+    _parsers: dict = {}
 
     @abstractmethod
     def build_parser(self):
         pass
 
+    def get_parser(self):
+        parser = LanguageAdapter._parsers.get(type(self))
+        if parser is None:
+            parser = LanguageAdapter._parsers[type(self)] = self.build_parser()
+        return parser
+
     @abstractmethod
     def is_class(self, node) -> bool:
         pass
@@ -38,9 +52,10 @@ class LanguageAdapter(ABC):
         pass
 
     @abstractmethod
-    def extract_imports(self, root, source_view, cwd):
+    def extract_imports(self, nodes, source_view, modules, filename):
+        """Resolves the top-level nodes of IMPORT_TYPES of a file against the ModuleIndex of the repository."""
         pass
 
-    @abstractmethod
-    def resolve_method_calls(self, node, source_view):
-        pass
+    def get_call_target(self, node, source_view):
+        """Returns the called expression of a node of CALL_TYPES."""
+        return None
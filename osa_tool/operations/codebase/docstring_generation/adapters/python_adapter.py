@@ -1,5 +1,3 @@
-import os
-
 import tree_sitter_python as tspython
 from tree_sitter import Parser, Language
 from osa_tool.operations.codebase.docstring_generation.adapters.base import LanguageAdapter
@@ -8,6 +6,8 @@ from osa_tool.operations.codebase.docstring_generation.adapters.base import Lang
 class PythonAdapter(LanguageAdapter):
 
     EXTENSIONS = (".py",)
+    CALL_TYPES = ("call",)
+    IMPORT_TYPES = ("import_statement", "import_from_statement")
 
     def build_parser(self):
         return Parser(Language(tspython.language()))
@@ -69,16 +69,15 @@ class PythonAdapter(LanguageAdapter):
 
         return params
 
-    def extract_imports(self, root, sv, cwd):
+    def extract_imports(self, nodes, sv, modules, filename):
         import_map = {}
-        for node in root.children:
-            if node.type in ("import_statement", "import_from_statement"):
-                import_map.update(self._resolve_import_path(sv.text(node), cwd))
+        for node in nodes:
+            import_map.update(self._resolve_import_path(sv.text(node), modules, filename))
 
         return import_map
 
     @staticmethod
-    def _resolve_import_path(import_text, cwd):
+    def _resolve_import_path(import_text, modules, filename=None):
         import_mapping = {}
         text = import_text.strip()
 
@@ -88,9 +87,10 @@ class PythonAdapter(LanguageAdapter):
             except ValueError:
                 return import_mapping
 
-            module_name = from_part.replace("from", "").strip()
-            module_path = os.path.join(cwd, *module_name.split(".")) + ".py"
-            if not os.path.exists(module_path):
+            # relative imports are resolved against the package of the importing file
+            module_name = modules.absolute_name(filename, from_part.replace("from", "").strip())
+            module_path = modules.module_file(module_name) if module_name else None
+            if module_path is None:
                 return import_mapping
 
             for entity in (e.strip() for e in import_part.split(",")):
@@ -114,31 +114,12 @@ class PythonAdapter(LanguageAdapter):
             else:
                 module_name = alias_name = parts[0]
 
-            module_path = os.path.join(cwd, *module_name.split(".")) + ".py"
-            if os.path.exists(module_path):
+            module_path = modules.module_file(module_name)
+            if module_path is not None:
                 import_mapping[alias_name] = {"module": module_name, "path": module_path}
 
         return import_mapping
 
-    def resolve_method_calls(self, node, sv):
-        block = next((c for c in node.children if c.type == "block"), None)
-        if not block:
-            return []
-
-        calls = set()
-
-        def walk(n):
-            if n.type == "function_definition" and n is not node:
-                return
-            if n.type == "call":
-                target = n.child_by_field_name("function")
-                if target:
-                    text = sv.text(target).strip()
-                    if text:
-                        calls.add(text)
-            for c in n.children:
-                walk(c)
-
-        walk(block)
-
-        return sorted(calls)
+    def get_call_target(self, node, sv):
+        target = node.child_by_field_name("function")
+        return sv.text(target).strip() if target else None
@@ -126,12 +126,9 @@ class TypeScriptAdapter(LanguageAdapter):
 
         return params
 
-    def extract_imports(self, root, sv, cwd):
+    def extract_imports(self, nodes, sv, modules, filename):
         return {}
 
-    def resolve_method_calls(self, node, sv):
-        return []
-
 
 class TSXAdapter(TypeScriptAdapter):
 
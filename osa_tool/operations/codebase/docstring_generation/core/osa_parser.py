@@ -2,10 +2,12 @@ import os
 from pathlib import Path
 
 from osa_tool.operations.codebase.docstring_generation.core.source_view import SourceView
+from osa_tool.operations.codebase.docstring_generation.core.symbols import FunctionSymbol
 
 from osa_tool.operations.codebase.docstring_generation.adapters.python_adapter import PythonAdapter
 from osa_tool.operations.codebase.docstring_generation.adapters.javascript_adapter import JavaScriptAdapter
 from osa_tool.operations.codebase.docstring_generation.adapters.typescript_adapter import TypeScriptAdapter, TSXAdapter
+from osa_tool.utils.module_index import ModuleIndex
 
 
 class OSA_TreeSitter:
@@ -22,6 +24,7 @@ class OSA_TreeSitter:
         self.cwd = scripts_path
         self.ignore_list = ignore_list or ["__init__.py"]
         self.target_files = target_files
+        self._module_index = None
 
     def files_list(self, path: str):
         exts = tuple(ext for a in self.ADAPTERS for ext in a.EXTENSIONS)
@@ -46,6 +49,13 @@ class OSA_TreeSitter:
 
         return [], 0
 
+    @property
+    def module_index(self) -> ModuleIndex:
+        """Index of the modules under the scripts path, imports are resolved against it without probing the disk."""
+        if self._module_index is None:
+            self._module_index = ModuleIndex.build(self.cwd)
+        return self._module_index
+
     def _get_adapter(self, filename):
         for adapter in self.ADAPTERS:
             if filename.endswith(adapter.EXTENSIONS):
@@ -61,101 +71,152 @@ class OSA_TreeSitter:
                 "imports": {},
             }
 
-        parser = adapter.build_parser()
-        source = self.open_file(filename)
-        sv = SourceView(source)
-        tree = parser.parse(source.encode())
+        parser = adapter.get_parser()
+        sv = SourceView(self.read_bytes(filename))
+        tree = parser.parse(sv.bytes)
         root = tree.root_node
 
-        imports = adapter.extract_imports(root, sv, self.cwd)
+        structure = []
+        import_nodes = []
+        self._collect_symbols(adapter, root, sv, filename, structure, import_nodes)
 
-        result = {
-            "structure": [],
-            "imports": imports,
+        return {
+            "structure": structure,
+            "imports": adapter.extract_imports(import_nodes, sv, self.module_index, filename),
         }
 
-        def walk(node, class_ctx=None):
-            if adapter.is_class(node):
-                class_name = adapter.get_name(node, sv)
+    @staticmethod
+    def _collect_symbols(adapter, root, sv: SourceView, filename: str, structure: list, import_nodes: list) -> None:
+        """
+        Collects classes, functions with their calls and top-level imports in a single pass over the tree.
+
+        The tree is walked with a TreeCursor instead of recursion, so deeply nested generated code does not hit
+        the recursion limit. A call is attributed to the innermost function whose body contains it. Functions are
+        added when they are entered, classes when they are left, in the order of the former recursive walk.
+        """
+        cursor = root.walk()
+        # per entered node: (enclosing class, calls of the enclosing function body, the node's own symbol, its calls)
+        stack = [(None, None, None, None)]
+
+        while True:
+            node = cursor.node
+            class_ctx, scope, _, own_calls = stack[-1]
+            if own_calls is not None:
+                # only the body of a function belongs to it, not its parameters or return annotation
+                scope = own_calls if cursor.field_name == adapter.BODY_FIELD else None
+
+            if scope is not None and node.type in adapter.CALL_TYPES:
+                target = adapter.get_call_target(node, sv)
+                if target:
+                    scope.add(target)
+
+            frame = (class_ctx, scope, None, None)
+            if len(stack) == 2 and node.type in adapter.IMPORT_TYPES:
+                import_nodes.append(node)
+            elif adapter.is_class(node):
                 cls = {
                     "type": "class",
-                    "name": class_name,
+                    "name": adapter.get_name(node, sv),
                     "docstring": adapter.get_docstring(node, sv),
                     "start_line": node.start_point[0] + 1,
                     "methods": [],
                     "attributes": adapter.get_attributes(node, sv),
                     "decorators": adapter.get_decorators(node, sv),
                 }
-
-                for c in node.children:
-                    walk(c, cls)
-
-                result["structure"].append(cls)
-
-                return
-
-            if adapter.is_function(node):
-                fn = {
-                    "class_name": (class_ctx["name"] if class_ctx else None),
-                    "method_name": adapter.get_name(node, sv),
-                    "arguments": adapter.get_parameters(node, sv),
-                    "docstring": adapter.get_docstring(node, sv),
-                    "start_line": node.start_point[0] + 1,
-                    "source_code": sv.text(node),
-                    "method_calls": adapter.resolve_method_calls(node, sv),
-                    "decorators": adapter.get_decorators(node, sv),
-                }
+                frame = (cls, scope, cls, None)
+            elif adapter.is_function(node):
+                fn = FunctionSymbol(
+                    method_name=adapter.get_name(node, sv),
+                    class_name=(class_ctx["name"] if class_ctx else None),
+                    arguments=adapter.get_parameters(node, sv),
+                    docstring=adapter.get_docstring(node, sv),
+                    start_line=node.start_point[0] + 1,
+                    method_calls=[],
+                    decorators=adapter.get_decorators(node, sv),
+                    file=filename,
+                    start_byte=node.start_byte,
+                    end_byte=node.end_byte,
+                    buffer=sv,
+                )
 
                 if class_ctx:
                     class_ctx["methods"].append(fn)
-
                 else:
-                    result["structure"].append({"type": "function", "details": fn})
+                    structure.append({"type": "function", "details": fn})
 
-            for c in node.children:
-                walk(c, class_ctx)
+                frame = (class_ctx, scope, fn, set())
 
-        walk(root)
+            stack.append(frame)
+            if cursor.goto_first_child():
+                continue
 
-        return result
+            # leave finished nodes until one has a next sibling
+            while True:
+                _, _, symbol, calls = stack.pop()
+                if calls is not None:
+                    symbol.method_calls = sorted(calls)
+                elif symbol is not None:
+                    structure.append(symbol)
+
+                if cursor.goto_next_sibling():
+                    break
+                if not cursor.goto_parent():
+                    return
+
+    @staticmethod
+    def read_bytes(file: str) -> bytes:
+        # the raw bytes are parsed and sliced as is, undecodable sequences are only dropped from decoded slices
+        with open(file, "rb") as f:
+            return f.read()
 
     @staticmethod
     def open_file(file: str):
         with open(file, "rb") as f:
             return f.read().decode("utf-8", errors="ignore")
 
-    def analyze_directory(self, path: str):
-        results = {}
+    def analyze_directory(self, path: str, pool=None):
+        """
+        Extracts the structure of every supported file under the path.
+
+        Args:
+            path: Directory to analyze.
+            pool: Optional WorkerPool, files are parsed in its worker processes instead of sequentially.
+        """
         files, _ = self.files_list(path)
 
-        for f in files:
-            results[f] = self.extract_structure(f)
+        if pool is not None:
+            # built once here, so the workers receive it with the parser instead of walking the repository again
+            self.module_index
+            return dict(zip(files, pool.map(self.extract_structure, files)))
 
-        return results
+        return {f: self.extract_structure(f) for f in files}
 
     @staticmethod
     def build_function_index(results: dict):
+        """
+        Indexes functions and methods by name and by "Class.method".
+
+        Parsed symbols already know their file and class, so they are referenced as is instead of being copied.
+        """
         index = {}
         for file, data in results.items():
             for item in data["structure"]:
                 if item["type"] == "class":
                     for m in item["methods"]:
-                        full = f"{item['name']}." f"{m['method_name']}"
-
-                        index[full] = {
-                            **m,
-                            "file": file,
-                        }
-
-                        index[m["method_name"]] = {
-                            **m,
-                            "file": file,
-                        }
+                        entry = _index_entry(m, file, item["name"])
+                        index[f"{item['name']}.{m['method_name']}"] = entry
+                        index[m["method_name"]] = entry
                 else:
                     d = item["details"]
-                    index[d["method_name"]] = {
-                        **d,
-                        "file": file,
-                    }
+                    index[d["method_name"]] = _index_entry(d, file)
 
         return index
+
+
+def _index_entry(symbol, file: str, class_name: str = None):
+    if isinstance(symbol, FunctionSymbol):
+        return symbol
+    entry = {**symbol, "file": file}
+    if class_name:
+        entry["class"] = class_name
+    return entry
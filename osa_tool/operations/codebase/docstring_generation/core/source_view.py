@@ -1,7 +1,67 @@
+from bisect import bisect_right
+
+
 class SourceView:
-    def __init__(self, source: str):
-        self.source = source
-        self.bytes = source.encode("utf-8")
+    """
+    Shared UTF-8 buffer of a single source file.
+
+    Parsed symbols keep byte offsets into this buffer instead of their own copies of the text.
+    Symbols register the byte ranges they cover, and a pickled view keeps only those ranges, so the
+    results sent back by the worker processes do not carry module-level code and other unused text.
+    Pickled symbols rebase their offsets onto the kept ranges with ``rebase``.
+    """
+
+    __slots__ = ("bytes", "spans", "_compacted")
+
+    def __init__(self, source: str | bytes):
+        self.bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+        self.spans: list[tuple[int, int]] = []
+        self._compacted = None
+
+    def cover(self, start_byte: int, end_byte: int) -> None:
+        """Marks the byte range as used by a symbol, so it is kept when the view is pickled."""
+        self.spans.append((start_byte, end_byte))
+
+    def slice(self, start_byte: int, end_byte: int) -> str:
+        return self.bytes[start_byte:end_byte].decode("utf-8", errors="ignore")
 
     def text(self, node):
-        return self.bytes[node.start_byte : node.end_byte].decode("utf-8", errors="ignore")
+        return self.slice(node.start_byte, node.end_byte)
+
+    def rebase(self, start_byte: int, end_byte: int) -> tuple[int, int]:
+        """Translates a covered byte range into the offsets it has in the pickled buffer."""
+        _, segments = self._compact()
+        index = bisect_right(segments, start_byte, key=lambda segment: segment[0]) - 1
+        if index < 0 or end_byte > segments[index][1]:
+            raise ValueError(f"Bytes {start_byte}:{end_byte} are not covered by any symbol of the source buffer")
+        start, _, position = segments[index]
+        return position + start_byte - start, position + end_byte - start
+
+    def _compact(self) -> tuple[bytes, list[tuple[int, int, int]]]:
+        """Joins the covered ranges, returns the joined bytes and (start, end, position) of every range."""
+        if self._compacted is not None and self._compacted[0] == len(self.spans):
+            return self._compacted[1]
+
+        merged: list[list[int]] = []
+        for start, end in sorted(self.spans):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        segments, position = [], 0
+        for start, end in merged:
+            segments.append((start, end, position))
+            position += end - start
+        compacted = b"".join(self.bytes[start:end] for start, end in merged), segments
+        # cached per number of spans, so the buffer and all symbols of one pickle use the same layout
+        self._compacted = len(self.spans), compacted
+        return compacted
+
+    def __getstate__(self):
+        return self._compact()[0]
+
+    def __setstate__(self, state):
+        self.bytes = state
+        self.spans = []
+        self._compacted = None
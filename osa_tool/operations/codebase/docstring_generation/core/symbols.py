@@ -0,0 +1,78 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+
+from osa_tool.operations.codebase.docstring_generation.core.source_view import SourceView
+
+
+@dataclass(slots=True, eq=False)
+class FunctionSymbol(Mapping):
+    """
+    Function or method entry of the parsed project structure.
+
+    The source code is not copied into the symbol: it keeps byte offsets into the buffer of its file,
+    which is shared by all symbols of that file, and decodes the text only when it is requested.
+    The symbol is a read-only mapping with the keys of the former metadata dictionaries, so
+    ``symbol["source_code"]`` and ``symbol.get("docstring")`` keep working.
+    """
+
+    method_name: str
+    class_name: str | None
+    arguments: list[str]
+    docstring: str | None
+    start_line: int
+    method_calls: list[str]
+    decorators: list[str]
+    file: str
+    start_byte: int
+    end_byte: int
+    buffer: SourceView = field(repr=False)
+
+    KEYS = (
+        "class_name",
+        "method_name",
+        "arguments",
+        "docstring",
+        "start_line",
+        "source_code",
+        "method_calls",
+        "decorators",
+        "file",
+    )
+
+    def __post_init__(self):
+        self.buffer.cover(self.start_byte, self.end_byte)
+
+    def __reduce__(self):
+        # the buffer is pickled with only the covered ranges, so the offsets are moved onto them
+        start_byte, end_byte = self.buffer.rebase(self.start_byte, self.end_byte)
+        return FunctionSymbol, (
+            self.method_name,
+            self.class_name,
+            self.arguments,
+            self.docstring,
+            self.start_line,
+            self.method_calls,
+            self.decorators,
+            self.file,
+            start_byte,
+            end_byte,
+            self.buffer,
+        )
+
+    @property
+    def source_code(self) -> str:
+        return self.buffer.slice(self.start_byte, self.end_byte)
+
+    def __getitem__(self, key: str):
+        if key == "class":
+            # the function index used to store the owner class under this key
+            return self.class_name
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
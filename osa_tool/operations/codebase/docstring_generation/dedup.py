@@ -0,0 +1,185 @@
+import hashlib
+import io
+import tokenize
+from collections import defaultdict
+from typing import Callable
+
+from osa_tool.utils.logger import logger
+
+REUSE_MODES = ("off", "body", "class")
+
+
+def normalize_source(source_code: str, language: str = "python") -> str:
+    """
+    Normalizes the source of a function so that formatting-only differences do not matter.
+
+    For Python the code is re-tokenized: comments, blank lines and the leading docstring are dropped
+    and the remaining tokens are joined with single spaces. For other languages, and for Python code
+    that cannot be tokenized, whitespace is collapsed.
+
+    Args:
+        source_code: Source code of a function or method including its signature.
+        language: Language of the source file.
+
+    Returns:
+        str: Normalized source code.
+    """
+    if language == "python":
+        try:
+            return _normalize_python(source_code)
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            pass
+    return " ".join(source_code.split())
+
+
+def _normalize_python(source_code: str) -> str:
+    tokens = []
+    # the docstring is the first statement of the body, i.e. a string right after the first INDENT
+    docstring_state = "signature"
+
+    for token in tokenize.generate_tokens(io.StringIO(source_code).readline):
+        if token.type in (tokenize.COMMENT, tokenize.NL, tokenize.ENCODING, tokenize.ENDMARKER):
+            continue
+
+        if docstring_state == "signature":
+            if token.type == tokenize.INDENT:
+                docstring_state = "body"
+        elif docstring_state == "body":
+            docstring_state = "docstring" if token.type == tokenize.STRING else "done"
+            if docstring_state == "docstring":
+                continue
+        elif docstring_state == "docstring":
+            docstring_state = "done"
+            if token.type == tokenize.NEWLINE:
+                continue
+
+        # block structure is kept as markers, the exact indentation width is not
+        if token.type in (tokenize.INDENT, tokenize.DEDENT):
+            tokens.append(tokenize.tok_name[token.type])
+        elif token.type == tokenize.NEWLINE:
+            tokens.append(";")
+        else:
+            tokens.append(token.string)
+
+    return " ".join(tokens)
+
+
+class DuplicateIndex:
+    """
+    Groups functions and methods with identical bodies and signatures across the repository.
+
+    Only the first scheduled member of a group is sent to the LLM, its docstring is then reused
+    for every other member. The index keeps track of which groups are being generated, which
+    members wait for a representative and how many LLM calls were avoided.
+    """
+
+    def __init__(self, dep_graph, mode: str = "body", eligible: Callable[[str, dict], bool] | None = None):
+        """
+        Initialize the index from the dependency graph.
+
+        Args:
+            dep_graph: Dependency graph of the project built by topology.build_dependency_graph().
+            mode: "body" to reuse docstrings between identical symbols, "class" to additionally require
+                the same enclosing class, so methods moved into another class context are regenerated.
+                "off" disables the reuse.
+            eligible: Predicate on the node id and node info deciding whether a node is going to be documented at all.
+        """
+        if mode not in REUSE_MODES:
+            raise ValueError(f"Unknown docstring reuse mode: {mode}. Expected one of {REUSE_MODES}")
+
+        self.mode = mode
+        self.keys: dict[str, str] = {}
+        self.docstrings: dict[str, str] = {}
+        self.pending: set[str] = set()
+        self.waiting: dict[str, list[str]] = defaultdict(list)
+        self.reused = 0
+
+        if mode != "off":
+            self._build(dep_graph, eligible)
+
+    def _build(self, dep_graph, eligible: Callable[[str, dict], bool] | None) -> None:
+        groups = defaultdict(list)
+        for node_id, node_info in dep_graph.nodes.items():
+            if node_info["type"] not in ("function", "method"):
+                continue
+            if eligible and not eligible(node_id, node_info):
+                continue
+            groups[self._fingerprint(node_info)].append(node_id)
+
+        # symbols without copies are never looked up, so only real duplicates are kept
+        for key, node_ids in groups.items():
+            if len(node_ids) > 1:
+                for node_id in node_ids:
+                    self.keys[node_id] = key
+
+        if self.keys:
+            logger.info(f"Found {len(self.keys)} symbols in duplicate groups, their docstrings will be reused")
+
+    def _fingerprint(self, node_info: dict) -> str:
+        metadata = node_info["metadata"]
+        language = "python" if node_info["file"].endswith(".py") else "other"
+        parts = [
+            node_info["type"],
+            language,
+            metadata.get("method_name", ""),
+            ",".join(map(str, metadata.get("arguments") or [])),
+            ",".join(map(str, metadata.get("decorators") or [])),
+            normalize_source(metadata.get("source_code", ""), language),
+        ]
+        if self.mode == "class":
+            parts.append(node_info.get("class", ""))
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def claim(self, node_id: str) -> bool:
+        """
+        Checks whether a node has to be documented with its own LLM request.
+
+        The first claimed member of a duplicate group becomes its representative.
+
+        Returns:
+            bool: False if the group already has a docstring or a representative in progress.
+        """
+        key = self.keys.get(node_id)
+        if key is None:
+            return True
+        if key in self.docstrings or key in self.pending:
+            return False
+        self.pending.add(key)
+        return True
+
+    def reuse(self, node_id: str) -> str | None:
+        """
+        Returns the docstring of the node's group, or parks the node until its representative completes.
+
+        Must be called only for nodes that were not claimed.
+        """
+        key = self.keys[node_id]
+        if key in self.docstrings:
+            self.reused += 1
+            return self.docstrings[key]
+        self.waiting[key].append(node_id)
+        return None
+
+    def resolve(self, node_id: str, docstring: str | None) -> list[str]:
+        """
+        Records the result of a representative and releases the members waiting for it.
+
+        If the representative got no docstring, the group is unclaimed again and the waiting members
+        have to be scheduled anew, so one of them becomes the next representative.
+
+        Args:
+            node_id: The completed node.
+            docstring: Its generated docstring, None if generation failed.
+
+        Returns:
+            list[str]: Node ids that were waiting for the given node.
+        """
+        key = self.keys.get(node_id)
+        if key is None or key not in self.pending:
+            return []
+
+        self.pending.discard(key)
+        if docstring:
+            self.docstrings[key] = docstring
+            self.reused += len(self.waiting[key])
+        return self.waiting.pop(key, [])
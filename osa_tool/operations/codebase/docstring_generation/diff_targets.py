@@ -0,0 +1,181 @@
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from osa_tool.operations.codebase.docstring_generation.topology import build_dependency_graph
+from osa_tool.utils.logger import logger
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+# escapes of the C-style quoted paths in git headers, octal byte escapes are handled separately
+QUOTED_PATH_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13, '"': 34, "\\": 92}
+
+
+@dataclass
+class DiffTargets:
+    """Symbols touched since the base revision: node ids of functions and methods, and (file, class name) pairs."""
+
+    symbols: set[str] = field(default_factory=set)
+    classes: set[tuple[str, str]] = field(default_factory=set)
+
+
+def changed_line_ranges(repo_path: str, base_ref: str) -> dict[str, list[tuple[int, int]]]:
+    """
+    Computes the changed line ranges of the working tree against the base revision.
+
+    Args:
+        repo_path: Path to the repository.
+        base_ref: Base revision, e.g. a branch, tag or commit.
+
+    Returns:
+        dict[str, list[tuple[int, int]]]: Resolved file paths mapped to inclusive (first, last) line ranges
+        in their current version. Deletions are mapped to the line next to them. Deleted files are not included.
+
+    Raises:
+        subprocess.CalledProcessError: If git cannot compute the diff, e.g. for an unknown revision.
+    """
+    root = Path(repo_path).resolve()
+    diff = subprocess.run(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--unified=0",
+            "--no-color",
+            "--no-ext-diff",
+            "--diff-filter=d",
+            base_ref,
+            "--",
+        ],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ).stdout
+
+    ranges = {}
+    current = None
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            path = _header_path(line[4:])
+            current = str(root / path[2:]) if path.startswith("b/") else None
+            if current:
+                ranges.setdefault(current, [])
+        elif current and (match := HUNK_HEADER.match(line)):
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            if count:
+                ranges[current].append((start, start + count - 1))
+            else:
+                ranges[current].append((start + 1, start + 1))
+
+    return ranges
+
+
+def _header_path(header: str) -> str:
+    """
+    Extracts the path of a diff file header.
+
+    Git quotes paths with special characters C-style, and terminates paths containing spaces with a tab.
+    """
+    if not header.startswith('"'):
+        return header.removesuffix("\t")
+
+    data = bytearray()
+    i = 1
+    while i < len(header) and header[i] != '"':
+        char = header[i]
+        if char != "\\":
+            data.extend(char.encode("utf-8"))
+            i += 1
+        elif header[i + 1 : i + 4].isdigit():
+            data.append(int(header[i + 1 : i + 4], 8))
+            i += 4
+        else:
+            data.append(QUOTED_PATH_ESCAPES.get(header[i + 1], ord(header[i + 1])))
+            i += 2
+    return data.decode("utf-8", errors="replace")
+
+
+def files_referencing(repo_path: str, names: set[str]) -> list[str]:
+    """Lists the tracked files that mention any of the names as a whole word, used to find possible callers."""
+    if not names:
+        return []
+
+    command = ["git", "grep", "-l", "-w", "-F"]
+    for name in sorted(names):
+        command.extend(["-e", name])
+
+    root = Path(repo_path).resolve()
+    result = subprocess.run(command, cwd=root, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    # git grep exits with 1 when nothing is found
+    if result.returncode not in (0, 1):
+        logger.warning(f"Failed to search callers of changed symbols: {result.stderr.strip()}")
+        return []
+
+    return [str(root / path) for path in result.stdout.splitlines()]
+
+
+def _overlaps(ranges: list[tuple[int, int]], first: int, last: int) -> bool:
+    return any(start <= last and first <= end for start, end in ranges)
+
+
+def select_diff_targets(
+    parsed_structure: dict, ranges: dict[str, list[tuple[int, int]]], include_callers: bool = False
+) -> DiffTargets:
+    """
+    Maps changed line ranges to the parsed symbols.
+
+    A function or method is targeted when a changed line falls into its definition. A class is targeted
+    when its header line or one of its methods changed.
+
+    Args:
+        parsed_structure: Parsed structure of the analyzed files.
+        ranges: Changed line ranges returned by changed_line_ranges.
+        include_callers: Also target the direct callers of the changed functions and methods.
+
+    Returns:
+        DiffTargets
+    """
+    targets = DiffTargets()
+
+    for file, file_meta in parsed_structure.items():
+        file_ranges = ranges.get(str(Path(file).resolve()))
+        if not file_ranges:
+            continue
+
+        for item in file_meta.get("structure", []):
+            if item["type"] == "class":
+                changed_methods = [
+                    method
+                    for method in item["methods"]
+                    if _overlaps(file_ranges, method["start_line"], _end_line(method))
+                ]
+                targets.symbols.update(f"{file}:{item['name']}.{m['method_name']}" for m in changed_methods)
+                if changed_methods or _overlaps(file_ranges, item["start_line"], item["start_line"]):
+                    targets.classes.add((file, item["name"]))
+            else:
+                details = item["details"]
+                if _overlaps(file_ranges, details["start_line"], _end_line(details)):
+                    targets.symbols.add(f"{file}:{details['method_name']}")
+
+    if include_callers and targets.symbols:
+        dep_graph = build_dependency_graph(parsed_structure)
+        callers = {
+            caller for node_id in targets.symbols for caller in dep_graph.reverse_graph.get(node_id, set())
+        } - targets.symbols
+        targets.symbols |= callers
+
+        # the class docstrings of changed callers are refreshed as well
+        for caller in callers:
+            node_info = dep_graph.get_node_metadata(caller)
+            if node_info["type"] == "method":
+                targets.classes.add((node_info["file"], node_info["class"]))
+
+    return targets
+
+
+def _end_line(symbol: dict) -> int:
+    return symbol["start_line"] + (symbol.get("source_code") or "").count("\n")
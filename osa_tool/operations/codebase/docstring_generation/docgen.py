@@ -1,37 +1,46 @@
 import asyncio
+import json
 import os
 import re
 import shutil
 import subprocess
-from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List
 
-import aiofiles
 import black
 import dotenv
 import libcst as cst
 import tiktoken
 import tomli
 import yaml
-from pydantic import TypeAdapter, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.core.llm.llm import ModelHandlerFactory, ProtollmHandler
+from osa_tool.operations.codebase.docstring_generation.core.osa_parser import OSA_TreeSitter
+from osa_tool.operations.codebase.docstring_generation.dedup import DuplicateIndex
+from osa_tool.operations.codebase.docstring_generation.diff_targets import DiffTargets
 from osa_tool.operations.codebase.docstring_generation.docstring_transformer import (
     DocstringTransformer,
 )
-from osa_tool.operations.codebase.docstring_generation.osa_treesitter import (
-    OSA_TreeSitter,
-)
 from osa_tool.operations.codebase.docstring_generation.insert.factory import AugmentorFactory
+from osa_tool.operations.codebase.docstring_generation.journal import DocstringJournal, content_hash, symbol_hash
+from osa_tool.operations.codebase.docstring_generation.quality import (
+    DEFAULT_QUALITY_THRESHOLD,
+    DocstringQualityGate,
+    signature_parameters,
+)
+from osa_tool.operations.codebase.docstring_generation.summary_cache import SummaryCache, file_content_hash
 from osa_tool.operations.codebase.docstring_generation.topology import (
     build_dependency_graph,
 )
 from osa_tool.utils.logger import logger
 from osa_tool.utils.prompts_builder import PromptBuilder
+from osa_tool.utils.token_counter import count_tokens
 from osa_tool.utils.utils import osa_project_root, resolve_repo_path
 
 dotenv.load_dotenv()
@@ -45,6 +54,14 @@ class ModelSizeLabel(str, Enum):
     UNSURE = "UNSURE"
 
 
+@dataclass
+class ContextFragment:
+    """Rendered context of a helper function, its token count is computed once when it is needed."""
+
+    text: str
+    tokens: int | None = None
+
+
 @dataclass
 class ClassDocumentationDetails:
     """Named input used to create or update a class docstring."""
@@ -55,6 +72,19 @@ class ClassDocumentationDetails:
     docstring: str | None = None
 
 
+class BatchedDocstring(BaseModel):
+    """Docstring generated for a single symbol of a batched request."""
+
+    symbol_id: str
+    docstring: str
+
+
+class BatchedDocstrings(BaseModel):
+    """Structured response of a multi-symbol docstring request."""
+
+    docstrings: list[BatchedDocstring] = Field(default_factory=list)
+
+
 class DocGen(object):
     """
     Utility class for generating and inserting Python docstrings with an LLM.
@@ -65,13 +95,49 @@ class DocGen(object):
     """
 
     SMALL_MODEL_MAX_PARAMETERS_BILLIONS = 13
-
-    def __init__(self, config_manager: ConfigManager):
+    # sizes of well-known model families without a parameter count in the name, checked before asking the model
+    KNOWN_MODEL_SIZES = (
+        (r"gpt-(?:3\.5|4|5)(?!.*(?:mini|nano))", False),
+        (r"claude", False),
+        (r"gemini", False),
+        (r"grok", False),
+        (r"deepseek-(?:v3|r1|chat|reasoner)", False),
+        (r"mistral-large", False),
+        (r"qwen-max", False),
+    )
+    # tokens of the prompt templates and the header of the context around the method itself
+    CONTEXT_PROMPT_OVERHEAD_TOKENS = 512
+    CONTEXT_HEADER = "Referenced helper functions (for context understanding only):\n"
+    CONTEXT_FOOTER = "\nEnd of referenced helper functions\n"
+    # classification results persisted per (provider, model) between runs
+    MODEL_SIZE_CACHE_PATH = Path.home() / ".osa_tool" / "model_sizes.json"
+    SMALL_SYMBOL_MAX_LINES = 12
+    BATCH_OUTPUT_TOKENS_PER_SYMBOL = 256
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        batch_size: int = 1,
+        reuse_mode: str = "body",
+        quality_threshold: float = DEFAULT_QUALITY_THRESHOLD,
+        journal: DocstringJournal | None = None,
+        summary_cache: SummaryCache | None = None,
+    ):
         """
         Instantiates the object of the class.
 
         Args:
             config_manager: Configuration manager instance
+            batch_size: Maximum number of small functions and methods of one module that are documented
+                with a single structured request. Values below 2 disable batching.
+            reuse_mode: How docstrings are shared between functions with identical bodies and signatures:
+                "body" reuses them across the repository, "class" only within the same enclosing class
+                and "off" documents every copy separately.
+            quality_threshold: Minimal local quality score of an existing docstring to be kept as is during
+                the update based on the main idea. Values above 1 send every docstring for rewriting.
+            journal: Write-ahead journal of the run. Generated docstrings and the main idea are appended to it,
+                journaled results of unchanged symbols are used instead of new LLM requests.
+            summary_cache: Persistent cache of module summaries and the main idea, keyed by the hash of their inputs.
         """
         self.config_manager = config_manager
         self.model_settings = self.config_manager.get_model_settings("docstring")
@@ -80,25 +146,103 @@ class DocGen(object):
             self.config_manager.get_model_settings("readme")
         )
         self.main_idea = None
+        self.batch_size = max(1, batch_size)
+        self.batch_stats = {"requests": 0, "symbols": 0}
+        self.reuse_mode = reuse_mode
+        self.reused_docstrings = 0
+        self.quality_threshold = quality_threshold
+        self._quality_gate = None
+        self.journal = journal
+        self.summary_cache = summary_cache
+        # limits the generation to symbols touched by a diff, see diff_targets.py
+        self.targets: DiffTargets | None = None
         self._function_index_cache = None
+        self._context_fragments: dict[tuple[str, str], ContextFragment] = {}
+        self._system_prompt_tokens = None
         self.is_small_model = self._is_small_model_name(self.model_settings.model)
 
+    @staticmethod
+    def _parameters_in_name(model_name: str) -> float | None:
+        """Parse an explicit parameter-count suffix in billions from the model name."""
+        match = re.search(r"(?<![\d.])(\d+(?:[._-]\d+)?)\s*(?:b|bn|billion)(?![a-z])", model_name, re.IGNORECASE)
+        if not match:
+            return None
+        return float(match.group(1).replace("_", ".").replace("-", "."))
+
     @classmethod
     def _is_small_model_name(cls, model_name: str) -> bool:
         """Infer model size from an explicit parameter-count suffix in its name."""
-        match = re.search(r"(?<![\d.])(\d+(?:[._-]\d+)?)\s*(?:b|bn|billion)(?![a-z])", model_name, re.IGNORECASE)
-        if not match:
-            return False
-        return float(match.group(1).replace("_", ".").replace("-", ".")) <= cls.SMALL_MODEL_MAX_PARAMETERS_BILLIONS
+        parameters = cls._parameters_in_name(model_name)
+        return parameters is not None and parameters <= cls.SMALL_MODEL_MAX_PARAMETERS_BILLIONS
+
+    @classmethod
+    def _known_model_size(cls, model_name: str) -> bool | None:
+        """Look the model up in the table of well-known model families."""
+        for pattern, is_small in cls.KNOWN_MODEL_SIZES:
+            if re.search(pattern, model_name, re.IGNORECASE):
+                return is_small
+        return None
+
+    def _model_size_key(self, model_name: str) -> str:
+        return f"{self.model_settings.api}/{model_name}"
+
+    def _load_model_sizes(self) -> dict[str, bool]:
+        try:
+            with open(self.MODEL_SIZE_CACHE_PATH, mode="r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_model_size(self, model_name: str, is_small: bool) -> None:
+        sizes = self._load_model_sizes()
+        sizes[self._model_size_key(model_name)] = is_small
+        try:
+            self.MODEL_SIZE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.MODEL_SIZE_CACHE_PATH, mode="w", encoding="utf-8") as f:
+                json.dump(sizes, f, indent=2)
+        except OSError as error:
+            logger.debug("Could not persist the size of model %s: %s", model_name, error)
+
+    def _resolve_model_size(self, model_name: str) -> tuple[bool | None, str]:
+        """
+        Size of the model without an LLM request: config override, persisted classification, parameter count
+        in the name or known family.
+        """
+        if self.model_settings.small_model is not None:
+            return self.model_settings.small_model, "config"
+
+        persisted = self._load_model_sizes().get(self._model_size_key(model_name))
+        if persisted is not None:
+            return persisted, "cache"
+
+        # distilled and size variants of large families, such as "deepseek-r1:7b", are named by their own size
+        if self._parameters_in_name(model_name) is not None:
+            return self._is_small_model_name(model_name), "parameter count in the name"
+
+        return self._known_model_size(model_name), "known model family"
 
     async def classify_model_size(self) -> bool:
         """Ask the selected model whether it belongs to the configured small-model class.
 
-        The answer is used only for choosing a docstring prompt profile. If the
-        model does not return the required label or the request fails, the
-        name-based heuristic established during initialization is preserved.
+        The answer is used only for choosing a docstring prompt profile. An explicit
+        small_model setting, a classification persisted by a previous run, a parameter
+        count in the model name or the table of well-known model families are used
+        without a request. If the model does not
+        return the required label or the request fails, the name-based heuristic
+        established during initialization is preserved.
         """
         model_name = self.model_settings.model
+        is_small, source = self._resolve_model_size(model_name)
+        if is_small is not None:
+            self.is_small_model = is_small
+            logger.info(
+                "Docstring prompt profile for model %s: %s (from %s)",
+                model_name,
+                "small" if self.is_small_model else "standard",
+                source,
+            )
+            return self.is_small_model
+
         prompt = self._render_prompt(
             "model_size_classification",
             model_name=model_name,
@@ -154,8 +298,10 @@ class DocGen(object):
 
         if label is ModelSizeLabel.SMALL:
             self.is_small_model = True
+            self._save_model_size(model_name, True)
         elif label is ModelSizeLabel.NOT_SMALL:
             self.is_small_model = False
+            self._save_model_size(model_name, False)
         elif label is ModelSizeLabel.UNSURE:
             logger.warning(
                 "Model %s is unsure of its size; using name-based heuristic (%s)",
@@ -311,6 +457,23 @@ class DocGen(object):
             return "javascript"
         return "python"
 
+    @property
+    def _journal_stage(self) -> str:
+        return "update" if self.main_idea else "generate"
+
+    def _journal_key(self, node_info: dict) -> tuple[str, str, str, str]:
+        """Stage, file, symbol and content hash of a dependency graph node in the journal."""
+        file_path = node_info["file"]
+        symbol = f"{node_info['class']}.{node_info['name']}" if node_info["type"] == "method" else node_info["name"]
+        source_hash = symbol_hash(node_info["metadata"].get("source_code", ""), self._lang_of(file_path))
+        return self._journal_stage, file_path, symbol, source_hash
+
+    def _class_journal_key(self, file: str, item: dict, attributes: list) -> tuple[str, str, str, str]:
+        """Stage, file, class name and content hash of a class in the journal."""
+        language = self._lang_of(file)
+        method_hashes = [symbol_hash(method.get("source_code", ""), language) for method in item["methods"]]
+        return self._journal_stage, file, item["name"], content_hash(*attributes, *method_hashes)
+
     async def generate_class_documentation(
         self, class_details: ClassDocumentationDetails, semaphore: asyncio.Semaphore, language: str = "python"
     ) -> str:
@@ -449,10 +612,14 @@ class DocGen(object):
 
         async with semaphore:
             docstring = await self.model_handler.async_request(prompt)
-            if language in ("javascript", "typescript"):
-                return docstring.strip()
-            extracted = self.extract_pure_docstring(docstring)
-            return self.clean_docstring(extracted)
+            return self._finalize_method_docstring(docstring, language)
+
+    @classmethod
+    def _finalize_method_docstring(cls, response: str, language: str = "python") -> str:
+        """Turn a raw model answer into a function or method docstring for the given language."""
+        if language in ("javascript", "typescript"):
+            return response.strip()
+        return cls.clean_docstring(cls.extract_pure_docstring(response))
 
     def _get_method_generation_prompt_large(
         self, method_details: dict, context_code: str = None, language: str = "python"
@@ -524,9 +691,7 @@ class DocGen(object):
 
         async with semaphore:
             response = await self.model_handler.async_request(prompt)
-            if language in ("javascript", "typescript"):
-                return response.strip()
-            return self.clean_docstring(self.extract_pure_docstring(response))
+            return self._finalize_method_docstring(response, language)
 
     def _get_method_update_prompt_large(
         self,
@@ -581,6 +746,39 @@ class DocGen(object):
             main_idea=self.main_idea,
         )
 
+    def _get_batch_symbol_prompt(self, symbol_id: str, node_info: dict, context_code: str = None) -> str:
+        """Render the description of a single symbol inside a batched docstring request."""
+        metadata = node_info["metadata"]
+        class_name = node_info.get("class")
+        existing_docstring = metadata.get("docstring") if self.main_idea else None
+        return self._render_prompt(
+            "method_batch_symbol",
+            symbol_id=symbol_id,
+            method_name=metadata["method_name"],
+            class_location=f" (located inside {class_name} class)" if class_name else "",
+            arguments=[arg for arg in metadata["arguments"] if arg not in ("self", "cls")],
+            decorators=metadata["decorators"],
+            source_code=metadata["source_code"],
+            docstring=(
+                self._render_prompt("method_batch_existing_docstring", docstring=existing_docstring)
+                if existing_docstring
+                else ""
+            ),
+            context=self._render_prompt("method_batch_context", context_code=context_code) if context_code else "",
+        )
+
+    def _get_batch_prompt(self, file_path: str, symbols: list[str]) -> str:
+        """Render a structured request that documents several symbols of one module at once."""
+        language = self._lang_of(file_path)
+        return self._render_prompt(
+            "method_batch_generation",
+            doc_style="JSDoc" if language in ("javascript", "typescript") else "Google-style docstring",
+            language=language.capitalize(),
+            file_name=Path(file_path).name,
+            main_idea=self._render_prompt("method_batch_main_idea", main_idea=self.main_idea) if self.main_idea else "",
+            symbols="\n".join(symbols),
+        )
+
     @staticmethod
     def extract_pure_docstring(gpt_response: str) -> str:
         """
@@ -839,22 +1037,31 @@ class DocGen(object):
         structure: dict,
         function_index: dict = None,
         generated_docstrings: dict = None,
+        budget_share: float | None = None,
+        file_path: str | None = None,
     ) -> str:
         """
         Extracts the context of function calls from given method_details using method_calls field.
 
+        Each helper is rendered once per docstring and its token count is cached, so hub functions called
+        from thousands of places are not rendered and tokenized again for every caller. With a budget, the
+        helpers from the same file are picked first, then the others in the order of method_calls, while
+        they fit into the input tokens left by the prompt of the method itself.
+
         Parameters:
         - method_details: A dictionary containing details about the method, including 'method_calls' list.
         - structure: A dictionary representing the code structure (for fallback search)
-        - function_index: Optional index built by osa_treesitter.build_function_index() for fast O(1) lookup.
+        - function_index: Optional index built by OSA_TreeSitter.build_function_index() for fast O(1) lookup.
         - generated_docstrings: Optional dict mapping node_id to generated docstring (from topological sort)
+        - budget_share: Optional share of the model input budget available to this method's prompt.
+            The context is not limited if it is not given.
+        - file_path: Optional file of the method, its helpers from the same file are more relevant.
 
         Returns:
         A string containing the context of called functions in the format:
-        "Function {function_name} (from {file})
-        {source_code}
-        Args: {arguments}
-        Return: {return_type}
+        "Helper function name: {function_name}
+        Documentation:
+        {docstring}
         "
         """
 
@@ -866,7 +1073,8 @@ class DocGen(object):
         if not function_index:
             return ""
 
-        context = []
+        # node id -> fragment, in the order of method_calls
+        helpers = {}
 
         for func_name in called_functions:
             search_name = func_name.split(".")[-1] if "." in func_name else func_name
@@ -876,17 +1084,17 @@ class DocGen(object):
                 class_name = func_info.get("class", "")
                 display_name = f"{class_name}.{search_name}" if class_name else search_name
 
-                # Use generated docstring if available (from topological sort)
-                docstring = None
-                if generated_docstrings:
-                    # Try to find in generated_docstrings by node_id
-                    file_path = func_info.get("file", "")
-                    if class_name:
-                        node_id = f"{file_path}:{class_name}.{search_name}"
-                    else:
-                        node_id = f"{file_path}:{search_name}"
+                helper_file = func_info.get("file", "")
+                if class_name:
+                    node_id = f"{helper_file}:{class_name}.{search_name}"
+                else:
+                    node_id = f"{helper_file}:{search_name}"
+
+                if node_id in helpers:
+                    continue
 
-                    docstring = generated_docstrings.get(node_id)
+                # Use generated docstring if available (from topological sort)
+                docstring = generated_docstrings.get(node_id) if generated_docstrings else None
 
                 # Fallback to original docstring
                 if not docstring:
@@ -895,22 +1103,69 @@ class DocGen(object):
                 if not docstring:
                     continue
 
-                separator = "=" * 10
-                instance_prompt = (
-                    separator + "\n" f"Helper function name: {display_name}\n" f"Documentation:\n{docstring}\n"
-                )
-
-                context.append(instance_prompt)
+                helpers[node_id] = self._context_fragment(node_id, display_name, docstring)
 
-        if not context:
+        if not helpers:
             return ""
 
-        return (
-            "Referenced helper functions (for context understanding only):\n"
-            + "\n".join(context)
-            + "\nEnd of referenced helper functions\n"
+        fragments = list(helpers.values())
+        if budget_share is not None:
+            fragments = self._select_context_fragments(method_details, helpers, budget_share, file_path)
+            if not fragments:
+                return ""
+
+        return self.CONTEXT_HEADER + "\n".join(fragment.text for fragment in fragments) + self.CONTEXT_FOOTER
+
+    def _context_fragment(self, node_id: str, display_name: str, docstring: str) -> ContextFragment:
+        """Renders the context of a helper once per docstring."""
+        key = (node_id, docstring)
+        fragment = self._context_fragments.get(key)
+        if fragment is None:
+            separator = "=" * 10
+            text = separator + "\n" f"Helper function name: {display_name}\n" f"Documentation:\n{docstring}\n"
+            fragment = self._context_fragments[key] = ContextFragment(text)
+        return fragment
+
+    def _select_context_fragments(
+        self, method_details: dict, helpers: dict, budget_share: float, file_path: str | None = None
+    ) -> list[ContextFragment]:
+        """
+        Greedily fills the context budget of a method, helpers from the same file go first.
+
+        Returns:
+            list[ContextFragment]: Picked fragments in the order of method_calls.
+        """
+        encoder = self.model_settings.encoder
+        available = self.model_handler.available_input_tokens(reserved_tokens=self._system_prompt_token_count())
+        budget = (
+            int(available * budget_share)
+            - count_tokens(method_details.get("source_code") or "", encoder)
+            - self.CONTEXT_PROMPT_OVERHEAD_TOKENS
         )
 
+        # the sort is stable, so the order of method_calls is kept within both groups
+        ranked = sorted(helpers.items(), key=lambda item: not (file_path and item[0].startswith(f"{file_path}:")))
+
+        picked = set()
+        for node_id, fragment in ranked:
+            if fragment.tokens is None:
+                fragment.tokens = count_tokens(fragment.text, encoder)
+            if fragment.tokens <= budget:
+                budget -= fragment.tokens
+                picked.add(node_id)
+
+        if len(picked) < len(helpers):
+            logger.debug(
+                f"Context of {method_details.get('method_name')} is limited to {len(picked)} of {len(helpers)} helpers"
+            )
+
+        return [fragment for node_id, fragment in helpers.items() if node_id in picked]
+
+    def _system_prompt_token_count(self) -> int:
+        if self._system_prompt_tokens is None:
+            self._system_prompt_tokens = count_tokens(self.model_settings.system_prompt, self.model_settings.encoder)
+        return self._system_prompt_tokens
+
     @staticmethod
     def format_with_black(filename) -> None:
         """
@@ -930,38 +1185,36 @@ class DocGen(object):
             mode=black.FileMode(),
             write_back=black.WriteBack.YES,
         )
+        track_changes(filename)
 
     @staticmethod
-    def _run_in_executor(
-        parsed_structure: dict,
-        project_source_code: dict,
-        generated_docstrings: dict,
-        n_workers: int = 8,
-    ) -> list[dict]:
+    def _compact_docstrings(docstrings: dict) -> dict:
+        """Keeps only the symbol fields used by augmentors, so parsed symbols and their file buffers are not pickled."""
+        return {
+            "functions": [(doc, {"method_name": meta["method_name"]}) for doc, meta in docstrings.get("functions", [])],
+            "methods": [
+                (doc, {"method_name": meta["method_name"], "class_name": meta.get("class_name")})
+                for doc, meta in docstrings.get("methods", [])
+            ],
+            "classes": list(docstrings.get("classes", [])),
+        }
+
+    @staticmethod
+    def _perform_file_augmentation(task: tuple[str, dict]) -> dict[str, str]:
         """
-        Runs docstrings insertion tasks in multiprocessing mode.
-        For correct execution, all objects that would be sent to the processes must be pickle-able.
-        The results will be received in the order in which they were sent to the executor.
+        Reads a file in a worker process and inserts the given docstrings into it.
 
         Args:
-            parsed_structure: Parsed structure of current project that contains all files and their metadata.
-            project_source_code: Serialized version of source code.
-            generated_docstrings: Docstrings that would be inserted in the source code.
-            n_workers: The number of workers that would be participating in cpu-bound work.
+            task: A tuple of the file path and the docstrings to insert.
 
         Returns:
-            list[dict]
+            dict[str, str]
         """
+        file, docstrings = task
+        with open(file, mode="r", encoding="utf-8") as f:
+            source_code = f.read()
 
-        structure = [k for k, v in parsed_structure.items() if v.get("structure")]
-
-        # mapping the arguments for cpu-bound tasks
-        args = [(file, project_source_code[file], generated_docstrings[file]) for file in structure]
-
-        with ProcessPoolExecutor(max_workers=n_workers) as executor:
-            result = list(executor.map(DocGen._perform_code_augmentations, args))
-
-        return result
+        return DocGen._perform_code_augmentations((file, source_code, docstrings))
 
     @staticmethod
     def _perform_code_augmentations(args) -> dict[str, str]:
@@ -990,7 +1243,11 @@ class DocGen(object):
         return augmentor.augment(file, source_code, docstrings)
 
     async def _generate_docstrings_for_items(
-        self, parsed_structure: dict, docstring_type: tuple | str, rate_limit: int = 10
+        self,
+        parsed_structure: dict,
+        docstring_type: tuple | str,
+        rate_limit: int = 10,
+        on_file_complete: Callable[[str, dict], None] | None = None,
     ) -> dict[str, dict]:
         """
         Generates a docstrings for all structures in given project by interacting with LLM.
@@ -999,6 +1256,7 @@ class DocGen(object):
             parsed_structure: Parsed structure of current project that contains all files and their metadata.
             docstring_type: Defines docstrings generation strategy by given value.
             rate_limit: A number of API requests to LLM-server that could be sent at the same time.
+            on_file_complete: Called with the file and its docstrings as soon as all docstrings of the file are generated.
 
         Returns:
             dict[str, dict]
@@ -1018,6 +1276,8 @@ class DocGen(object):
                 # if structure contains empty file, there are no purpose for docstrings generation.
                 if structure.get("structure"):
                     results[filename] = await collect_fn(filename, structure, *args)
+                    if on_file_complete:
+                        on_file_complete(filename, results[filename])
                 else:
                     logger.info(f"File {filename} does not contain any functions, methods or class constructions.")
             return results
@@ -1027,7 +1287,7 @@ class DocGen(object):
         match docstring_type:
             case ("functions", "methods") | ("functions", "methods", "classes"):
                 generating_results = await self._fetch_docstrings(
-                    parsed_structure, docstring_type, semaphore, rate_limit
+                    parsed_structure, docstring_type, semaphore, rate_limit, on_file_complete=on_file_complete
                 )
             case "classes":
                 total_classes = sum(
@@ -1052,58 +1312,6 @@ class DocGen(object):
         logger.info(f"Docstrings generation for the project is complete!")
         return generating_results
 
-    @staticmethod
-    async def _get_project_source_code(parsed_structure: dict, sem: asyncio.Semaphore) -> dict[str, str]:
-        """
-        Concurrently reads each file of given project and serialize source code in pickle-able object
-        for future use in multiprocessing cpu-bound tasks.
-
-            Args:
-            parsed_structure: Parsed structure of current project that contains all files and their metadata.
-            sem: Synchronous primitive for preventing the overload of file-system.
-
-        Returns:
-            dict[str, str]
-        """
-
-        structure = [k for k, v in parsed_structure.items() if v.get("structure")]
-
-        # single file reading coroutine
-        async def _read_code(file: str) -> tuple:
-            async with sem:
-                async with aiofiles.open(file, mode="r", encoding="utf-8") as f:
-                    return file, await f.read()
-
-        # collecting the results, then serializing
-        result = await asyncio.gather(*[_read_code(file) for file in structure])
-
-        return {file: code for file, code in result}
-
-    @staticmethod
-    async def _write_augmented_code(parsed_structure: dict, augmented_code: list[dict], sem: asyncio.Semaphore) -> None:
-        """
-        Writes given code after docstrings insertion in necessary files concurrently
-
-        Args:
-            parsed_structure: Parsed structure of current project that contains all files and their metadata.
-            augmented_code: List of code snippets that contains inserted docstrings.
-            sem: Synchronous primitive for preventing the overload of file-system.
-
-        Returns:
-            None
-        """
-
-        structure = [k for k, v in parsed_structure.items() if v.get("structure")]
-
-        # single file writing coroutine
-        async def _write_code(file: str, code: str) -> None:
-            async with sem:
-                async with aiofiles.open(file, mode="w", encoding="utf-8") as f:
-                    await f.write(code)
-
-        # executing coroutines concurrently
-        await asyncio.gather(*[_write_code(f, augmented_code[i][f]) for i, f in enumerate(structure)])
-
     async def _generate_node(
         self,
         node_id: str,
@@ -1124,7 +1332,7 @@ class DocGen(object):
         metadata = node_info["metadata"]
         file_path = node_info["file"]
 
-        if metadata.get("docstring") and not self.main_idea:
+        if metadata.get("docstring") and not self._rewrites_docstring(node_id):
             logger.debug(f"Skipping {node_id}: already has docstring")
             return None
 
@@ -1151,7 +1359,27 @@ class DocGen(object):
                 f"""{progress_label} Requesting for docstrings {"update" if self.main_idea else "generation"} for the function: {metadata["method_name"]} at {file_path}"""
             )
 
-        context = self.context_extractor(metadata, parsed_structure, function_index, generated_docstrings)
+        return await self._request_node_docstring(
+            node_id, node_info, parsed_structure, function_index, generated_docstrings, semaphore
+        )
+
+    async def _request_node_docstring(
+        self,
+        node_id: str,
+        node_info: dict,
+        parsed_structure: dict,
+        function_index: dict,
+        generated_docstrings: dict,
+        semaphore: asyncio.Semaphore,
+    ):
+        """Request a docstring for a single function or method node with its own LLM call."""
+        node_type = node_info["type"]
+        metadata = node_info["metadata"]
+        file_path = node_info["file"]
+
+        context = self.context_extractor(
+            metadata, parsed_structure, function_index, generated_docstrings, budget_share=1.0, file_path=file_path
+        )
         language = self._lang_of(file_path)
 
         try:
@@ -1172,12 +1400,209 @@ class DocGen(object):
             logger.error(f"Error generating docstring for {node_id}: {e}")
             return None
 
+    def _rewrites_docstring(self, node_id: str) -> bool:
+        """Check whether a node is documented again even if it already has a docstring."""
+        return bool(self.main_idea) or (self.targets is not None and node_id in self.targets.symbols)
+
+    def _is_batchable(self, node_id: str, node_info: dict) -> bool:
+        """Check whether a graph node is a small function or method that may share a batched request."""
+        if self.batch_size < 2 or not node_info or node_info.get("type") not in ("function", "method"):
+            return False
+
+        metadata = node_info["metadata"]
+        if metadata.get("docstring") and not self._rewrites_docstring(node_id):
+            return False
+        # constructors get dedicated prompt rules, so they are always documented on their own
+        if metadata.get("method_name") == "__init__":
+            return False
+
+        return len(metadata.get("source_code", "").splitlines()) <= self.SMALL_SYMBOL_MAX_LINES
+
+    def _pack_batch(
+        self, node_id: str, queue: list[str], dep_graph, accept: Callable[[str], bool] | None = None
+    ) -> list[str]:
+        """
+        Groups a ready node with other small ready nodes of the same file.
+
+        Nodes are taken from the ready queue only, so all of them already have their dependencies
+        documented and none of them depends on another one. Picked nodes are removed from the queue.
+
+        Args:
+            node_id: The node that was just taken from the queue.
+            queue: Ready nodes waiting for processing.
+            dep_graph: Dependency graph of the project.
+            accept: Optional final check for a candidate, called only for nodes that are going to be picked.
+
+        Returns:
+            list[str]: The node ids to be documented together, starting with the given node.
+        """
+        node_info = dep_graph.get_node_metadata(node_id)
+        if not self._is_batchable(node_id, node_info):
+            return [node_id]
+
+        # every answer has to fit into the completion limit of a single request
+        limit = min(self.batch_size, max(1, self.model_settings.max_tokens // self.BATCH_OUTPUT_TOKENS_PER_SYMBOL))
+        batch = [node_id]
+
+        for candidate in list(queue):
+            if len(batch) >= limit:
+                break
+            candidate_info = dep_graph.get_node_metadata(candidate)
+            if (
+                candidate_info.get("file") == node_info["file"]
+                and self._is_batchable(candidate, candidate_info)
+                and (accept is None or accept(candidate))
+            ):
+                batch.append(candidate)
+                queue.remove(candidate)
+
+        return batch
+
+    async def _generate_batch(
+        self,
+        node_ids: list[str],
+        dep_graph,
+        parsed_structure: dict,
+        function_index: dict,
+        generated_docstrings: dict,
+        semaphore: asyncio.Semaphore,
+        progress: dict,
+    ) -> list[tuple]:
+        """
+        Generates docstrings for several small nodes of one file with a single structured request.
+
+        Symbols which do not fit into the input token budget of the model, and symbols the model
+        did not return a docstring for, fall back to individual requests.
+
+        Args:
+            node_ids: Nodes of a single file selected by _pack_batch.
+            dep_graph: Dependency graph of the project.
+            parsed_structure: Parsed structure of current project that contains all files and their metadata.
+            function_index: Index built by OSA_TreeSitter.build_function_index() for context extraction.
+            generated_docstrings: Already generated docstrings by node id.
+            semaphore: Synchronous primitive for preventing the overload external LLM-server API.
+            progress: Node-level progress dictionary in format {"count": int, "total": int}.
+
+        Returns:
+            list[tuple]: Results in the same format as returned by _generate_node.
+        """
+        nodes = {node_id: dep_graph.get_node_metadata(node_id) for node_id in node_ids}
+        file_path = nodes[node_ids[0]]["file"]
+        language = self._lang_of(file_path)
+
+        symbols = {}
+        for node_id, node_info in nodes.items():
+            progress["count"] += 1
+            logger.info(
+                f"""[{progress['count']}/{progress['total']}] Requesting for batched docstrings {"update" if self.main_idea else "generation"} for the {node_info["type"]}: {node_info["metadata"]["method_name"]} at {file_path}"""
+            )
+            # the helpers of batched symbols share the input budget of one request
+            context = self.context_extractor(
+                node_info["metadata"],
+                parsed_structure,
+                function_index,
+                generated_docstrings,
+                budget_share=1 / len(node_ids),
+                file_path=file_path,
+            )
+            # node ids are "<file>:<qualified name>", the qualified name is unique within the file
+            symbol_id = node_id.rsplit(":", 1)[-1]
+            symbols[node_id] = (symbol_id, self._get_batch_symbol_prompt(symbol_id, node_info, context))
+
+        # respect the same input budget that would otherwise truncate the prompt blindly
+        encoder = self.model_settings.encoder
+        budget = self.model_handler.available_input_tokens(reserved_tokens=self._system_prompt_token_count())
+        batched = list(node_ids)
+        prompt = self._get_batch_prompt(file_path, [symbols[node_id][1] for node_id in batched])
+        while len(batched) > 1 and count_tokens(prompt, encoder) > budget:
+            batched.pop()
+            prompt = self._get_batch_prompt(file_path, [symbols[node_id][1] for node_id in batched])
+
+        docstrings = {}
+        if len(batched) > 1:
+            try:
+                async with semaphore:
+                    response: BatchedDocstrings = await self.model_handler.async_send_and_parse(
+                        prompt, BatchedDocstrings
+                    )
+                answers = {item.symbol_id.strip(): item.docstring for item in response.docstrings}
+            except Exception as e:
+                logger.warning(f"Batched docstring request for {file_path} failed, using single requests: {e}")
+                answers = {}
+
+            for node_id in batched:
+                answer = answers.get(symbols[node_id][0])
+                if answer and answer.strip():
+                    docstrings[node_id] = self._finalize_method_docstring(answer, language)
+
+            self.batch_stats["requests"] += 1
+            self.batch_stats["symbols"] += len(docstrings)
+
+        missing = [node_id for node_id in node_ids if node_id not in docstrings]
+        if missing:
+            logger.debug(f"Falling back to single requests for {len(missing)} symbol(s) of {file_path}")
+
+        fallback = await asyncio.gather(
+            *[
+                self._request_node_docstring(
+                    node_id, nodes[node_id], parsed_structure, function_index, generated_docstrings, semaphore
+                )
+                for node_id in missing
+            ]
+        )
+
+        results = [
+            (node_id, nodes[node_id]["type"], file_path, docstring, nodes[node_id]["metadata"])
+            for node_id, docstring in docstrings.items()
+        ]
+        return results + [result for result in fallback if result]
+
+    @property
+    def quality_stats(self) -> dict:
+        """Number of docstrings checked by the local quality gate and kept without an update request."""
+        return dict(self._quality_gate.stats) if self._quality_gate else {"checked": 0, "skipped": 0}
+
+    def _needs_main_idea_update(
+        self, name: str, docstring: str | None, parameters: list[str], check_stale: bool = True
+    ) -> bool:
+        """
+        Checks with a cheap local scorer whether an existing docstring is worth an update request.
+
+        Args:
+            name: Symbol name used for logging.
+            docstring: Existing docstring of the symbol.
+            parameters: Names the docstring is expected to mention.
+            check_stale: Whether documented names missing from parameters make the docstring stale.
+
+        Returns:
+            bool: True if the docstring has to be rewritten by the LLM.
+        """
+        if self._quality_gate is None or self._quality_gate.main_idea != self.main_idea:
+            self._quality_gate = DocstringQualityGate(self.main_idea, self.quality_threshold)
+        return self._quality_gate.needs_update(name, docstring, parameters, check_stale)
+
+    def _select_kept_docstrings(self, dep_graph) -> set[str]:
+        """Returns function and method nodes whose existing docstrings pass the local quality gate."""
+        kept = set()
+        for node_id, node_info in dep_graph.nodes.items():
+            metadata = node_info["metadata"]
+            if node_info["type"] not in ("function", "method") or not metadata.get("docstring"):
+                continue
+            parameters = signature_parameters(metadata.get("source_code", ""))
+            if not self._needs_main_idea_update(node_id, metadata["docstring"], parameters):
+                kept.add(node_id)
+
+        if kept:
+            logger.info(f"Keeping {len(kept)} docstrings that passed the local quality gate")
+        return kept
+
     async def _fetch_docstrings(
         self,
         parsed_structure: dict,
         docstring_type: tuple | str,
         semaphore: asyncio.Semaphore,
         rate_limit: int,
+        on_file_complete: Callable[[str, dict], None] | None = None,
     ) -> dict[str, dict]:
         """
         Generates docstrings for functions and methods using dependency-first processing.
@@ -1191,6 +1616,8 @@ class DocGen(object):
             docstring_type: Defines docstrings generation strategy by given value.
             semaphore: Synchronous primitive for preventing the overload external LLM-server API.
             rate_limit: Maximum number of concurrent requests to the LLM.
+            on_file_complete: Called with the file and its docstrings once the last symbol of the file is done,
+                so the file can be written back while the rest of the project is still being generated.
 
         Returns:
             dict[str, dict]: {file: {"methods": [...], "functions": [...], "classes": [...]}}
@@ -1218,13 +1645,125 @@ class DocGen(object):
         in_progress = {}
         completed = set()
 
+        # good enough docstrings are not rewritten during the update based on the main idea
+        kept = self._select_kept_docstrings(dep_graph) if self.main_idea else set()
+        # symbols outside of the diff are only used as context
+        if self.targets is not None:
+            kept |= {node_id for node_id in dep_graph.nodes if node_id not in self.targets.symbols}
+
+        # identical functions are documented once, other copies wait for the representative
+        duplicates = DuplicateIndex(
+            dep_graph,
+            mode=self.reuse_mode,
+            eligible=lambda node_id, node_info: (
+                not node_info["metadata"].get("docstring") or self._rewrites_docstring(node_id)
+            ),
+        )
+
+        # files are complete when all of their symbols are, class docstrings of a file come after the whole graph
+        with_classes = docstring_type == ("functions", "methods", "classes")
+        pending_symbols = defaultdict(set)
+        for node_id, node_info in dep_graph.nodes.items():
+            pending_symbols[node_info["file"]].add(node_id)
+
+        def _complete(node_ids: list[str]) -> None:
+            completed.update(node_ids)
+            if not on_file_complete or with_classes:
+                return
+            for node_id in node_ids:
+                file_path = dep_graph.node_to_file[node_id]
+                pending = pending_symbols.get(file_path)
+                if pending is None:
+                    continue
+                pending.discard(node_id)
+                if not pending:
+                    del pending_symbols[file_path]
+                    on_file_complete(file_path, results[file_path])
+
+        def _record(node_id: str, node_type: str, file_path: str, docstring: str, metadata: dict) -> None:
+            generated_docstrings[node_id] = docstring
+            if self.journal:
+                self.journal.record(*self._journal_key(dep_graph.get_node_metadata(node_id)), docstring)
+
+            if node_type == "method":
+                results[file_path]["methods"].append((docstring, metadata))
+            elif node_type == "function":
+                results[file_path]["functions"].append((docstring, metadata))
+
+        def _release(node_ids: list[str]) -> None:
+            for node_id in node_ids:
+                for dependent_id in dep_graph.reverse_graph.get(node_id, set()):
+                    deps = dep_graph.get_dependencies(dependent_id)
+                    if all(dep in completed for dep in deps):
+                        if (
+                            dependent_id not in queue
+                            and dependent_id not in in_progress
+                            and dependent_id not in completed
+                        ):
+                            queue.append(dependent_id)
+
+        def _reuse(node_id: str, docstring: str) -> None:
+            node_info = dep_graph.get_node_metadata(node_id)
+            logger.debug(f"Reusing docstring of an identical symbol for {node_id}")
+            _record(node_id, node_info["type"], node_info["file"], docstring, node_info["metadata"])
+            _complete([node_id])
+            _release([node_id])
+
+        def _replay(node_id: str) -> bool:
+            node_info = dep_graph.get_node_metadata(node_id)
+            # symbols documented on disk are skipped by the generation anyway
+            if node_info["metadata"].get("docstring") and not self._rewrites_docstring(node_id):
+                return False
+            docstring = self.journal.get(*self._journal_key(node_info))
+            if not docstring:
+                return False
+            logger.debug(f"Using journaled docstring for {node_id}")
+            _record(node_id, node_info["type"], node_info["file"], docstring, node_info["metadata"])
+            _complete([node_id])
+            _release([node_id])
+            return True
+
+        def _accept(candidate: str) -> bool:
+            if candidate in kept:
+                return False
+            # packed candidates skip the replay at the head of the loop, journaled ones are taken from the queue here
+            if self.journal and _replay(candidate):
+                queue.remove(candidate)
+                return False
+            return duplicates.claim(candidate)
+
         logger.info(f"Starting eager topological processing: {len(queue)} nodes ready, {total_nodes} total")
 
         while queue or in_progress:
-            while queue and len(in_progress) < rate_limit:
+            # a batched task is shared by all of its nodes, so running tasks are counted instead of nodes
+            while queue and len(set(in_progress.values())) < rate_limit:
                 node_id = queue.pop(0)
-                task = asyncio.create_task(
-                    self._generate_node(
+                if node_id in kept:
+                    _complete([node_id])
+                    _release([node_id])
+                    continue
+                # results of an interrupted run are taken from the journal
+                if self.journal and _replay(node_id):
+                    continue
+                if not duplicates.claim(node_id):
+                    docstring = duplicates.reuse(node_id)
+                    if docstring:
+                        _reuse(node_id, docstring)
+                    continue
+
+                batch = self._pack_batch(node_id, queue, dep_graph, accept=_accept)
+                if len(batch) > 1:
+                    coroutine = self._generate_batch(
+                        batch,
+                        dep_graph,
+                        parsed_structure,
+                        function_index,
+                        generated_docstrings,
+                        semaphore,
+                        progress,
+                    )
+                else:
+                    coroutine = self._generate_node(
                         node_id,
                         dep_graph,
                         parsed_structure,
@@ -1234,54 +1773,63 @@ class DocGen(object):
                         docstring_type,
                         progress,
                     )
-                )
-                in_progress[node_id] = task
+                task = asyncio.create_task(coroutine)
+                for batched_id in batch:
+                    in_progress[batched_id] = task
 
             if not in_progress:
                 break
 
-            done, _ = await asyncio.wait(in_progress.values(), return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait(set(in_progress.values()), return_when=asyncio.FIRST_COMPLETED)
 
             for task in done:
-                completed_node_id = None
-                for node_id, t in in_progress.items():
-                    if t == task:
-                        completed_node_id = node_id
-                        break
+                completed_node_ids = [node_id for node_id, t in in_progress.items() if t == task]
 
-                if completed_node_id is None:
+                if not completed_node_ids:
                     continue
 
-                del in_progress[completed_node_id]
-                completed.add(completed_node_id)
+                for completed_node_id in completed_node_ids:
+                    del in_progress[completed_node_id]
 
                 try:
                     result = await task
 
-                    if result and not isinstance(result, Exception):
-                        node_id, node_type, file_path, docstring, metadata = result
+                    for item in result if isinstance(result, list) else [result]:
+                        if item and not isinstance(item, Exception):
+                            _record(*item)
 
-                        generated_docstrings[node_id] = docstring
+                except Exception as e:
+                    logger.error(f"Task failed for {', '.join(completed_node_ids)}: {e}")
 
-                        if node_type == "method":
-                            results[file_path]["methods"].append((docstring, metadata))
-                        elif node_type == "function":
-                            results[file_path]["functions"].append((docstring, metadata))
+                _complete(completed_node_ids)
+                _release(completed_node_ids)
 
-                except Exception as e:
-                    logger.error(f"Task failed for {completed_node_id}: {e}")
+                for completed_node_id in completed_node_ids:
+                    docstring = generated_docstrings.get(completed_node_id)
+                    waiting = duplicates.resolve(completed_node_id, docstring)
+                    if docstring:
+                        for duplicate_id in waiting:
+                            _reuse(duplicate_id, docstring)
+                    else:
+                        # the representative failed, the next waiting copy takes its place
+                        queue[:0] = waiting
 
-                for dependent_id in dep_graph.reverse_graph.get(completed_node_id, set()):
-                    deps = dep_graph.get_dependencies(dependent_id)
-                    if all(dep in completed for dep in deps):
-                        if (
-                            dependent_id not in queue
-                            and dependent_id not in in_progress
-                            and dependent_id not in completed
-                        ):
-                            queue.append(dependent_id)
+        if self.batch_stats["requests"]:
+            logger.info(
+                f"Batched docstring requests: {self.batch_stats['symbols']} symbols documented "
+                f"with {self.batch_stats['requests']} requests"
+            )
+
+        if duplicates.reused:
+            logger.info(f"Reused docstrings for {duplicates.reused} duplicate symbols, LLM calls avoided")
+        self.reused_docstrings += duplicates.reused
+
+        if on_file_complete and not with_classes:
+            # symbols left in dependency cycles are never scheduled, their files are flushed as they are
+            for file_path in pending_symbols:
+                on_file_complete(file_path, results[file_path])
 
-        if docstring_type == ("functions", "methods", "classes"):
+        if with_classes:
             total_classes = sum(
                 1
                 for file_meta in parsed_structure.values()
@@ -1299,10 +1847,10 @@ class DocGen(object):
                 class_results[file_path] = await self._fetch_docstrings_for_class(
                     file_path, file_meta, semaphore, class_progress
                 )
+                results[file_path]["classes"] = class_results[file_path].get("classes", [])
 
-            for file_path in results.keys():
-                if file_path in class_results:
-                    results[file_path]["classes"] = class_results[file_path].get("classes", [])
+                if on_file_complete:
+                    on_file_complete(file_path, results[file_path])
 
         return results
 
@@ -1328,13 +1876,18 @@ class DocGen(object):
         """
 
         _coroutines = []
+        journaled = []
+        journal_keys = {}
 
         for item in file_meta["structure"]:
             _type = item["type"]
 
             match _type:
                 case "class":
-                    if not item.get("docstring") or self.main_idea:
+                    if self.targets is not None and (file, item["name"]) not in self.targets.classes:
+                        continue
+                    # changed classes are regenerated even when they are documented already
+                    if not item.get("docstring") or self.main_idea or self.targets is not None:
                         # collecting a class metadata ahead
                         class_name = item["name"]
                         attributes = list(item["attributes"])
@@ -1346,6 +1899,21 @@ class DocGen(object):
                                 r"\bself\.([A-Za-z_]\w*)\s*(?::[^=]+)?=", constructor["source_code"]
                             )
                             attributes.extend(attr for attr in initialized_attributes if attr not in attributes)
+
+                        if (
+                            self.main_idea
+                            and item.get("docstring")
+                            and not self._needs_main_idea_update(
+                                class_name, item["docstring"], attributes, check_stale=False
+                            )
+                        ):
+                            continue
+                        if self.journal:
+                            journal_keys[class_name] = self._class_journal_key(file, item, attributes)
+                            docstring = self.journal.get(*journal_keys[class_name])
+                            if docstring:
+                                journaled.append((docstring, class_name))
+                                continue
                         class_metadata = ClassDocumentationDetails(
                             name=class_name, attributes=attributes, docstring=item["docstring"]
                         )
@@ -1378,8 +1946,13 @@ class DocGen(object):
 
         fetched_docstrings = await asyncio.gather(*[task[1] for task in _coroutines])
         structure_names = [name[0] for name in _coroutines]
+        fetched = [pair for pair in zip(fetched_docstrings, structure_names) if pair[0]]
+
+        if self.journal:
+            for docstring, class_name in fetched:
+                self.journal.record(*journal_keys[class_name], docstring)
 
-        return {"classes": [pair for pair in zip(fetched_docstrings, structure_names) if pair[0]]}
+        return {"classes": journaled + fetched}
 
     async def generate_the_main_idea(self, parsed_structure: dict, top_n: int = 5) -> None:
 
@@ -1417,15 +1990,34 @@ class DocGen(object):
 
         components = "\n\n".join(prompt_structure)
 
-        self.main_idea = await self.readme_model_handler.async_request(
-            self._render_prompt("main_idea_generation", components=components)
-        )
+        components_hash = content_hash(components)
+        if self.summary_cache and (main_idea := self.summary_cache.get("main_idea", components_hash)):
+            logger.info("The main idea components did not change, using the cached main idea of the project")
+            self.main_idea = main_idea
+            return
+
+        journal_key = ("main_idea", "", "main_idea", components_hash)
+        if self.journal and (main_idea := self.journal.get(*journal_key)):
+            logger.info("Using journaled main idea of the project")
+            self.main_idea = main_idea
+        else:
+            self.main_idea = await self.readme_model_handler.async_request(
+                self._render_prompt("main_idea_generation", components=components)
+            )
+            if self.journal and self.main_idea:
+                self.journal.record(*journal_key, self.main_idea)
+
+        if self.summary_cache and self.main_idea:
+            self.summary_cache.put("main_idea", components_hash, self.main_idea)
 
     async def summarize_submodules(self, project_structure: dict[str, Any], rate_limit: int = 20) -> Dict[str, str]:
         """
         This method performs recursive traversal over given parsed structure of a Python codebase and
         generates short summaries for each directory (submodule).
 
+        Each directory gets a Merkle-style hash of its files contents, nested directories hashes and the main idea.
+        With a summary cache, only directories whose hash changed since the previous run are summarized by the LLM.
+
         Args:
             project_structure: A dictionary representing the parsed structure of the Python codebase.
                 The dictionary keys are filenames and the values are lists of dictionaries representing
@@ -1441,6 +2033,7 @@ class DocGen(object):
         semaphore = asyncio.Semaphore(rate_limit)
 
         _summaries = {}
+        main_idea_hash = content_hash(self.main_idea or "")
 
         async def summarize_directory(name: str, file_summaries: List[str], submodule_summaries: List[str]) -> str:
             """
@@ -1470,12 +2063,13 @@ class DocGen(object):
                     self._render_prompt("submodule_summary", components=components, main_idea=self.main_idea)
                 )
 
-        async def traverse_and_summarize(path: Path, project: dict) -> str:
+        async def traverse_and_summarize(path: Path, project: dict) -> tuple[str | None, str | None]:
 
             _exclusions = (".git", ".github", "test", "tests", "osa_docs")
             _coroutines = []
 
             leaves_summaries = []
+            leaves_hashes = []
 
             directories = [d for d in os.listdir(path) if os.path.isdir(Path(path, d)) and d not in _exclusions]
             files = [f for f in os.listdir(path) if not (os.path.isdir(Path(path, f)))]
@@ -1492,19 +2086,31 @@ class DocGen(object):
                     leaves_summaries.append(
                         self.format_structure_openai_short(filename=p.name, structure=project[str(p)])
                     )
+                    leaves_hashes.append(f"{name}:{file_content_hash(p)}")
 
-            folder_summaries = await asyncio.gather(*_coroutines)
-            folder_summaries = [s for s in folder_summaries if s]
+            folders = [(s, h) for s, h in await asyncio.gather(*_coroutines) if s]
+            folder_summaries = [s for s, _ in folders]
 
             if leaves_summaries or folder_summaries:
-                summary = (
-                    self.main_idea
-                    if Path(path).resolve() == repo_root
-                    else await summarize_directory(Path(path).name, leaves_summaries, folder_summaries)
+                # nested hashes already include the names of their directories
+                subtree_hash = content_hash(
+                    Path(path).name, main_idea_hash, *sorted(leaves_hashes), *sorted(h for _, h in folders)
                 )
+
+                if Path(path).resolve() == repo_root:
+                    summary = self.main_idea
+                elif self.summary_cache and (cached := self.summary_cache.get("module", subtree_hash)):
+                    logger.debug(f"The module {Path(path).name} did not change, using its cached summary")
+                    summary = cached
+                else:
+                    summary = await summarize_directory(Path(path).name, leaves_summaries, folder_summaries)
+                    if self.summary_cache and summary:
+                        self.summary_cache.put("module", subtree_hash, summary)
                 _summaries[str(path)] = summary
 
-                return summary
+                return summary, subtree_hash
+
+            return None, None
 
         await traverse_and_summarize(repo_root, project_structure)
         return _summaries
@@ -1542,6 +2148,7 @@ class DocGen(object):
         if init_doc_path.exists():
             shutil.rmtree(init_doc_path)
         init_doc_path.mkdir(parents=True)
+        track_changes(init_doc_path)
         for file in files_info:
             if not files_info[file]["structure"]:
                 continue
@@ -1567,6 +2174,7 @@ class DocGen(object):
         mkdocs_config = osa_project_root().resolve() / "docs" / "templates" / "mkdocs.yml"
         mkdocs_yml = mkdocs_dir / "osa_mkdocs.yml"
         shutil.copy(mkdocs_config, mkdocs_yml)
+        track_changes(mkdocs_yml)
 
         if local:
             result = subprocess.run(
@@ -1611,6 +2219,7 @@ class DocGen(object):
             workflows_path.mkdir(parents=True, exist_ok=True)
             github_workflow_file = workflows_path / "osa_mkdocs.yml"
             github_workflow_file.write_text(cfg["github"]["workflow"])
+            track_changes(github_workflow_file)
             logger.info(f"GitHub workflow created: {github_workflow_file}")
             if git_host == "github":
                 logger.info(
@@ -1662,6 +2271,7 @@ class DocGen(object):
 
             yaml.Dumper.ignore_aliases = lambda *args: True
             gitlab_file.write_text(yaml.safe_dump(gitlab_data, sort_keys=False))
+            track_changes(gitlab_file)
             logger.info(
                 f"GitLab CI created: {gitlab_file}.\nThe resulting OSA documentation can be downloaded and reviewed at the 'mkdocs_build' job's artifacts initated by MR.\nIt will be automatically deployed once MR is proceeded into the main branch.\nNote that artifacts of the 'mkdocs_build' job are set to expire in a span of 1 week."
             )
@@ -1752,6 +2362,7 @@ class DocGen(object):
             sites_file = sc_ci_dir / "sites.yaml"
             sites_data = {"site": {"ref": sites_cfg.get("ref", "release")}}
             sites_file.write_text(yaml.safe_dump(sites_data, default_flow_style=False, sort_keys=False))
+            track_changes(sc_ci_file, sites_file)
 
             full_name = self.config_manager.get_git_settings().full_name
             org_slug = full_name.split("/")[0]
@@ -1819,6 +2430,7 @@ class DocGen(object):
                     continue  # To avoid overwriting
 
                 dir_path.rename(new_path)
+                track_changes(dir_path, new_path)
 
     @staticmethod
     def _add_init_files(repo_path: Path):
@@ -1864,6 +2476,7 @@ class DocGen(object):
             init_path: Path = folder / "__init__.py"
             if not init_path.exists():
                 init_path.touch()
+                track_changes(init_path)
 
     @staticmethod
     def _purge_temp_files(path: str):
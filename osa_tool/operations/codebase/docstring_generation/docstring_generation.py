@@ -1,9 +1,20 @@
 import asyncio
 import multiprocessing
+from pathlib import Path
 
 from osa_tool.config.settings import ConfigManager
 from osa_tool.core.models.event import OperationEvent, EventKind
+from osa_tool.operations.codebase.docstring_generation.diff_targets import (
+    changed_line_ranges,
+    files_referencing,
+    select_diff_targets,
+)
 from osa_tool.operations.codebase.docstring_generation.docgen import DocGen
+from osa_tool.operations.codebase.docstring_generation.journal import DocstringJournal
+from osa_tool.operations.codebase.docstring_generation.quality import DEFAULT_QUALITY_THRESHOLD
+from osa_tool.operations.codebase.docstring_generation.summary_cache import SummaryCache
+from osa_tool.operations.codebase.docstring_generation.worker_pool import WorkerPool
+from osa_tool.operations.codebase.docstring_generation.write_back import FileWriteBack
 
 # from osa_tool.operations.codebase.docstring_generation.osa_treesitter import OSA_TreeSitter
 
@@ -19,19 +30,51 @@ class DocstringsGenerator:
         ignore_list: list[str],
         incremental: bool = False,
         target_files: list[str] = None,
+        batch_size: int = 1,
+        reuse_mode: str = "body",
+        quality_threshold: float = DEFAULT_QUALITY_THRESHOLD,
+        resume: bool = False,
+        diff_base: str | None = None,
+        diff_callers: bool = False,
     ) -> None:
         self.config_manager = config_manager
         self.ignore_list = ignore_list
-        self.incremental = incremental
+        # docstrings for a diff are a partial update, the main idea and documentation site need the whole project
+        self.incremental = incremental or bool(diff_base)
         self.target_files = target_files
+        self.diff_base = diff_base
+        self.diff_callers = diff_callers
+        self.batch_size = batch_size
+        self.reuse_mode = reuse_mode
+        self.quality_threshold = quality_threshold
+        self.resume = resume
 
         self.sem = asyncio.Semaphore(100)
         self.workers = multiprocessing.cpu_count()
+        # one pool of warmed-up workers for all cpu-bound stages of the run
+        self.pool = WorkerPool(self.workers)
+        self.write_back = FileWriteBack(self.pool, self.sem)
 
         self.repo_url = self.config_manager.get_git_settings().repository
         self.repo_path = str(resolve_repo_path(self.repo_url))
 
-        self.dg = DocGen(self.config_manager)
+        # kept next to the repository, so they are neither committed nor removed together with the clone
+        repo_dir = Path(self.repo_path)
+        self.journal = DocstringJournal(
+            repo_dir.parent / ".osa_cache" / f"{repo_dir.name}.docstrings.jsonl",
+            repo_dir,
+            resume=self.resume,
+        )
+        self.summary_cache = SummaryCache(repo_dir.parent / ".osa_cache" / f"{repo_dir.name}.summaries.json")
+
+        self.dg = DocGen(
+            self.config_manager,
+            batch_size=self.batch_size,
+            reuse_mode=self.reuse_mode,
+            quality_threshold=self.quality_threshold,
+            journal=self.journal,
+            summary_cache=self.summary_cache,
+        )
         self.ts = OSA_TreeSitter(
             self.repo_path,
             self.ignore_list,
@@ -60,56 +103,52 @@ class DocstringsGenerator:
             rate_limit = self.config_manager.get_model_settings("docstring").rate_limit
             await self.dg.classify_model_size()
 
-            res = self.ts.analyze_directory(self.ts.cwd)
+            if self.diff_base:
+                res = self._analyze_diff()
+                if res is None:
+                    return {
+                        "result": f"No changed files since {self.diff_base}, docstrings generation skipped",
+                        "events": self.events,
+                    }
+            else:
+                res = self.ts.analyze_directory(self.ts.cwd, pool=self.pool)
             self._emit(EventKind.ANALYZED, target="codebase_analysis")
 
-            # getting the project source code and start generating docstrings
-            source_code = await self.dg._get_project_source_code(res, self.sem)
-
             # first stage
-            # generate for functions and methods first
-            fn_generated = await self.dg._generate_docstrings_for_items(
+            # generate for functions and methods first, each file is written as soon as its symbols are done
+            self.write_back = FileWriteBack(self.pool, self.sem)
+            await self.dg._generate_docstrings_for_items(
                 res,
                 docstring_type=("functions", "methods"),
                 rate_limit=rate_limit,
+                on_file_complete=self.write_back.complete,
             )
             self._emit(EventKind.GENERATED, target="functions", data={"type": "docstrings"})
             self._emit(EventKind.GENERATED, target="methods", data={"type": "docstrings"})
 
-            fn_augmented = self.dg._run_in_executor(
-                res,
-                source_code,
-                generated_docstrings=fn_generated,
-                n_workers=self.workers,
-            )
-
-            await self.dg._write_augmented_code(res, fn_augmented, self.sem)
-            self._emit(EventKind.WRITTEN, target="functions_methods_docstrings")
+            written = await self.write_back.drain()
+            self._emit(EventKind.WRITTEN, target="functions_methods_docstrings", data={"files": written})
 
             # re-analyze project after docstrings writing
-            res = self.ts.analyze_directory(self.ts.cwd)
-            source_code = await self.dg._get_project_source_code(res, self.sem)
+            res = self.ts.analyze_directory(self.ts.cwd, pool=self.pool)
 
             # then generate description for classes based on filled methods docstrings
-            cl_generated = await self.dg._generate_docstrings_for_items(
+            self.write_back = FileWriteBack(self.pool, self.sem)
+            await self.dg._generate_docstrings_for_items(
                 res,
                 docstring_type="classes",
                 rate_limit=rate_limit,
+                on_file_complete=self.write_back.complete,
             )
             self._emit(EventKind.GENERATED, target="classes", data={"type": "docstrings"})
 
-            cl_augmented = self.dg._run_in_executor(
-                res,
-                source_code,
-                generated_docstrings=cl_generated,
-                n_workers=self.workers,
-            )
-
-            await self.dg._write_augmented_code(res, cl_augmented, self.sem)
-            self._emit(EventKind.WRITTEN, target="classes_docstrings")
+            written = await self.write_back.drain()
+            self._emit(EventKind.WRITTEN, target="classes_docstrings", data={"files": written})
 
             if self.incremental:
                 logger.info("Incremental mode active. Skipping main idea generation and full codebase update.")
+                self._emit_reuse_summary()
+                self.journal.discard()
                 return {
                     "result": "Docstrings successfully generated (incremental)",
                     "events": self.events,
@@ -119,34 +158,38 @@ class DocstringsGenerator:
             await self.dg.generate_the_main_idea(res)
             self._emit(EventKind.SET, target="main_idea", data={"purpose": "improve_docstrings"})
 
-            # re-analyze project and read augmented source code
-            res = self.ts.analyze_directory(self.ts.cwd)
-            source_code = await self.dg._get_project_source_code(res, self.sem)
+            # re-analyze project with the written docstrings
+            res = self.ts.analyze_directory(self.ts.cwd, pool=self.pool)
 
             # update docstrings for project based on generated main idea
-            generated_after_idea = await self.dg._generate_docstrings_for_items(
+            self.write_back = FileWriteBack(self.pool, self.sem)
+            await self.dg._generate_docstrings_for_items(
                 res,
                 docstring_type=("functions", "methods", "classes"),
                 rate_limit=rate_limit,
+                on_file_complete=self.write_back.complete,
             )
-            self._emit(EventKind.UPDATED, target="all_docstrings", data={"source": "main_idea"})
-
-            # augment the source code and persist it
-            augmented_after_idea = self.dg._run_in_executor(
-                res,
-                source_code,
-                generated_after_idea,
-                self.workers,
+            self._emit(
+                EventKind.UPDATED,
+                target="all_docstrings",
+                data={
+                    "source": "main_idea",
+                    "quality_threshold": self.quality_threshold,
+                    "skipped_by_quality_gate": self.dg.quality_stats["skipped"],
+                },
             )
 
-            await self.dg._write_augmented_code(
-                res,
-                augmented_after_idea,
-                self.sem,
-            )
-            self._emit(EventKind.WRITTEN, target="all_docstrings_after_main_idea")
+            written = await self.write_back.drain()
+            self._emit(EventKind.WRITTEN, target="all_docstrings_after_main_idea", data={"files": written})
 
             modules_summaries = await self.dg.summarize_submodules(res, rate_limit)
+            self.summary_cache.save()
+            if self.summary_cache.hits:
+                self._emit(
+                    EventKind.SKIPPED,
+                    target="cached_summaries",
+                    data={"llm_calls_avoided": self.summary_cache.hits},
+                )
             self.dg.generate_documentation_mkdocs(
                 self.repo_path,
                 res,
@@ -158,11 +201,15 @@ class DocstringsGenerator:
                 self.repo_path,
             )
             self._emit(EventKind.SET, target="mkdocs_workflow")
+            self._emit_reuse_summary()
+            self.journal.discard()
             return {
                 "result": "Docstrings successfully generated",
                 "events": self.events,
             }
         except Exception as e:
+            # files completed before the failure keep their docstrings
+            await self._drain_write_back()
             self.dg._purge_temp_files(self.repo_path)
             logger.error(
                 "Error while generating codebase documentation: %s",
@@ -170,12 +217,84 @@ class DocstringsGenerator:
                 exc_info=True,
             )
             self._emit(EventKind.FAILED, target="docstrings", data={"error": repr(e)})
+            logger.info(f"Generated docstrings are kept in {self.journal.path}, rerun with --resume to continue")
 
             return {
                 "result": None,
                 "events": self.events,
             }
+        finally:
+            self.journal.close()
+            self.pool.shutdown()
+
+    def _analyze_diff(self) -> dict | None:
+        """
+        Parses only the files changed since the diff base, plus the files of possible callers if requested,
+        and limits the generation to the changed symbols.
+
+        Returns:
+            dict | None: Parsed structure of the affected files, or None if nothing changed.
+        """
+        ranges = changed_line_ranges(self.repo_path, self.diff_base)
+        if self.target_files:
+            requested = {str(Path(self.repo_path, f).resolve()) for f in self.target_files}
+            ranges = {file: lines for file, lines in ranges.items() if file in requested}
+        if not ranges:
+            logger.info(f"No changed files since {self.diff_base}")
+            return None
+
+        self.ts.target_files = list(ranges)
+        res = self.ts.analyze_directory(self.ts.cwd, pool=self.pool)
+
+        if self.diff_callers:
+            targets = select_diff_targets(res, ranges)
+            changed_names = {node_id.rsplit(":", 1)[1].rsplit(".", 1)[-1] for node_id in targets.symbols}
+            caller_files = [f for f in files_referencing(self.repo_path, changed_names) if f not in ranges]
+            if caller_files:
+                self.ts.target_files = caller_files
+                res.update(self.ts.analyze_directory(self.ts.cwd, pool=self.pool))
+                # later stages re-analyze the changed files together with the callers
+                self.ts.target_files = list(ranges) + caller_files
+
+        self.dg.targets = select_diff_targets(res, ranges, include_callers=self.diff_callers)
+        logger.info(
+            f"Docstrings are limited to changes since {self.diff_base}: {len(self.dg.targets.symbols)} functions "
+            f"and methods, {len(self.dg.targets.classes)} classes in {len(ranges)} changed files"
+        )
+        self._emit(
+            EventKind.ANALYZED,
+            target="diff_targets",
+            data={
+                "base": self.diff_base,
+                "files": len(ranges),
+                "symbols": len(self.dg.targets.symbols),
+                "classes": len(self.dg.targets.classes),
+            },
+        )
+
+        return res
+
+    async def _drain_write_back(self) -> None:
+        try:
+            await self.write_back.drain()
+        except Exception as e:
+            logger.error("Error while writing back generated docstrings: %s", repr(e))
 
     def _emit(self, kind: EventKind, target: str, data: dict = None):
         event = OperationEvent(kind=kind, target=target, data=data or {})
         self.events.append(event)
+
+    def _emit_reuse_summary(self) -> None:
+        """Reports how many LLM calls were avoided by reusing docstrings of duplicate symbols and journaled results."""
+        if self.dg.reused_docstrings:
+            self._emit(
+                EventKind.SKIPPED,
+                target="duplicate_docstrings",
+                data={"llm_calls_avoided": self.dg.reused_docstrings},
+            )
+        if self.journal.replayed:
+            self._emit(
+                EventKind.SKIPPED,
+                target="journaled_docstrings",
+                data={"llm_calls_avoided": self.journal.replayed},
+            )
@@ -1,17 +1,39 @@
 import libcst as cst
-from libcst.metadata import PositionProvider
 
+from osa_tool.operations.codebase.docstring_generation.adapters.python_adapter import PythonAdapter
 from osa_tool.operations.codebase.docstring_generation.insert.base_augmentor import BaseAugmentor
 from osa_tool.operations.codebase.docstring_generation.docstring_transformer import DocstringTransformer
 from osa_tool.utils.logger import logger
 
 
 class PythonAugmentor(BaseAugmentor):
+    """
+    Inserts docstrings into Python sources.
+
+    The fast path splices docstrings directly into the source using tree-sitter byte ranges of the
+    def/class bodies. Files that the fast path cannot handle exactly like libcst (syntax errors, tabs,
+    CRLF line endings, unusual indentation or docstring statements) go through the libcst round-trip
+    with DocstringTransformer.
+    """
+
+    FALLBACK_DEFAULT_INDENT = "    "
+
+    def __init__(self):
+        self.parser = PythonAdapter().get_parser()
 
     def augment(self, file: str, source_code: str, docstrings: dict) -> dict[str, str]:
         if not docstrings:
             return {file: source_code}
 
+        spliced = self._splice(source_code, docstrings)
+        if spliced is not None:
+            return {file: spliced}
+
+        logger.debug(f"Using libcst for docstring augmentation of {file}")
+        return self._augment_with_libcst(file, source_code, docstrings)
+
+    @staticmethod
+    def _augment_with_libcst(file: str, source_code: str, docstrings: dict) -> dict[str, str]:
         try:
             module = cst.parse_module(source_code)
         except cst.ParserSyntaxError:
@@ -25,3 +47,129 @@ class PythonAugmentor(BaseAugmentor):
         new_module = wrapper.visit(transformer)
 
         return {file: new_module.code}
+
+    def _splice(self, source_code: str, docstrings: dict) -> str | None:
+        """
+        Inserts or replaces docstrings with byte-range edits.
+
+        Returns:
+            str | None: The augmented source, or None if the file has to be processed by libcst.
+        """
+        # the fast path only writes "\n" and measures indentation in spaces
+        if "\r" in source_code or "\t" in source_code or "\f" in source_code:
+            return None
+
+        source = source_code.encode("utf-8")
+        root = self.parser.parse(source).root_node
+        if root.has_error:
+            return None
+
+        # used for targets and literal formatting only, so the source is not parsed by libcst
+        transformer = DocstringTransformer(docstrings, [], "")
+        if not transformer.targets:
+            return source_code
+        default_indent = self._default_indent(root)
+
+        edits = []
+        stack = [(root, ())]
+        while stack:
+            node, classes = stack.pop()
+
+            if node.type in ("class_definition", "function_definition"):
+                name = node.child_by_field_name("name").text.decode("utf-8")
+                # like DocstringTransformer: classes by their own name, functions qualified by enclosing classes
+                if node.type == "class_definition":
+                    key = name
+                    classes = (*classes, name)
+                else:
+                    key = ".".join((*classes, name))
+
+                if key in transformer.targets:
+                    edit = self._edit_for(node, source, transformer, transformer.targets[key], default_indent)
+                    if edit is None:
+                        return None
+                    if edit:
+                        edits.append(edit)
+
+            stack.extend((child, classes) for child in reversed(node.children))
+
+        chunks = []
+        position = 0
+        for start, end, text in sorted(edits):
+            chunks.append(source[position:start])
+            chunks.append(text)
+            position = end
+        chunks.append(source[position:])
+
+        return b"".join(chunks).decode("utf-8")
+
+    @staticmethod
+    def _default_indent(root) -> str:
+        """Mirrors libcst: the indentation of the first indented block of the module."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.type == "block":
+                header = node.prev_sibling
+                while header is not None and header.type == "comment":
+                    header = header.prev_sibling
+                statement = next((c for c in node.named_children if c.type != "comment"), None)
+                # a body on the header line does not open an indented block
+                if header is not None and statement is not None and statement.start_point[0] > header.end_point[0]:
+                    return " " * statement.start_point[1]
+            stack.extend(reversed(node.children))
+
+        return PythonAugmentor.FALLBACK_DEFAULT_INDENT
+
+    @staticmethod
+    def _edit_for(node, source: bytes, transformer: DocstringTransformer, docstring: str, default_indent: str):
+        """
+        Builds the (start, end, text) edit that sets the docstring of a def or class node.
+
+        Returns:
+            An edit, an empty tuple if libcst would leave the node unchanged as well,
+            or None if the node needs the libcst path.
+        """
+        body = node.child_by_field_name("body")
+        colon = body.prev_sibling if body is not None else None
+        # comments leading the body are attached between the colon and the block
+        while colon is not None and colon.type == "comment":
+            colon = colon.prev_sibling
+        if colon is None or colon.type != ":":
+            return None
+
+        statements = [c for c in body.named_children if c.type != "comment"]
+        # a body on the header line ("def f(): pass") is skipped by libcst too
+        if not statements or statements[0].start_point[0] == colon.end_point[0]:
+            return ()
+
+        # the docstring lines are indented relative to the def/class line, the body itself has to agree
+        definition = node.parent if node.parent is not None and node.parent.type == "decorated_definition" else node
+        line_start = source.rfind(b"\n", 0, definition.start_byte) + 1
+        prefix = source[line_start : definition.start_byte]
+        indent = prefix.decode("utf-8") + default_indent
+        if prefix.strip() or statements[0].start_point[1] != len(indent):
+            return None
+
+        body_start = source.find(b"\n", colon.end_byte) + 1
+        literal = transformer._format_docstring_literal(docstring, indent)
+        text = f"{indent}{literal}\n".encode("utf-8")
+
+        first = statements[0]
+        if first.type == "expression_statement" and len(first.named_children) == 1:
+            value = first.named_children[0]
+            if value.type != "string":
+                # parenthesized strings and other single expressions are left to libcst
+                return None if value.type == "parenthesized_expression" else (body_start, body_start, text)
+            if b"f" in value.child(0).text.lower():
+                # f-strings are not docstrings for libcst
+                return body_start, body_start, text
+
+            line_end = source.find(b"\n", first.end_byte)
+            following = statements[1] if len(statements) > 1 else None
+            if line_end == -1 or (following is not None and following.start_point[0] == first.end_point[0]):
+                return None
+            # libcst replaces the whole statement line together with the lines before it
+            return body_start, line_end + 1, text
+
+        return body_start, body_start, text
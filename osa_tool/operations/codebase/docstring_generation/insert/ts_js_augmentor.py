@@ -1,185 +1,148 @@
 import re
+
+from osa_tool.operations.codebase.docstring_generation.adapters.javascript_adapter import JavaScriptAdapter
+from osa_tool.operations.codebase.docstring_generation.adapters.typescript_adapter import TSXAdapter, TypeScriptAdapter
 from osa_tool.operations.codebase.docstring_generation.insert.base_augmentor import BaseAugmentor
 
 
 class TSJSAugmentor(BaseAugmentor):
+    """
+    Inserts JSDoc comments into TypeScript and JavaScript sources.
+
+    Declarations are located with tree-sitter in a single walk over the syntax tree. Every docstring becomes
+    an edit (start byte, end byte, comment) that either inserts a comment above the declaration or replaces
+    its existing JSDoc block. The sorted edits are then applied in one splice pass over the source.
+    """
 
     DOC_START = "/**"
     DOC_END = " */"
 
+    ADAPTERS = (TypeScriptAdapter(), TSXAdapter(), JavaScriptAdapter())
+    CLASS_NODES = ("class_declaration", "abstract_class_declaration")
+    # wrappers that a JSDoc comment has to precede instead of the declaration node itself
+    DECLARATION_WRAPPERS = ("variable_declarator", "lexical_declaration", "variable_declaration", "export_statement")
+
     def augment(self, file: str, source_code: str, docstrings: dict) -> dict[str, str]:
 
         if not docstrings:
             return {file: source_code}
 
-        lines = source_code.splitlines(True)
-
-        lines = self._inject_classes(lines, docstrings.get("classes", []))
-        lines = self._inject_functions(lines, docstrings.get("functions", []))
-        lines = self._inject_methods(lines, docstrings.get("methods", []))
-
-        return {file: "".join(lines)}
-
-    def _inject_classes(self, lines, classes):
-        for doc, class_name in classes:
-
-            class_pattern = re.compile(rf"^\s*(export\s+)?(abstract\s+)?class\s+{re.escape(class_name)}\b")
-
-            for i, line in enumerate(lines):
-                if class_pattern.search(line):
-                    if self._has_doc(lines, i):
-                        lines = self._replace_doc(lines, i, doc)
-                    else:
-                        lines.insert(i, self._format(doc, line))
-                    break
-
-        return lines
-
-    def _inject_functions(self, lines, functions):
-        for doc, meta in functions:
-            name = meta["method_name"]
-            patterns = [
-                re.compile(rf"^\s*export\s+(async\s+)?function\s+{re.escape(name)}\s*\("),
-                re.compile(rf"^\s*(async\s+)?function\s+{re.escape(name)}\s*\("),
-                re.compile(rf"^\s*export\s+const\s+{re.escape(name)}\s*=\s*(async\s*)?\("),
-                re.compile(rf"^\s*const\s+{re.escape(name)}\s*=\s*(async\s*)?\("),
-                re.compile(rf"^\s*export\s+const\s+{re.escape(name)}\s*=\s*(async\s*)?.*=>"),
-                re.compile(rf"^\s*const\s+{re.escape(name)}\s*=\s*(async\s*)?.*=>"),
-            ]
-
-            for i, line in enumerate(lines):
-                if any(p.search(line) for p in patterns):
-                    if self._has_doc(lines, i):
-                        lines = self._replace_doc(lines, i, doc)
-                    else:
-                        lines.insert(i, self._format(doc, line))
-
-                    break
-
-        return lines
-
-    def _inject_methods(self, lines, methods):
-        for doc, meta in methods:
+        adapter = next((a for a in self.ADAPTERS if file.endswith(a.EXTENSIONS)), self.ADAPTERS[0])
+        source = source_code.encode("utf-8")
+        tree = adapter.get_parser().parse(source)
+        classes, functions, methods = self._collect_declarations(tree.root_node, source)
+
+        targets = []
+        for doc, class_name in docstrings.get("classes", []):
+            targets.append((doc, classes.get(class_name)))
+        for doc, meta in docstrings.get("functions", []):
+            targets.append((doc, functions.get(meta["method_name"])))
+        for doc, meta in docstrings.get("methods", []):
             name = meta["method_name"]
-            patterns = [
-                # public/private/protected async static method<T>(
-                re.compile(
-                    rf"""^\s*
-                    (?:
-                        public|private|protected|static|readonly|async|get|set
-                    |\s)+
-                    \s*
-                    {re.escape(name)}
-                    \s*
-                    (?:<[^>]*>)?
-                    \s*
-                    \(
-                    """,
-                    re.VERBOSE,
-                ),
-                # async method<T>(
-                re.compile(
-                    rf"""^\s*
-                    async\s+
-                    {re.escape(name)}
-                    \s*
-                    (?:<[^>]*>)?
-                    \s*
-                    \(
-                    """,
-                    re.VERBOSE,
-                ),
-                # method<T>(
-                re.compile(
-                    rf"""^\s*
-                    {re.escape(name)}
-                    \s*
-                    (?:<[^>]*>)?
-                    \s*
-                    \(
-                    """,
-                    re.VERBOSE,
-                ),
-                # getter/setter
-                re.compile(
-                    rf"""^\s*
-                    (?:public|private|protected|static\s+)*?
-                    (?:get|set)\s+
-                    {re.escape(name)}
-                    \b
-                    """,
-                    re.VERBOSE,
-                ),
-            ]
-
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                # skip obvious calls/usages
-                if (
-                    stripped.startswith("return ")
-                    or stripped.startswith("if ")
-                    or stripped.startswith("while ")
-                    or stripped.startswith("for ")
-                    or stripped.startswith("switch ")
-                    or stripped.startswith("catch ")
-                    or stripped.startswith("new ")
-                    or re.search(rf"\.\s*{re.escape(name)}\s*\(", stripped)
-                    or "=" in stripped
-                ):
-                    continue
-
-                if any(p.search(line) for p in patterns):
-                    if self._has_doc(lines, i):
-                        lines = self._replace_doc(lines, i, doc)
-                    else:
-                        lines.insert(i, self._format(doc, line))
-                    break
-
-        return lines
-
-    def _has_doc(self, lines, i):
-        j = i - 1
-        while j >= 0:
-            current = lines[j].strip()
-            # skip empty lines
-            if not current:
-                j -= 1
-                continue
-
-            # direct jsdoc above declaration
-            if current.endswith("*/"):
-                k = j
-                while k >= 0:
-                    if "/**" in lines[k]:
-                        return True
-                    # stop if another code construct encountered
-                    if lines[k].strip() and not lines[k].strip().startswith("*"):
-                        break
-                    k -= 1
-            return False
-
-        return False
-
-    def _replace_doc(self, lines, i, doc):
-        start = i - 1
-        while start >= 0:
-            if "/**" in lines[start]:
-                break
-            start -= 1
-
-        if start < 0:
-            return lines
+            targets.append((doc, methods.get((meta.get("class_name"), name)) or methods.get((None, name))))
 
-        end = start
-
-        while end < len(lines):
-            if "*/" in lines[end]:
-                break
-            end += 1
-
-        new_block = self._format(doc, lines[i])
-
-        return lines[:start] + [new_block] + lines[end + 1 :]
+        edits = {}
+        for doc, node in targets:
+            if node is None:
+                continue
+            start, end, comment = self._edit_for(node, doc, source)
+            # the first docstring for a declaration wins, as it did with the line scan
+            edits.setdefault(start, (end, comment))
+
+        return {file: self._splice(source, edits).decode("utf-8")}
+
+    def _collect_declarations(self, root, source: bytes) -> tuple[dict, dict, dict]:
+        """
+        Walks the syntax tree once and indexes the first declaration of every class, function and method.
+
+        Methods are indexed both by (class name, method name) and by (None, method name).
+        """
+        classes, functions, methods = {}, {}, {}
+        stack = [(root, None)]
+
+        while stack:
+            node, class_name = stack.pop()
+
+            if node.type in self.CLASS_NODES:
+                name = self._name_of(node, source)
+                classes.setdefault(name, node)
+                class_name = name
+            elif node.type in ("function_declaration", "generator_function_declaration", "arrow_function"):
+                name = self._name_of(node, source)
+                if name and class_name is None:
+                    functions.setdefault(name, node)
+                elif name:
+                    # the parser reports functions nested in class bodies as methods of the class
+                    methods.setdefault((class_name, name), node)
+            elif node.type == "method_definition":
+                name = self._name_of(node, source)
+                methods.setdefault((class_name, name), node)
+                methods.setdefault((None, name), node)
+
+            # children are pushed in reverse to keep the document order of the line scan
+            stack.extend((child, class_name) for child in reversed(node.children))
+
+        return classes, functions, methods
+
+    @staticmethod
+    def _name_of(node, source: bytes) -> str | None:
+        name = node.child_by_field_name("name")
+        if name is None and node.parent is not None and node.parent.type == "variable_declarator":
+            # const foo = () => ...
+            name = node.parent.child_by_field_name("name")
+        return source[name.start_byte : name.end_byte].decode("utf-8", errors="ignore") if name else None
+
+    def _anchor_of(self, node):
+        """Returns the outermost node a JSDoc comment of the declaration is attached to."""
+        anchor = node
+        while anchor.parent is not None and anchor.parent.type in self.DECLARATION_WRAPPERS:
+            anchor = anchor.parent
+
+        # decorators of class members are siblings placed right before the member
+        previous = anchor.prev_named_sibling
+        while previous is not None and previous.type == "decorator":
+            anchor = previous
+            previous = anchor.prev_named_sibling
+        return anchor
+
+    def _edit_for(self, node, doc: str, source: bytes) -> tuple[int, int, bytes]:
+        """Builds the edit that puts the docstring above the declaration of the given node."""
+        anchor = self._anchor_of(node)
+        line_start = source.rfind(b"\n", 0, anchor.start_byte) + 1
+        line_end = source.find(b"\n", anchor.start_byte)
+        line = source[line_start : line_end if line_end != -1 else len(source)].decode("utf-8", errors="ignore")
+        comment = self._format(doc, line).encode("utf-8")
+
+        previous = anchor.prev_sibling
+        if (
+            previous is not None
+            and previous.type == "comment"
+            and source[previous.start_byte : previous.end_byte].startswith(self.DOC_START.encode())
+            and not source[previous.end_byte : anchor.start_byte].strip()
+        ):
+            # replace the existing JSDoc block, starting from the beginning of its line if nothing precedes it
+            doc_start = source.rfind(b"\n", 0, previous.start_byte) + 1
+            if source[doc_start : previous.start_byte].strip():
+                doc_start = previous.start_byte
+            indent = re.match(r"\s*", line).group(0).encode("utf-8")
+            return doc_start, anchor.start_byte, comment + indent
+
+        return line_start, line_start, comment
+
+    @staticmethod
+    def _splice(source: bytes, edits: dict[int, tuple[int, bytes]]) -> bytes:
+        """Applies non-overlapping (start, end, text) edits in one pass over the source."""
+        chunks = []
+        position = 0
+        for start in sorted(edits):
+            end, text = edits[start]
+            if start < position:
+                continue
+            chunks.append(source[position:start])
+            chunks.append(text)
+            position = end
+        chunks.append(source[position:])
+        return b"".join(chunks)
 
     def _format(self, text: str, line: str) -> str:
         indent = re.match(r"\s*", line).group(0)
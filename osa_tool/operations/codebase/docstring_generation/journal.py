@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from osa_tool.operations.codebase.docstring_generation.dedup import normalize_source
+from osa_tool.utils.logger import logger
+
+
+def content_hash(*parts: str) -> str:
+    """Hashes the given symbol contents, the parts are normalized so written docstrings and formatting do not matter."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def symbol_hash(source_code: str, language: str = "python") -> str:
+    return content_hash(normalize_source(source_code or "", language))
+
+
+class DocstringJournal:
+    """
+    Write-ahead journal of generated docstrings for crash-safe, resumable runs.
+
+    Every docstring is appended to a JSONL file as soon as it is generated, keyed by stage, file,
+    symbol and content hash of the symbol. A resumed run replays the journal, so symbols whose
+    content did not change are not sent to the LLM again. A truncated last line left by a crash
+    is ignored on replay.
+    """
+
+    def __init__(self, path: str | Path, root: str | Path, resume: bool = False):
+        """
+        Opens the journal.
+
+        Args:
+            path: The journal file.
+            root: Repository root, files are stored relative to it so the journal survives a re-clone.
+            resume: Replay an existing journal. Otherwise the journal starts empty.
+        """
+        self.path = Path(path)
+        self.root = Path(root)
+        self.entries: dict[tuple, str] = {}
+        self.replayed = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._load()
+            logger.info(f"Resuming docstrings generation: {len(self.entries)} journaled results in {self.path}")
+
+        self._file = open(self.path, mode="a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> None:
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = (entry["stage"], entry["file"], entry["symbol"], entry["hash"])
+                    self.entries[key] = entry["docstring"]
+                except (json.JSONDecodeError, KeyError):
+                    logger.debug(f"Skipping incomplete journal entry in {self.path}")
+
+    def _key(self, stage: str, file: str, symbol: str, symbol_hash: str) -> tuple:
+        if file:
+            try:
+                file = Path(file).resolve().relative_to(self.root.resolve()).as_posix()
+            except ValueError:
+                pass
+        return stage, str(file), symbol, symbol_hash
+
+    def get(self, stage: str, file: str, symbol: str, symbol_hash: str) -> str | None:
+        """Returns the journaled result for the symbol, if its content has not changed since."""
+        result = self.entries.get(self._key(stage, file, symbol, symbol_hash))
+        if result is not None:
+            self.replayed += 1
+        return result
+
+    def record(self, stage: str, file: str, symbol: str, symbol_hash: str, docstring: str) -> None:
+        """Appends the result and flushes it, so it survives a crash of the process."""
+        key = self._key(stage, file, symbol, symbol_hash)
+        if self.entries.get(key) == docstring:
+            return
+
+        self.entries[key] = docstring
+        stage, file, symbol, symbol_hash = key
+        entry = {"stage": stage, "file": file, "symbol": symbol, "hash": symbol_hash, "docstring": docstring}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def discard(self) -> None:
+        """Removes the journal after a finished run."""
+        self.close()
+        if self.path.exists():
+            os.remove(self.path)
@@ -0,0 +1,230 @@
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from osa_tool.utils.logger import logger
+
+DEFAULT_QUALITY_THRESHOLD = 0.85
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9_-]+")
+_STOPWORDS = {
+    "about",
+    "also",
+    "and",
+    "are",
+    "based",
+    "been",
+    "being",
+    "between",
+    "both",
+    "can",
+    "code",
+    "each",
+    "for",
+    "from",
+    "have",
+    "into",
+    "its",
+    "main",
+    "more",
+    "most",
+    "other",
+    "project",
+    "provides",
+    "repository",
+    "such",
+    "that",
+    "the",
+    "their",
+    "them",
+    "then",
+    "there",
+    "these",
+    "this",
+    "through",
+    "used",
+    "uses",
+    "using",
+    "various",
+    "well",
+    "what",
+    "when",
+    "which",
+    "while",
+    "will",
+    "with",
+    "within",
+    "without",
+    "your",
+}
+# "Args:" style sections of Google docstrings and "@param {type} name" tags of JSDoc
+_SECTION = re.compile(r"^\s*(Args|Arguments|Parameters|Params)\s*:\s*$", re.IGNORECASE)
+_OTHER_SECTION = re.compile(r"^\s*[A-Z][A-Za-z ]*:\s*$")
+_ARG_ENTRY = re.compile(r"^\s+\**([A-Za-z_]\w*)\s*(\([^)]*\))?\s*:")
+_JSDOC_PARAM = re.compile(r"@param\s+(?:\{[^}]*\}\s*)?\[?([A-Za-z_$][\w$]*)")
+
+
+def extract_domain_terms(text: str, limit: int = 25) -> set[str]:
+    """
+    Picks the most frequent meaningful words of a text, e.g. of the repository main idea.
+
+    Args:
+        text: Source text.
+        limit: Maximum number of returned terms.
+
+    Returns:
+        set[str]: Lowercased domain terms.
+    """
+    words = [word.lower() for word in _WORD.findall(text or "")]
+    counter = Counter(word for word in words if len(word) > 3 and word not in _STOPWORDS)
+    return {word for word, _ in counter.most_common(limit)}
+
+
+def signature_parameters(source_code: str) -> list[str]:
+    """
+    Extracts parameter names from the signature at the beginning of a function's source code.
+
+    Works for Python and JavaScript/TypeScript signatures; destructured parameters are ignored.
+    """
+    start = source_code.find("(")
+    if start == -1:
+        return []
+
+    depth = 0
+    current = ""
+    parts = []
+    for char in source_code[start + 1 :]:
+        if char == ")" and depth == 0:
+            break
+        if char in "([{<":
+            depth += 1
+        elif char in ")]}>" and depth > 0:
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+
+    names = []
+    for part in parts:
+        match = re.match(r"\s*(?:\.\.\.|\*{1,2})?\s*([A-Za-z_$][\w$]*)", part)
+        if match and match.group(1) not in ("self", "cls", "this"):
+            names.append(match.group(1))
+    return names
+
+
+def documented_parameters(docstring: str) -> set[str]:
+    """Returns the parameter names described in an "Args:" section or in "@param" tags."""
+    names = set(_JSDOC_PARAM.findall(docstring))
+
+    in_section = False
+    for line in docstring.splitlines():
+        if _SECTION.match(line):
+            in_section = True
+        elif in_section and _OTHER_SECTION.match(line):
+            in_section = False
+        elif in_section and (match := _ARG_ENTRY.match(line)):
+            names.add(match.group(1))
+    return names
+
+
+@dataclass
+class DocstringScore:
+    """Components of the local docstring quality score, each in the [0, 1] range."""
+
+    length: float
+    coverage: float
+    freshness: float
+    domain: float
+
+    WEIGHTS = {"length": 0.25, "coverage": 0.35, "freshness": 0.2, "domain": 0.2}
+
+    @property
+    def total(self) -> float:
+        return sum(getattr(self, name) * weight for name, weight in self.WEIGHTS.items())
+
+
+def score_docstring(
+    docstring: str, parameters: list[str], domain_terms: set[str] | None = None, check_stale: bool = True
+) -> DocstringScore:
+    """
+    Scores an existing docstring without calling the LLM.
+
+    Args:
+        docstring: The docstring to score.
+        parameters: Names that the docstring is expected to mention, e.g. function parameters or class attributes.
+        domain_terms: Domain terms of the main idea, see extract_domain_terms(). The more of them the docstring
+            shares, the better it is aligned with the main idea.
+        check_stale: Whether documented parameters missing from the given ones make the docstring stale.
+
+    Returns:
+        DocstringScore: The score components.
+    """
+    text = (docstring or "").strip().strip("\"'").strip()
+    words = _WORD.findall(text)
+    lowered = {word.lower() for word in words}
+
+    length = min(1.0, len(words) / 12)
+
+    expected = [name for name in parameters if name not in ("self", "cls", "this")]
+    mentioned = [name for name in expected if re.search(rf"(?<![\w$]){re.escape(name)}(?![\w$])", text)]
+    coverage = len(mentioned) / len(expected) if expected else 1.0
+
+    # parameters which are documented but were removed from the signature
+    stale = check_stale and bool(documented_parameters(text) - set(parameters))
+    freshness = 0.0 if stale else 1.0
+
+    # alignment with the main idea: full score from two shared terms, or from all of them if there are fewer
+    if domain_terms:
+        domain = min(1.0, len(lowered & domain_terms) / min(2, len(domain_terms)))
+    else:
+        domain = 1.0
+
+    return DocstringScore(length=length, coverage=coverage, freshness=freshness, domain=domain)
+
+
+class DocstringQualityGate:
+    """
+    Decides whether an existing docstring is worth rewriting in light of the repository main idea.
+
+    Docstrings scoring at least the threshold are kept as they are, which saves an LLM call per symbol.
+    """
+
+    def __init__(self, main_idea: str, threshold: float = DEFAULT_QUALITY_THRESHOLD):
+        """
+        Initialize the gate.
+
+        Args:
+            main_idea: The generated main idea of the repository, the source of the domain terms.
+            threshold: Minimal score of a docstring to be kept. Values above 1 send every docstring for rewriting.
+        """
+        self.main_idea = main_idea
+        self.threshold = threshold
+        self.domain_terms = extract_domain_terms(main_idea)
+        self.stats = {"checked": 0, "skipped": 0}
+
+    def needs_update(self, name: str, docstring: str | None, parameters: list[str], check_stale: bool = True) -> bool:
+        """
+        Scores a docstring and records the decision.
+
+        Args:
+            name: Symbol name used for logging.
+            docstring: Existing docstring of the symbol.
+            parameters: Names the docstring is expected to mention.
+            check_stale: Whether documented names missing from parameters lower the score.
+
+        Returns:
+            bool: True if the docstring should be sent to the LLM for rewriting.
+        """
+        if not docstring:
+            return True
+
+        score = score_docstring(docstring, parameters, self.domain_terms, check_stale)
+        self.stats["checked"] += 1
+        if score.total >= self.threshold:
+            self.stats["skipped"] += 1
+            logger.debug(f"Keeping the docstring of {name}: quality score {score.total:.2f}")
+            return False
+        return True
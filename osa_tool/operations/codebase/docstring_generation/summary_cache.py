@@ -0,0 +1,57 @@
+import hashlib
+import json
+from pathlib import Path
+
+from osa_tool.utils.logger import logger
+
+
+def file_content_hash(path: str | Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class SummaryCache:
+    """
+    Persistent cache of LLM summaries of a repository between runs.
+
+    Entries are grouped by kind ("module" summaries, "main_idea") and keyed by the content hash of
+    their inputs: Merkle-style subtree hashes for directories, the prompt components for the main
+    idea. Entries not used by the last run are dropped on save, so the cache does not grow with
+    the history of the repository.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.entries: dict[str, dict[str, str]] = {}
+        self._used: dict[str, set[str]] = {}
+        self.hits = 0
+
+        if self.path.exists():
+            try:
+                with open(self.path, mode="r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable summary cache {self.path}: {e}")
+
+    def get(self, kind: str, key: str) -> str | None:
+        value = self.entries.get(kind, {}).get(key)
+        if value is not None:
+            self._used.setdefault(kind, set()).add(key)
+            self.hits += 1
+        return value
+
+    def put(self, kind: str, key: str, value: str) -> None:
+        self.entries.setdefault(kind, {})[key] = value
+        self._used.setdefault(kind, set()).add(key)
+
+    def save(self) -> None:
+        """Writes the entries used by this run, the file is replaced atomically."""
+        used = {kind: {key: self.entries[kind][key] for key in keys} for kind, keys in self._used.items()}
+        # kinds not touched by this run are kept as they are
+        entries = {**self.entries, **used}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, mode="w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        temp_path.replace(self.path)
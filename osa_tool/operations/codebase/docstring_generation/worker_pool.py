@@ -0,0 +1,72 @@
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable
+
+from osa_tool.utils.logger import logger
+
+
+def _warm_up() -> None:
+    """Loads tree-sitter grammars and imports libcst and black once per worker process."""
+    import black  # noqa: F401
+    import libcst  # noqa: F401
+
+    from osa_tool.operations.codebase.docstring_generation.core.osa_parser import OSA_TreeSitter
+
+    for adapter in OSA_TreeSitter.ADAPTERS:
+        adapter.get_parser()
+
+
+class WorkerPool:
+    """
+    Long-lived process pool for the CPU-bound steps of a docstring run.
+
+    Worker processes are started on the first submitted batch and warmed up once, then reused by
+    every following step (code analysis, docstring insertion) until the pool is shut down.
+    Callables and their arguments must be pickle-able, so tasks should be compact descriptors
+    such as file paths and edit lists rather than whole sources.
+    """
+
+    def __init__(self, n_workers: int | None = None):
+        """
+        Initialize the pool without starting any processes.
+
+        Args:
+            n_workers: The number of worker processes, defaults to the number of CPUs.
+        """
+        self.n_workers = max(1, n_workers or multiprocessing.cpu_count())
+        self._executor: ProcessPoolExecutor | None = None
+
+    def map(self, fn: Callable, items: Iterable[Any]) -> list:
+        """
+        Runs the callable for every item in the worker processes.
+
+        The results are returned in the order of the items. Items are sent in chunks, so that
+        thousands of small tasks do not pay an inter-process round-trip each.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        chunksize = max(1, len(items) // (self.n_workers * 4))
+        return list(self._get_executor().map(fn, items, chunksize=chunksize))
+
+    def submit(self, fn: Callable, item: Any) -> Future:
+        """Runs the callable for a single item, the returned future can be awaited with asyncio.wrap_future."""
+        return self._get_executor().submit(fn, item)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.debug(f"Starting docstring worker pool with {self.n_workers} processes")
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_warm_up)
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
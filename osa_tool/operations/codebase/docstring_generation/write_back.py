@@ -0,0 +1,67 @@
+import asyncio
+
+import aiofiles
+
+from osa_tool.core.git.change_tracker import track_changes
+from osa_tool.operations.codebase.docstring_generation.docgen import DocGen
+from osa_tool.operations.codebase.docstring_generation.worker_pool import WorkerPool
+from osa_tool.utils.logger import logger
+
+
+class FileWriteBack:
+    """
+    Writes files back as soon as all of their docstrings are generated.
+
+    Pass `complete` as the on_file_complete callback of the docstrings generation: the docstrings of a
+    finished file are inserted in the worker pool and the result is written with aiofiles, while the
+    LLM requests for the other files are still running. Augmented sources are not kept in memory, and
+    files finished before a failure keep their docstrings.
+    """
+
+    def __init__(self, pool: WorkerPool, sem: asyncio.Semaphore):
+        """
+        Args:
+            pool: Worker pool used for the docstrings insertion.
+            sem: Synchronous primitive for preventing the overload of file-system.
+        """
+        self.pool = pool
+        self.sem = sem
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def complete(self, file: str, docstrings: dict) -> None:
+        """Schedules the write-back of the file, files without new docstrings are left untouched."""
+        if file in self._tasks or not any(docstrings.values()):
+            return
+
+        self._tasks[file] = asyncio.create_task(self._write(file, DocGen._compact_docstrings(docstrings)))
+
+    async def _write(self, file: str, docstrings: dict) -> None:
+        future = self.pool.submit(DocGen._perform_file_augmentation, (file, docstrings))
+        augmented = await asyncio.wrap_future(future)
+
+        async with self.sem:
+            async with aiofiles.open(file, mode="w", encoding="utf-8") as f:
+                await f.write(augmented[file])
+        track_changes(file)
+
+        logger.debug(f"Docstrings written to {file}")
+
+    async def drain(self) -> int:
+        """
+        Waits for all scheduled writes.
+
+        Returns:
+            int: The number of written files.
+
+        Raises:
+            Exception: The first error of a failed write, after all other writes are finished.
+        """
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+        return len(results)
@@ -6,6 +6,7 @@ import nbformat
 from nbconvert import PythonExporter
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.core.models.event import OperationEvent, EventKind
 from osa_tool.utils.logger import logger
 from osa_tool.utils.utils import resolve_repo_path
@@ -97,6 +98,7 @@ class NotebookConverter:
             script_path = os.path.splitext(notebook_path)[0] + ".py"
             with open(script_path, "w") as script_file:
                 script_file.write(body)
+            track_changes(script_path)
 
             self._emit(EventKind.WRITTEN, script_path)
 
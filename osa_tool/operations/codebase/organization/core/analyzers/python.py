@@ -3,8 +3,9 @@
 import ast
 import re
 from pathlib import Path
-from typing import Set, Optional
+from typing import List, Optional, Set
 
+from osa_tool.utils.module_index import ModuleIndex, module_name, relative_import_name
 from .base import BaseAnalyzer
 
 
@@ -25,6 +26,19 @@ class PythonImportAnalyzer(BaseAnalyzer):
         """
         super().__init__(base_path)
         self.file_extensions = [".py", ".pyx", ".pxd", ".pxi"]
+        self.module_index: Optional[ModuleIndex] = None
+
+    def discover_files(self) -> List[str]:
+        """
+        Collect the Python files with a single walk of base_path into a ModuleIndex.
+        Hidden files and directories are skipped.
+
+        Returns:
+            List[str]: List of discovered file paths relative to base_path
+        """
+        self.module_index = ModuleIndex.build(self.base_path, tuple(self.file_extensions))
+        self.discovered_files = [str(Path(path).relative_to(self.base_path)) for path in self.module_index.files]
+        return self.discovered_files
 
     def extract_imports(self, file_path: str) -> Set[str]:
         """
@@ -58,18 +72,20 @@ class PythonImportAnalyzer(BaseAnalyzer):
                 imports.add(node.module)
             return imports
 
-        package_parts = Path(file_path.replace("\\", "/")).with_suffix("").parts[:-1]
-        parent_levels = max(node.level - 1, 0)
-        base_parts = list(package_parts[: max(len(package_parts) - parent_levels, 0)])
+        importer = self.get_import_key(file_path)
         if node.module:
-            imports.add(".".join(base_parts + node.module.split(".")))
+            imports.add(relative_import_name(importer, node.level, node.module, self._is_package(file_path)))
             return imports
 
         for alias in node.names:
             if alias.name != "*":
-                imports.add(".".join(base_parts + [alias.name]))
+                imports.add(relative_import_name(importer, node.level, alias.name, self._is_package(file_path)))
         return imports
 
+    @staticmethod
+    def _is_package(file_path: str) -> bool:
+        return Path(file_path.replace("\\", "/")).stem == "__init__"
+
     def get_import_key(self, file_path: str) -> str:
         """
         Convert a file path to a dotted module path for import lookups.
@@ -80,15 +96,11 @@ class PythonImportAnalyzer(BaseAnalyzer):
         Returns:
             str: Dotted module path (e.g., 'package.module')
         """
-        normalized = file_path.replace("\\", "/")
-        for extension in self.file_extensions:
-            if normalized.endswith(extension):
-                normalized = normalized[: -len(extension)]
-                break
-        module_path = normalized.replace("/", ".")
-        if module_path.endswith(".__init__"):
-            module_path = module_path[: -len(".__init__")]
-        return module_path
+        key = module_name(file_path, tuple(self.file_extensions))
+        if key is None:
+            # files with other extensions keep their dotted path
+            key = file_path.replace("\\", "/").replace("/", ".")
+        return key
 
     def update_imports_in_content(
         self, file_path: str, content: str, old_import: str, new_import: str
@@ -117,12 +129,9 @@ class PythonImportAnalyzer(BaseAnalyzer):
             return import_value
 
         dots = len(import_value) - len(import_value.lstrip("."))
-        module = import_value[dots:]
-        package_parts = Path(file_path.replace("\\", "/")).with_suffix("").parts[:-1]
-        parent_levels = max(dots - 1, 0)
-        base_parts = list(package_parts[: max(len(package_parts) - parent_levels, 0)])
-        parts = base_parts + (module.split(".") if module else [])
-        return ".".join(part for part in parts if part)
+        return relative_import_name(
+            self.get_import_key(file_path), dots, import_value[dots:], self._is_package(file_path)
+        )
 
     def _format_import_for_file(self, file_path: str, existing_import: str, new_import: str) -> str:
         if not existing_import.startswith("."):
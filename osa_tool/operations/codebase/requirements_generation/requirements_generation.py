@@ -2,6 +2,7 @@ import subprocess
 from pathlib import Path
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.core.llm.llm import ModelHandlerFactory
 from osa_tool.core.models.event import OperationEvent, EventKind
 from osa_tool.utils.logger import logger
@@ -68,6 +69,7 @@ class RequirementsGenerator:
                 logger.error("Fatal error: Could not generate requirements.")
                 self._add_event(EventKind.FAILED, mode="no-notebooks", data={"stderr": e_retry.stderr})
                 raise
+        track_changes(req_file_path)
 
         # LLM Refinement
         if old_context:
@@ -5,6 +5,7 @@ from typing import List, Optional
 import yaml
 
 from osa_tool.config.settings import WorkflowSettings
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.scheduler.plan import Plan
 from osa_tool.utils.utils import osa_project_root
 
@@ -178,6 +179,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "black.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -244,6 +246,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "unit_test.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -290,6 +293,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "pep8.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -333,6 +337,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "autopep8.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -371,6 +376,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "fix_pep8.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -401,6 +407,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "slash_command_dispatch.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -491,6 +498,7 @@ class GitHubWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, "pypi_publish.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(rendered)
+        track_changes(file_path)
 
         return file_path
 
@@ -736,6 +744,7 @@ class SourceCraftWorkflowGenerator(WorkflowGenerator):
 
         with open(file_path, "w", encoding="utf-8") as f:
             yaml.dump(existing, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        track_changes(file_path)
 
         return [file_path]
 
@@ -971,6 +980,7 @@ class GitLabWorkflowGenerator(WorkflowGenerator):
         file_path = os.path.join(self.output_dir, ".gitlab-ci.yml")
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
+        track_changes(file_path)
 
         generated_files.append(file_path)
         return generated_files
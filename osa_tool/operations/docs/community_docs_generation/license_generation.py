@@ -3,6 +3,7 @@ import os
 import tomli
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.core.git.metadata import RepositoryMetadata
 from osa_tool.core.models.event import EventKind, OperationEvent
 from osa_tool.tools.repository_analysis.sourcerank import SourceRank
@@ -62,6 +63,7 @@ class LicenseCompiler:
 
         with open(license_path, "w", encoding="utf-8") as f:
             f.write(license_text)
+        track_changes(license_path)
 
         logger.info("LICENSE has been successfully compiled.")
         self.events.append(
@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 from urllib.parse import quote
 
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.operations.docs.readme_generation.pipeline.runtime_context import ReadmeContext
 from osa_tool.utils.logger import logger
 from osa_tool.utils.utils import read_file, read_ipynb_file  # noqa: F401  (re-exported)
@@ -16,6 +17,7 @@ def save_sections(sections: str, path: str) -> None:
     """Write *sections* text to a Markdown file at *path*."""
     with open(path, "w", encoding="utf-8") as f:
         f.write(sections)
+    track_changes(path)
 
 
 def extract_relative_paths(paths: list[str]) -> list[str]:
@@ -119,6 +121,7 @@ def remove_extra_blank_lines(path: str) -> None:
 
     with open(path, "w", encoding="utf-8") as f:
         f.writelines(cleaned)
+    track_changes(path)
 
 
 def build_system_message(context: ReadmeContext, specific_key: str) -> str:
@@ -3,6 +3,7 @@ import os
 import shutil
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.change_tracker import track_changes
 from osa_tool.core.git.metadata import RepositoryMetadata
 from osa_tool.core.llm.llm import ModelHandler, ModelHandlerFactory
 from osa_tool.core.models.event import OperationEvent, EventKind
@@ -177,6 +178,7 @@ class ReadmeTranslator:
                 os.remove(target_path)
 
             shutil.copyfile(source_path, target_path)
+            track_changes(target_path)
             logger.info(f"Copied file: {target_path}")
             self.events.append(
                 OperationEvent(
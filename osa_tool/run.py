@@ -13,6 +13,9 @@ from osa_tool.core.git.git_agent import (
     GitAgent,
     LocalGitAgent,
 )
+from osa_tool.core.git.http_cache import HttpCache
+from osa_tool.core.git.mirror_cache import MirrorCache
+from osa_tool.core.git.request_utils import set_http_cache
 from osa_tool.operations.analysis.repository_report.report_maker import ReportGenerator, WhatHasBeenDoneReportGenerator
 from osa_tool.operations.analysis.repository_validation.optional_dependencies import (
     load_doc_validator,
@@ -184,6 +187,12 @@ def main():
                     ignore_list=args.ignore_list,
                     incremental=args.incremental,
                     target_files=args.target_files,
+                    batch_size=args.docstring_batch_size,
+                    reuse_mode=args.docstring_reuse,
+                    quality_threshold=args.docstring_quality_threshold,
+                    resume=args.resume,
+                    diff_base=args.docstring_diff_base,
+                    diff_callers=args.docstring_diff_callers,
                 ).run(),
             )
 
@@ -302,26 +311,35 @@ def initialize_git_platform(args, config_manager: ConfigManager) -> tuple[GitAge
     else:
         target_branch = getattr(config_manager.config.git, "osa_branch_name", "osa_tool")
 
+    if args.http_cache_dir:
+        set_http_cache(HttpCache(args.http_cache_dir, args.http_cache_max_age or 0))
+
+    clone_args = {
+        "clone_mode": args.clone_mode or "full",
+        "sparse_paths": args.sparse_paths,
+        "mirror_cache": MirrorCache(args.mirror_cache_dir, args.mirror_cache_quota) if args.mirror_cache_dir else None,
+    }
+
     if os.path.isdir(args.repository):
         git_agent = LocalGitAgent(args.repository, args.branch, author=args.author)
         workflow_manager = GitHubWorkflowManager(args.repository, git_agent.metadata, args)
     elif "github.com" in args.repository:
         git_agent = GitHubAgent(
-            args.repository, repo_branch_name=args.branch, branch_name=target_branch, author=args.author
+            args.repository, repo_branch_name=args.branch, branch_name=target_branch, author=args.author, **clone_args
         )
         workflow_manager = GitHubWorkflowManager(args.repository, git_agent.metadata, args)
     elif "gitlab." in args.repository:
         git_agent = GitLabAgent(
-            args.repository, repo_branch_name=args.branch, branch_name=target_branch, author=args.author
+            args.repository, repo_branch_name=args.branch, branch_name=target_branch, author=args.author, **clone_args
         )
         workflow_manager = GitLabWorkflowManager(args.repository, git_agent.metadata, args)
     elif "gitverse.ru" in args.repository:
         git_agent = GitverseAgent(
-            args.repository, repo_branch_name=args.branch, branch_name=target_branch, author=args.author
+            args.repository, repo_branch_name=args.branch, branch_name=target_branch, author=args.author, **clone_args
         )
         workflow_manager = GitverseWorkflowManager(args.repository, git_agent.metadata, args)
     elif "sourcecraft.dev" in args.repository:
-        git_agent = SourceCraftAgent(args.repository, args.branch, author=args.author)
+        git_agent = SourceCraftAgent(args.repository, args.branch, author=args.author, **clone_args)
         workflow_manager = SourceCraftWorkflowManager(args.repository, git_agent.metadata, args)
     else:
         raise ValueError(f"Cannot initialize Git Agent and Workflow Manager for this platform: {args.repository}")
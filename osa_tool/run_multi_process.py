@@ -11,7 +11,11 @@ from pandas import DataFrame
 
 from osa_tool.config.settings import ConfigManager
 from osa_tool.core.git.git_agent import GitHubAgent, GitLabAgent, GitverseAgent
-from osa_tool.core.git.metadata import RepositoryMetadata
+from osa_tool.core.git.metadata import GitHubMetadataLoader, RepositoryMetadata
+from osa_tool.core.git.http_cache import HttpCache
+from osa_tool.core.git.mirror_cache import MirrorCache
+from osa_tool.core.git.rate_limit import RateLimitLedger
+from osa_tool.core.git.request_utils import set_http_cache, set_rate_limiter
 from osa_tool.operations.codebase.docstring_generation.docstring_generation import DocstringsGenerator
 from osa_tool.operations.docs.readme_generation.inputs.pypi_status_checker import PyPiPackageInspector
 from osa_tool.operations.docs.readme_generation.readme_agent import ReadmeAgent
@@ -19,6 +23,12 @@ from osa_tool.tools.repository_analysis.sourcerank import SourceRank
 from osa_tool.utils.arguments_parser import build_parser_from_yaml
 from osa_tool.utils.utils import logger, rich_section, parse_git_url, delete_repository, format_time
 
+
+def rate_limit_ledger_path(args) -> str:
+    """Path of the rate-limit ledger shared by the worker processes of one table."""
+    return os.path.join(os.path.dirname(args.table_path), ".rate_limits.json")
+
+
 # === Stage 1: Generate report and README asynchronously ===
 
 
@@ -70,10 +80,11 @@ async def run_async_tasks(config_manager: ConfigManager, git_agent, args):
         await asyncio.gather(*tasks)
 
 
-def process_repository_stage1(repo_url: str, args) -> dict:
+def process_repository_stage1(repo_url: str, args, metadata: RepositoryMetadata | None = None) -> dict:
     """
     Stage 1: Clone repository, generate report and README asynchronously.
-    This stage runs in multiple processes concurrently.
+    This stage runs in multiple processes concurrently. Metadata prefetched for the repository is passed
+    to the Git agent, so it is not requested again.
     """
     stage_start = time.time()
 
@@ -110,13 +121,24 @@ def process_repository_stage1(repo_url: str, args) -> dict:
         args.repository = repo_url
         config_manager = ConfigManager(args)
 
+        set_rate_limiter(RateLimitLedger(rate_limit_ledger_path(args)))
+        if args.http_cache_dir:
+            set_http_cache(HttpCache(args.http_cache_dir, args.http_cache_max_age or 0))
+
         # Choose GIT agent based on platform
+        clone_args = {
+            "clone_mode": args.clone_mode or "full",
+            "sparse_paths": args.sparse_paths,
+            "mirror_cache": (
+                MirrorCache(args.mirror_cache_dir, args.mirror_cache_quota) if args.mirror_cache_dir else None
+            ),
+        }
         if "github.com" in repo_url:
-            git_agent = GitHubAgent(repo_url)
+            git_agent = GitHubAgent(repo_url, metadata=metadata, **clone_args)
         elif "gitlab" in repo_url:
-            git_agent = GitLabAgent(repo_url)
+            git_agent = GitLabAgent(repo_url, **clone_args)
         elif "gitverse.ru" in repo_url:
-            git_agent = GitverseAgent(repo_url)
+            git_agent = GitverseAgent(repo_url, **clone_args)
         else:
             logger.error(f"Unsupported GIT platform: {repo_url}")
             return result
@@ -294,6 +316,9 @@ def main():
     parser = build_parser_from_yaml(extra_sections=["settings", "arguments", "multi-run"])
     args = parser.parse_args()
 
+    # Worker processes share one API rate-limit budget
+    set_rate_limiter(RateLimitLedger(rate_limit_ledger_path(args)))
+
     # Load table containing repository URLs
     df = load_table(args.table_path)
     repositories = df["repository"].dropna().tolist()
@@ -303,8 +328,13 @@ def main():
 
     if unprocessed_stage1:
         rich_section(f"Starting Stage 1 for {len(unprocessed_stage1)} repositories (parallel mode)")
+        # GitHub metadata of many repositories is loaded with a few GraphQL requests
+        github_metadata = GitHubMetadataLoader.load_batch([r for r in unprocessed_stage1 if "github.com" in r])
         with ProcessPoolExecutor(max_workers=os.cpu_count() // 2 or 2) as executor:
-            futures = {executor.submit(process_repository_stage1, repo, args): repo for repo in unprocessed_stage1}
+            futures = {
+                executor.submit(process_repository_stage1, repo, args, github_metadata.get(repo)): repo
+                for repo in unprocessed_stage1
+            }
             for future in as_completed(futures):
                 repo = futures[future]
                 try:
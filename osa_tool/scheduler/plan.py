@@ -25,10 +25,22 @@ EXCLUDED_TASK = {
     "delete_dir",
     "no_fork",
     "no_pull_request",
+    "clone_mode",
+    "sparse_paths",
+    "mirror_cache_dir",
+    "mirror_cache_quota",
+    "http_cache_dir",
+    "http_cache_max_age",
     "branches",
     "codecov_token",
     "max_retries",
     "scorecard",
+    "docstring_batch_size",
+    "docstring_reuse",
+    "docstring_quality_threshold",
+    "resume",
+    "docstring_diff_base",
+    "docstring_diff_callers",
 }
 
 
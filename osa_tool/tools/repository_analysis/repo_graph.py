@@ -16,6 +16,7 @@ from torch_geometric.utils import negative_sampling
 from transformers import AutoTokenizer, AutoModel
 
 from osa_tool.utils.logger import logger
+from osa_tool.utils.module_index import ModuleIndex
 
 EDGE_TYPES = ["contains", "imports", "calls"]
 NODE_TYPES = ["module", "class", "function"]
@@ -33,6 +34,7 @@ class RepositoryGraph:
         self.repo_path = repo_path.resolve()
         self.graph = nx.DiGraph()
         self.__function_name_to_node: dict[str, list[str]] = {}
+        self.__module_index = ModuleIndex(self.repo_path, [])
         self.__graph_embedder = _GraphEmbedder()
         self.__graph_enrich = _GraphEmbeddingTrainer()
 
@@ -45,6 +47,10 @@ class RepositoryGraph:
         Main entry point. Accepts a list of absolute file paths
         and returns a populated directed graph.
         """
+        source_files = list(source_files)
+        # imports are resolved to the modules of the repository by lookups, without probing the disk
+        self.__module_index = ModuleIndex(self.repo_path, source_files)
+
         for filepath in source_files:
             self._process_file(Path(filepath))
 
@@ -239,7 +245,14 @@ class RepositoryGraph:
                 self.__function_name_to_node.setdefault(name, []).append(node_id)
 
         # register import edges (module -> module)
-        for imported_module_name in visitor.imported_modules:
+        for imported_name in visitor.imported_modules:
+            imported_module_name = self.__module_index.absolute_name(filepath, imported_name) or imported_name
+            imported_file = self.__module_index.resolve(imported_module_name)
+            if imported_file is not None:
+                # modules of the repository are linked directly, their nodes are added when their files are processed
+                self.graph.add_edge(module_id, self.__module_id(Path(imported_file)), edge_type="imports")
+                continue
+
             self.graph.add_node(
                 imported_module_name,
                 node_type="module",
@@ -300,10 +313,11 @@ class _RepoVisitor(cst.CSTVisitor):
         pass  # handled via ImportFrom and ImportStar
 
     def visit_ImportFrom(self, node: cst.ImportFrom) -> None:
-        if node.module is not None:
-            module_name = self.__dotted_name(node.module)
-            if module_name:
-                self.imported_modules.append(module_name)
+        # relative imports keep their leading dots, they are resolved against the module index
+        level = "." * len(node.relative)
+        module_name = self.__dotted_name(node.module) if node.module is not None else None
+        if module_name or level:
+            self.imported_modules.append(level + (module_name or ""))
 
     def visit_Import_names(self, node: cst.Import) -> None:
         if isinstance(node, cst.Import) and isinstance(node.names, (list,)):
@@ -2,6 +2,7 @@ import os
 import re
 
 from osa_tool.config.settings import ConfigManager
+from osa_tool.core.git.content_provider import GitContentProvider
 from osa_tool.utils.utils import get_repo_tree, resolve_repo_path
 
 
@@ -12,13 +13,14 @@ class SourceRank:
     This class inspects the repository file tree and provides
     boolean signals indicating the presence of commonly expected
     project artifacts such as README, LICENSE, documentation,
-    examples, tests, and metadata files.
+    examples, tests, and metadata files. With a content provider
+    the tree is read from git objects instead of a checkout.
     """
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, provider: GitContentProvider | None = None):
         self.repo_url = config_manager.get_git_settings().repository
         self.repo_path = str(resolve_repo_path(self.repo_url))
-        self.tree = get_repo_tree(self.repo_path)
+        self.tree = get_repo_tree(self.repo_path, provider)
 
     def readme_presence(self) -> bool:
         pattern = re.compile(r"\bREADME(\.\w+)?\b", re.IGNORECASE)
@@ -42,6 +42,12 @@ class PlanEditor:
             "output",
             "no_fork",
             "no_pull_request",
+            "clone_mode",
+            "sparse_paths",
+            "mirror_cache_dir",
+            "mirror_cache_quota",
+            "http_cache_dir",
+            "http_cache_max_age",
             "temperature",
             "max_tokens",
             "context_window",
@@ -0,0 +1,153 @@
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+PYTHON_EXTENSIONS = (".py",)
+
+
+class ModuleIndex:
+    """
+    Immutable index of the Python modules of a repository.
+
+    The index is built from a single directory walk (or from an already known list of files) and maps dotted
+    module names to their files, so import resolution is a dictionary lookup instead of probing candidate paths.
+    Lookups do not touch the filesystem. A module "pkg.mod" is the file pkg/mod.py, a package "pkg" is the file
+    pkg/__init__.py.
+    """
+
+    __slots__ = ("root", "_files", "_modules", "_packages", "_names")
+
+    def __init__(self, root: str | Path, files: Iterable[str | Path], extensions: tuple[str, ...] = PYTHON_EXTENSIONS):
+        """
+        Indexes the given files.
+
+        Args:
+            root: Repository root, the module names are relative to it.
+            files: Paths of the source files under the root. Files with other extensions are ignored.
+            extensions: Extensions of the source files.
+        """
+        self.root = str(root)
+        indexed, modules, packages, names = [], {}, {}, {}
+
+        for file in files:
+            file = str(file)
+            name = module_name(os.path.relpath(file, self.root), extensions)
+            if name is None:
+                continue
+
+            indexed.append(file)
+            names[os.path.normpath(file)] = name
+            if os.path.splitext(os.path.basename(file))[0] == "__init__":
+                packages.setdefault(name, file)
+            else:
+                modules.setdefault(name, file)
+
+        self._files = tuple(indexed)
+        self._modules = modules
+        self._packages = packages
+        self._names = names
+
+    @classmethod
+    def build(cls, root: str | Path, extensions: tuple[str, ...] = PYTHON_EXTENSIONS) -> "ModuleIndex":
+        """
+        Walks the root once and indexes every source file in it.
+
+        Hidden files and directories and __pycache__ are skipped, their names can not be a part of a dotted module
+        name. The paths are joined to the root as given, e.g. a relative root gives relative paths.
+        """
+        files = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "__pycache__"]
+            files.extend(
+                os.path.join(dirpath, f) for f in filenames if f.endswith(extensions) and not f.startswith(".")
+            )
+
+        return cls(root, files, extensions)
+
+    @property
+    def files(self) -> list[str]:
+        """Indexed files, in the order they were given."""
+        return list(self._files)
+
+    def module_file(self, name: str) -> str | None:
+        """Returns the file of the module "a.b" (a/b.py), packages are not included."""
+        return self._modules.get(name)
+
+    def resolve(self, name: str) -> str | None:
+        """Returns the file of the module or, if there is no such module, of the package with the given name."""
+        return self._modules.get(name) or self._packages.get(name)
+
+    def name_of(self, file: str | Path) -> str | None:
+        """Returns the dotted module name of an indexed file."""
+        return self._names.get(os.path.normpath(str(file)))
+
+    def absolute_name(self, file: str | Path, import_name: str) -> str | None:
+        """
+        Converts an imported name of an indexed file to an absolute dotted name.
+
+        Relative names like "..pkg.mod" are resolved against the package of the file, absolute names are returned
+        as they are. None is returned for a relative import of a file that is not indexed.
+        """
+        if not import_name.startswith("."):
+            return import_name
+
+        importer = self.name_of(file)
+        if importer is None:
+            return None
+
+        level = len(import_name) - len(import_name.lstrip("."))
+        is_package = os.path.splitext(os.path.basename(str(file)))[0] == "__init__"
+        return relative_import_name(importer, level, import_name[level:], is_package)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._modules or name in self._packages
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def module_name(relative_path: str, extensions: tuple[str, ...] = PYTHON_EXTENSIONS) -> str | None:
+    """
+    Converts a file path relative to the repository root to its dotted module name.
+
+    Returns:
+        str | None: "pkg.mod" for pkg/mod.py, "pkg" for pkg/__init__.py, None for files with other extensions.
+    """
+    normalized = relative_path.replace("\\", "/")
+    for extension in extensions:
+        if normalized.endswith(extension):
+            normalized = normalized[: -len(extension)]
+            break
+    else:
+        return None
+
+    name = normalized.strip("/").replace("/", ".")
+    if name == "__init__":
+        return ""
+    if name.endswith(".__init__"):
+        name = name[: -len(".__init__")]
+    return name
+
+
+def relative_import_name(importer: str, level: int, module: str | None = None, is_package: bool = False) -> str:
+    """
+    Resolves the dotted name of a relative import.
+
+    Args:
+        importer: Dotted name of the importing module.
+        level: Number of leading dots of the import.
+        module: Module after the dots, if any.
+        is_package: The importer is a package (its __init__ file), so a single dot refers to the package itself.
+
+    Returns:
+        str: The absolute dotted name. Levels above the repository root stop at the root.
+    """
+    parts = importer.split(".") if importer else []
+    if not is_package:
+        parts = parts[:-1]
+
+    parent_levels = max(level - 1, 0)
+    base = parts[: max(len(parts) - parent_levels, 0)]
+    if module:
+        base = base + module.split(".")
+    return ".".join(part for part in base if part)
@@ -3,7 +3,9 @@ import os
 import re
 import shutil
 import stat
-from pathlib import Path
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Protocol
 from urllib.parse import urlparse
 
 from rich.console import Console
@@ -51,6 +53,43 @@ def _remove_tree(path: str | Path) -> None:
     shutil.rmtree(target, onerror=on_rm_error)
 
 
+@contextmanager
+def file_lock(path: str | Path):
+    """
+    Holds an exclusive lock of the file while the block runs, other processes locking it wait.
+
+    The lock file is created if it does not exist and is kept afterwards. Works on Windows and Unix-like systems.
+    """
+    lock_path = Path(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            # LK_LOCK retries for 10 seconds only
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def _looks_like_file_path(relative_path: str) -> bool:
     """
     Best-effort distinction between repository files and directories for browse URLs.
@@ -418,12 +457,19 @@ def is_path(path_str: str) -> bool:
         return False
 
 
-def get_repo_tree(repo_path: str) -> str:
+class FileListProvider(Protocol):
+    """Files of a repository revision that are not read from a checkout, such as a GitContentProvider."""
+
+    def list_files(self) -> list[str]: ...
+
+
+def get_repo_tree(repo_path: str, provider: FileListProvider | None = None) -> str:
     """
     Builds a text representation of the project file tree, excluding the .git directory.
 
     Args:
         repo_path: Path to the repository being explored.
+        provider: Reads the tree from the commit of the content provider instead of the filesystem.
 
     Returns:
         str: A text representation of the repository's file tree with relative paths to files and directories,
@@ -517,6 +563,18 @@ def get_repo_tree(repo_path: str) -> str:
         ".nb",
     }
 
+    if provider is not None:
+        files = {PurePosixPath(path) for path in provider.list_files()}
+        directories = {parent for path in files for parent in path.parents if parent != PurePosixPath(".")}
+        lines = []
+        for path in sorted(files | directories):
+            if any(part.lower() in {".git", "log", "logs"} for part in path.parts):
+                continue
+            if path in files and path.suffix.lower() in excluded_extensions:
+                continue
+            lines.append(str(path))
+        return "\n".join(lines)
+
     lines = []
     for path in sorted(repo_path.rglob("*")):
         if any(part.lower() in {".git", "log", "logs"} for part in path.parts):
@@ -0,0 +1,118 @@
+"""
+Benchmark of the parser results sent back from the worker processes.
+
+Every file is parsed once, and its result is pickled the way the worker pool returns it, in three layouts:
+    copied  - symbols as dictionaries with their own copies of the source code (the former layout),
+    whole   - symbols with offsets into the whole file buffer,
+    spans   - symbols with offsets into a buffer of only the byte ranges they cover (the current layout).
+Each layout is then unpickled in a fresh process, which reports the memory it retains and the growth of its RSS
+(read from /proc, so the benchmark runs on Linux).
+
+Usage:
+    python -m tests.integration.run_source_pickling_benchmark [--path osa_tool]
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import pickle
+import tempfile
+import tracemalloc
+
+from osa_tool.operations.codebase.docstring_generation.core.osa_parser import OSA_TreeSitter
+
+LAYOUTS = ("copied", "whole", "spans")
+
+
+def _symbols(result: dict):
+    for item in result["structure"]:
+        if item["type"] == "function":
+            yield item["details"]
+        else:
+            yield from item["methods"]
+
+
+def _copied(result: dict) -> dict:
+    structure = []
+    for item in result["structure"]:
+        if item["type"] == "function":
+            structure.append({"type": "function", "details": {**item["details"]}})
+        else:
+            structure.append({**item, "methods": [{**method} for method in item["methods"]]})
+    return {"structure": structure, "imports": result["imports"]}
+
+
+def dump_layout(results: list[dict], layout: str) -> list[bytes]:
+    """Pickles every result the way a worker returns it, in the given layout."""
+    payloads = []
+    for result in results:
+        if layout == "copied":
+            payloads.append(pickle.dumps(_copied(result)))
+            continue
+
+        buffers = {id(symbol.buffer): symbol.buffer for symbol in _symbols(result)}.values()
+        if layout == "whole":
+            for buffer in buffers:
+                buffer.cover(0, len(buffer.bytes))
+        payloads.append(pickle.dumps(result))
+        if layout == "whole":
+            for buffer in buffers:
+                buffer.spans.pop()
+    return payloads
+
+
+def _rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def load_layout(path: str) -> tuple[int, int]:
+    """Unpickles the results of a layout, returns the retained traced memory and the growth of the RSS."""
+    gc.collect()
+    rss_before = _rss()
+    tracemalloc.start()
+
+    results = []
+    with open(path, "rb") as f:
+        for _ in range(pickle.load(f)):
+            results.append(pickle.loads(pickle.load(f)))
+    gc.collect()
+
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, _rss() - rss_before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="osa_tool")
+    args = parser.parse_args()
+
+    ts = OSA_TreeSitter(args.path)
+    files, _ = ts.files_list(args.path)
+    results = [ts.extract_structure(file) for file in files]
+    symbols = sum(1 for result in results for _ in _symbols(result))
+    print(f"{len(files)} files, {symbols} functions and methods")
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout in LAYOUTS:
+            payloads = dump_layout(results, layout)
+            path = os.path.join(tmp, f"{layout}.pickle")
+            with open(path, "wb") as f:
+                pickle.dump(len(payloads), f)
+                for payload in payloads:
+                    pickle.dump(payload, f)
+
+            with context.Pool(1) as pool:
+                retained, rss = pool.apply(load_layout, (path,))
+            size = sum(len(payload) for payload in payloads)
+            print(
+                f"{layout:>6}: pickled {size / 1e6:.2f}MB, "
+                f"retained after unpickling {retained / 1e6:.2f}MB, RSS growth {rss / 1e6:.2f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark of JSDoc insertion into a large generated TypeScript file.
+
+Usage:
+    python -m tests.integration.run_ts_insertion_benchmark [--lines 30000]
+"""
+
+import argparse
+import time
+
+from osa_tool.operations.codebase.docstring_generation.insert.ts_js_augmentor import TSJSAugmentor
+
+CLASS_TEMPLATE = """export class Service{index} {{
+  private readonly cache: Map<string, number> = new Map();
+
+  constructor(private readonly name: string) {{}}
+
+  public async load{index}(key: string): Promise<number> {{
+    const value = this.cache.get(key);
+    return value ?? 0;
+  }}
+
+  store{index}(key: string, value: number): void {{
+    this.cache.set(key, value);
+  }}
+}}
+
+export function helper{index}(value: number): number {{
+  return value * {index};
+}}
+
+"""
+
+
+def build_source(lines: int) -> tuple[str, dict]:
+    """Generates a TypeScript module of roughly the given size and docstrings for all of its symbols."""
+    block_lines = CLASS_TEMPLATE.count("\n")
+    blocks = max(1, lines // block_lines)
+    source = "".join(CLASS_TEMPLATE.format(index=i) for i in range(blocks))
+    docstrings = {
+        "classes": [(f"Service number {i}.", f"Service{i}") for i in range(blocks)],
+        "functions": [(f"Multiplies the value by {i}.", {"method_name": f"helper{i}"}) for i in range(blocks)],
+        "methods": [
+            (doc, {"method_name": f"{name}{i}", "class_name": f"Service{i}"})
+            for i in range(blocks)
+            for name, doc in (("load", "Loads a value."), ("store", "Stores a value."))
+        ],
+    }
+    return source, docstrings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=30000)
+    args = parser.parse_args()
+
+    source, docstrings = build_source(args.lines)
+    symbols = sum(len(items) for items in docstrings.values())
+
+    started = time.perf_counter()
+    result = TSJSAugmentor().augment("generated.ts", source, docstrings)["generated.ts"]
+    elapsed = time.perf_counter() - started
+
+    print(f"{source.count(chr(10))} lines, {symbols} docstrings: {elapsed:.3f}s")
+    print(f"{result.count('/**')} JSDoc blocks in the result")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pytest
+from git import Repo
+
+from osa_tool.core.git.content_provider import GitContentProvider
+from osa_tool.core.git.git_agent import LocalGitAgent
+from osa_tool.utils.utils import get_repo_tree
+
+
+def _commit(repo: Repo, files: dict[str, bytes]) -> str:
+    for path, content in files.items():
+        file = os.path.join(repo.working_tree_dir, path)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(file, "wb") as f:
+            f.write(content)
+    repo.index.add(list(files))
+    return repo.index.commit("update").hexsha
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = Repo.init(tmp_path / "work", initial_branch="main")
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    _commit(
+        repo,
+        {
+            "README.md": b"# Project\n",
+            "src/app.py": "print('привет')\n".encode("utf-8"),
+            "docs/logo.png": b"\x89PNG",
+            "logs/run.txt": b"log\n",
+        },
+    )
+    return repo
+
+
+def test_reads_files_of_commit_from_bare_repository(tmp_path, repo):
+    # Arrange
+    first = repo.head.commit.hexsha
+    _commit(repo, {"README.md": b"# Changed\n"})
+    bare = Repo.clone_from(repo.working_tree_dir, tmp_path / "mirror.git", bare=True)
+
+    # Act
+    with GitContentProvider(bare.git_dir, first) as provider:
+        files = provider.list_files()
+        readme = provider.read_text("README.md")
+        source = provider.read_text("./src/app.py")
+
+        # Assert
+        assert sorted(files) == ["README.md", "docs/logo.png", "logs/run.txt", "src/app.py"]
+        assert readme == "# Project\n"
+        assert source == "print('привет')\n"
+        assert provider.exists("docs/logo.png")
+        assert not provider.exists("src")
+        with pytest.raises(FileNotFoundError):
+            provider.read_bytes("missing.txt")
+
+
+def test_serves_concurrent_reads_from_one_provider(repo):
+    # Arrange
+    _commit(repo, {f"pkg/module_{i}.py": f"value = {i}\n".encode("utf-8") for i in range(20)})
+    results = {}
+
+    # Act
+    with GitContentProvider(repo.git_dir) as provider:
+
+        def read(i):
+            results[i] = provider.read_text(f"pkg/module_{i}.py")
+
+        threads = [threading.Thread(target=read, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Assert
+    assert results == {i: f"value = {i}\n" for i in range(20)}
+
+
+def test_repo_tree_from_provider_matches_checkout(repo):
+    # Act
+    with GitContentProvider(repo.git_dir) as provider:
+        tree = get_repo_tree(repo.working_tree_dir, provider)
+
+    # Assert
+    assert tree == get_repo_tree(repo.working_tree_dir)
+    assert tree.splitlines() == ["README.md", "docs", "src", "src/app.py"]
+
+
+def test_local_agent_reads_working_tree(repo):
+    # Arrange
+    agent = LocalGitAgent(repo.working_tree_dir)
+
+    # Act
+    with agent.content_provider() as provider:
+        tree = get_repo_tree(repo.working_tree_dir, provider)
+
+    # Assert
+    assert provider is None
+    assert tree == get_repo_tree(repo.working_tree_dir)
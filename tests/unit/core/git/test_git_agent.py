@@ -1,11 +1,15 @@
 import os
 import tempfile
+from pathlib import Path
 from unittest.mock import Mock, patch, ANY, MagicMock
 
 import pytest
 from git import Repo, GitCommandError, InvalidGitRepositoryError
 
+from osa_tool.core.git.change_tracker import get_change_tracker, track_changes
 from osa_tool.core.git.git_agent import GitHubAgent, GitverseAgent, GitLabAgent, SourceCraftAgent, LocalGitAgent
+from osa_tool.core.git.mirror_cache import MirrorCache
+from osa_tool.core.git.rate_limit import RateLimitDeferred
 from osa_tool.core.git.metadata import (
     GitHubMetadataLoader,
     GitverseMetadataLoader,
@@ -108,6 +112,147 @@ def test_git_agent_clone_repository_failure_git_error(git_agent_base_setup):
             agent.clone_repository()
 
 
+@pytest.fixture
+def bare_remote(tmp_path):
+    """A local bare repository with three commits, served over file:// so clone filters and depth apply."""
+    work = tmp_path / "work"
+    work.mkdir()
+    repo = Repo.init(work, initial_branch="main")
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    for i, path in enumerate(["README.md", "src/app.py", "docs/index.md"]):
+        file = work / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(f"content {i}\n")
+        repo.index.add([path])
+        repo.index.commit(f"commit {i}")
+
+    bare = tmp_path / "remote.git"
+    Repo.clone_from(str(work), str(bare), bare=True).config_writer().set_value(
+        "uploadpack", "allowFilter", "true"
+    ).release()
+    return bare.as_uri()
+
+
+def _clone_with_mode(agent, remote_url, mode, sparse_paths=None):
+    agent.clone_mode = mode
+    agent.sparse_paths = sparse_paths or []
+    agent.base_branch = "main"
+    with patch.object(agent, "_check_branch_existence", return_value=False):
+        with patch.object(agent, "_get_unauth_url", return_value=remote_url):
+            agent.clone_repository()
+    return agent.repo
+
+
+def test_git_agent_shallow_clone_deepens_history_on_demand(git_agent_base_setup, bare_remote):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+
+    # Act
+    repo = _clone_with_mode(agent, bare_remote, "shallow")
+    shallow_count = repo.git.rev_list("--count", "HEAD")
+    agent.ensure_history(depth=2)
+    deepened_count = repo.git.rev_list("--count", "HEAD")
+    agent.ensure_history()
+
+    # Assert
+    assert shallow_count == "1"
+    assert deepened_count == "2"
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+    assert repo.git.rev_parse("--is-shallow-repository") == "false"
+
+
+def test_git_agent_blobless_clone_keeps_history(git_agent_base_setup, bare_remote):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+
+    # Act
+    repo = _clone_with_mode(agent, bare_remote, "blobless")
+
+    # Assert
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+    assert repo.git.config("remote.origin.partialclonefilter") == "blob:none"
+    assert os.path.exists(os.path.join(agent.clone_dir, "docs", "index.md"))
+
+
+def test_git_agent_sparse_clone_checks_out_only_requested_paths(git_agent_base_setup, bare_remote):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+
+    # Act
+    _clone_with_mode(agent, bare_remote, "sparse", sparse_paths=["src"])
+
+    # Assert
+    assert os.path.exists(os.path.join(agent.clone_dir, "README.md"))
+    assert os.path.exists(os.path.join(agent.clone_dir, "src", "app.py"))
+    assert not os.path.exists(os.path.join(agent.clone_dir, "docs"))
+
+
+def test_git_agent_clones_from_mirror_cache(git_agent_base_setup, bare_remote, tmp_path):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+    agent.mirror_cache = MirrorCache(tmp_path / "mirrors")
+
+    # Act
+    repo = _clone_with_mode(agent, bare_remote, "full")
+
+    # Assert
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+    assert repo.remotes.origin.url == bare_remote
+    assert agent.mirror_cache.mirror_path(agent.repo_url).exists()
+
+
+def test_git_agent_clones_remote_when_mirror_fails(git_agent_base_setup, bare_remote, tmp_path):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+    agent.mirror_cache = MirrorCache(tmp_path / "mirrors")
+
+    # Act
+    with patch.object(MirrorCache, "mirror", side_effect=OSError("disk full")):
+        repo = _clone_with_mode(agent, bare_remote, "full")
+
+    # Assert
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+
+
+def test_git_agent_reads_contents_from_mirror_without_checkout(git_agent_base_setup, bare_remote, tmp_path):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+    agent.mirror_cache = MirrorCache(tmp_path / "mirrors")
+    agent.base_branch = "main"
+
+    # Act
+    with patch.object(agent, "_get_unauth_url", return_value=bare_remote):
+        with agent.content_provider() as provider:
+            files = sorted(provider.list_files())
+            readme = provider.read_text("README.md")
+
+    # Assert
+    assert files == ["README.md", "docs/index.md", "src/app.py"]
+    assert readme == "content 0\n"
+    assert not os.path.exists(agent.clone_dir)
+
+
+def test_git_agent_content_provider_requires_clone_or_mirror(git_agent_base_setup):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="not cloned"):
+        with agent.content_provider():
+            pass
+
+
+def test_git_agent_rejects_unknown_clone_mode(mock_repository_metadata, repo_info):
+    # Arrange
+    platform, owner, repo_name, repo_url = repo_info
+
+    # Act & Assert
+    with patch.object(GitHubMetadataLoader, "load_data", return_value=mock_repository_metadata):
+        with pytest.raises(ValueError, match="Unknown clone mode"):
+            GitHubAgent(repo_url, clone_mode="mirror")
+
+
 def test_git_agent_create_and_checkout_branch_new(git_agent_base_setup, mock_repo):
     # Arrange
     agent, _, _, _ = git_agent_base_setup
@@ -186,6 +331,135 @@ def test_git_agent_commit_and_push_changes_nothing_to_commit(git_agent_base_setu
         assert result is False
 
 
+def _write(path, content="changed\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.mark.parametrize("pathspec_args_limit", [100, 1])
+def test_git_agent_commit_stages_only_tracked_changes(git_agent_base_setup, bare_remote, pathspec_args_limit):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+    repo = _clone_with_mode(agent, bare_remote, "full")
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    agent.fork_url = bare_remote
+    agent.PATHSPEC_ARGS_LIMIT = pathspec_args_limit
+    agent.create_and_checkout_branch()
+    root = Path(agent.clone_dir)
+    _write(root / ".gitignore", "*.log\n")
+    _write(root / "README.md")
+    _write(root / "CONTRIBUTING.md")
+    _write(root / "debug.log")
+    (root / "src" / "app.py").unlink()
+    (root / "docs").rename(root / "documentation")
+    # untracked build output that OSA did not write
+    _write(root / "build" / "artifact.bin")
+    track_changes(*(root / path for path in [".gitignore", "README.md", "CONTRIBUTING.md", "debug.log"]))
+    track_changes(root / "src" / "app.py", root / "docs", root / "documentation", root / "never-written.md")
+
+    # Act
+    with patch.object(agent, "wait_for_fork"), patch.object(agent, "_get_auth_url", return_value=bare_remote):
+        result = agent.commit_and_push_changes(commit_message="Test commit")
+
+    # Assert
+    assert result is True
+    changes = repo.git.show("--name-status", "--format=", "HEAD").splitlines()
+    assert sorted(changes) == [
+        "A\t.gitignore",
+        "A\tCONTRIBUTING.md",
+        "D\tsrc/app.py",
+        "M\tREADME.md",
+        "R100\tdocs/index.md\tdocumentation/index.md",
+    ]
+    assert repo.untracked_files == ["build/artifact.bin"]
+    assert get_change_tracker().pending(agent.clone_dir) == []
+
+
+@pytest.mark.parametrize("tracked", [True, False])
+def test_git_agent_sparse_commit_stages_paths_outside_of_sparse_checkout(git_agent_base_setup, bare_remote, tracked):
+    # Arrange
+    agent, platform, repo_url, temp_dir = git_agent_base_setup
+    repo = _clone_with_mode(agent, bare_remote, "sparse", sparse_paths=["src"])
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    agent.fork_url = bare_remote
+    agent.create_and_checkout_branch()
+    root = Path(agent.clone_dir)
+    _write(root / "src" / "app.py")
+    _write(root / "docs" / "guide.md")
+    if tracked:
+        track_changes(root / "src" / "app.py", root / "docs" / "guide.md")
+
+    # Act
+    with patch.object(agent, "wait_for_fork"), patch.object(agent, "_get_auth_url", return_value=bare_remote):
+        result = agent.commit_and_push_changes(commit_message="Test commit")
+
+    # Assert
+    assert result is True
+    changes = repo.git.show("--name-status", "--format=", "HEAD").splitlines()
+    assert sorted(changes) == ["A\tdocs/guide.md", "M\tsrc/app.py"]
+    # files outside of the sparse-checkout definition are not checked out, so they are not deleted either
+    assert "docs/index.md" in repo.git.ls_tree("-r", "--name-only", "HEAD").splitlines()
+
+
+def test_git_agent_wait_for_fork_backs_off_until_ready(git_agent_base_setup):
+    # Arrange
+    agent, _, _, _ = git_agent_base_setup
+    agent.fork_url = "https://github.com/user/test-repo"
+    agent._fork_pending = True
+
+    # Act
+    with (
+        patch.object(agent, "_fork_api_ready", side_effect=[False, True, True]),
+        patch.object(agent, "_fork_git_ready", side_effect=[False, True]),
+        patch("osa_tool.core.git.git_agent.time.sleep") as mock_sleep,
+    ):
+        ready = agent.wait_for_fork()
+
+    # Assert
+    assert ready is True
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+    assert agent.wait_for_fork() is True
+
+
+def test_git_agent_wait_for_fork_gives_up_after_timeout(git_agent_base_setup):
+    # Arrange
+    agent, _, _, _ = git_agent_base_setup
+    agent.fork_url = "https://github.com/user/test-repo"
+    agent._fork_pending = True
+
+    # Act
+    with (
+        patch.object(agent, "_fork_api_ready", return_value=False),
+        patch("osa_tool.core.git.git_agent.time.sleep") as mock_sleep,
+    ):
+        ready = agent.wait_for_fork(timeout=0)
+
+    # Assert
+    assert ready is False
+    mock_sleep.assert_not_called()
+
+
+def test_git_agent_push_waits_for_created_fork(git_agent_base_setup, mock_repo):
+    # Arrange
+    agent, _, _, _ = git_agent_base_setup
+    agent.repo = mock_repo
+    agent.fork_url = "https://github.com/user/test-repo"
+    agent._fork_pending = True
+
+    # Act
+    with (
+        patch.object(agent, "wait_for_fork") as mock_wait,
+        patch.object(agent, "_get_auth_url", return_value="https://token@github.com/user/test-repo.git"),
+    ):
+        agent.commit_and_push_changes(branch="osa_tool")
+
+    # Assert
+    mock_wait.assert_called_once_with()
+    mock_repo.git.push.assert_called_once()
+
+
 def test_git_agent_upload_report(git_agent_base_setup, mock_repo, temp_clone_dir):
     # Arrange
     agent, _, _, _ = git_agent_base_setup
@@ -248,7 +522,7 @@ def test_github_agent_create_fork_success(github_agent_instance, mock_requests_r
 
     # Act
     with patch.dict(os.environ, {"GIT_TOKEN": "any_token_for_env"}):
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             github_agent_instance.create_fork()
 
             # Assert
@@ -265,7 +539,7 @@ def test_github_agent_create_fork_failure(github_agent_instance, mock_requests_r
 
     # Act
     with patch.dict(os.environ, {"GIT_TOKEN": "any_token_for_env"}):
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(ValueError, match=r"API operation 'creating GitHub fork' failed with status 401"):
                 github_agent_instance.create_fork()
 
@@ -278,7 +552,10 @@ def test_github_agent_star_repository_already_starred(github_agent_instance, moc
 
     # Act
     with patch.dict(os.environ, {"GIT_TOKEN": "any_token_for_env"}):
-        with patch("requests.get", return_value=mock_response_check) as mock_get, patch("requests.put") as mock_put:
+        with (
+            patch("requests.Session.get", return_value=mock_response_check) as mock_get,
+            patch("requests.Session.put") as mock_put,
+        ):
             github_agent_instance.star_repository()
 
             # Assert
@@ -296,8 +573,8 @@ def test_github_agent_star_repository_success(github_agent_instance, mock_reques
     # Act
     with patch.dict(os.environ, {"GIT_TOKEN": "any_token_for_env"}):
         with (
-            patch("requests.get", return_value=mock_response_check) as mock_get,
-            patch("requests.put", return_value=mock_response_put) as mock_put,
+            patch("requests.Session.get", return_value=mock_response_check) as mock_get,
+            patch("requests.Session.put", return_value=mock_response_put) as mock_put,
         ):
             github_agent_instance.star_repository()
 
@@ -317,8 +594,8 @@ def test_github_agent_star_repository_failure_non_critical(
     # Act
     with patch.dict(os.environ, {"GIT_TOKEN": "any_token_for_env"}):
         with (
-            patch("requests.get", return_value=mock_response_check) as mock_get,
-            patch("requests.put", return_value=mock_response_star) as mock_put,
+            patch("requests.Session.get", return_value=mock_response_check) as mock_get,
+            patch("requests.Session.put", return_value=mock_response_star) as mock_put,
         ):
             github_agent_instance.star_repository()
             # Assert
@@ -326,6 +603,19 @@ def test_github_agent_star_repository_failure_non_critical(
             mock_put.assert_called_once()
 
 
+def test_github_agent_star_repository_deferred_by_rate_limit(github_agent_instance):
+    # Arrange
+    deferred = RateLimitDeferred("10/5000 requests left")
+
+    # Act
+    with patch.dict(os.environ, {"GIT_TOKEN": "any_token_for_env"}):
+        with patch("osa_tool.core.git.git_agent.request_with_retry", side_effect=deferred) as mock_request:
+            github_agent_instance.star_repository()
+
+    # Assert
+    mock_request.assert_called_once()
+
+
 def test_github_agent_create_pull_request_update_reports(
     github_agent_instance, mock_repo, mock_requests_response_factory, repo_info
 ):
@@ -349,8 +639,8 @@ def test_github_agent_create_pull_request_update_reports(
     # Act
     with patch.dict(os.environ, {"GIT_TOKEN": "any_token"}):
         with (
-            patch("osa_tool.core.git.git_agent.requests.get", return_value=mock_get_response),
-            patch("osa_tool.core.git.git_agent.requests.patch", return_value=mock_patch_response) as mock_patch,
+            patch("osa_tool.core.git.git_agent.requests.Session.get", return_value=mock_get_response),
+            patch("osa_tool.core.git.git_agent.requests.Session.patch", return_value=mock_patch_response) as mock_patch,
         ):
             github_agent_instance.create_pull_request(changes=True)
 
@@ -372,6 +662,19 @@ def gitlab_agent_instance(temp_clone_dir, mock_repository_metadata, repo_info, m
         yield agent
 
 
+@pytest.mark.parametrize("mock_config_manager", ["gitlab"], indirect=True)
+def test_gitlab_agent_star_repository_deferred_by_rate_limit(gitlab_agent_instance):
+    # Arrange
+    deferred = RateLimitDeferred("10/2000 requests left")
+
+    # Act
+    with patch("osa_tool.core.git.git_agent.request_with_retry", side_effect=deferred) as mock_request:
+        gitlab_agent_instance.star_repository()
+
+    # Assert
+    mock_request.assert_called_once()
+
+
 @pytest.mark.parametrize("mock_config_manager", ["gitlab"], indirect=True)
 def test_gitlab_agent_create_fork_success(
     gitlab_agent_instance, mock_requests_response_factory, mock_repository_metadata, repo_info, mock_config_manager
@@ -391,9 +694,9 @@ def test_gitlab_agent_create_fork_success(
     with patch.dict(os.environ, {"GITLAB_TOKEN": "any_token_for_env"}):
         with (
             patch(
-                "requests.get", side_effect=[mock_user_response, mock_project_response, mock_forks_response]
+                "requests.Session.get", side_effect=[mock_user_response, mock_project_response, mock_forks_response]
             ) as mock_get,
-            patch("requests.post", return_value=mock_fork_response) as mock_post,
+            patch("requests.Session.post", return_value=mock_fork_response) as mock_post,
         ):
             gitlab_agent_instance.create_fork()
 
@@ -433,10 +736,10 @@ def test_gitlab_agent_create_pull_request_update_reports(
     with patch.dict(os.environ, {"GITLAB_TOKEN": "any_token"}):
         with (
             patch(
-                "osa_tool.core.git.git_agent.requests.get",
+                "osa_tool.core.git.git_agent.requests.Session.get",
                 side_effect=[mock_project_response, mock_mr_list_response],
             ),
-            patch("osa_tool.core.git.git_agent.requests.put", return_value=mock_put_response) as mock_put,
+            patch("osa_tool.core.git.git_agent.requests.Session.put", return_value=mock_put_response) as mock_put,
         ):
             gitlab_agent_instance.create_pull_request(changes=True)
 
@@ -469,8 +772,8 @@ def test_gitverse_agent_create_fork_success(gitverse_agent_instance, mock_reques
 
     with patch.dict(os.environ, {"GITVERSE_TOKEN": "any_token_for_env"}):
         with (
-            patch("requests.get", side_effect=[mock_user_response, mock_fork_check_response]) as mock_get,
-            patch("requests.post", return_value=mock_fork_response) as mock_post,
+            patch("requests.Session.get", side_effect=[mock_user_response, mock_fork_check_response]) as mock_get,
+            patch("requests.Session.post", return_value=mock_fork_response) as mock_post,
         ):
             # Act
             gitverse_agent_instance.create_fork()
@@ -498,8 +801,8 @@ def test_gitverse_agent_star_repository_success(gitverse_agent_instance, mock_re
 
     with patch.dict(os.environ, {"GITVERSE_TOKEN": "any_token_for_env"}):
         with (
-            patch("requests.get", return_value=mock_response_check) as mock_get,
-            patch("requests.put", return_value=mock_response_put) as mock_put,
+            patch("requests.Session.get", return_value=mock_response_check) as mock_get,
+            patch("requests.Session.put", return_value=mock_response_put) as mock_put,
         ):
             # Act
             gitverse_agent_instance.star_repository()
@@ -509,6 +812,19 @@ def test_gitverse_agent_star_repository_success(gitverse_agent_instance, mock_re
             mock_put.assert_called_once()
 
 
+def test_gitverse_agent_star_repository_deferred_by_rate_limit(gitverse_agent_instance):
+    # Arrange
+    deferred = RateLimitDeferred("10/5000 requests left")
+
+    # Act
+    with patch.dict(os.environ, {"GITVERSE_TOKEN": "any_token_for_env"}):
+        with patch("osa_tool.core.git.git_agent.request_with_retry", side_effect=deferred) as mock_request:
+            gitverse_agent_instance.star_repository()
+
+    # Assert
+    mock_request.assert_called_once()
+
+
 def test_gitverse_agent_star_repository_already_starred(
     gitverse_agent_instance, mock_requests_response_factory, repo_info
 ):
@@ -516,7 +832,10 @@ def test_gitverse_agent_star_repository_already_starred(
     mock_response_check = mock_requests_response_factory(status_code=204)
 
     with patch.dict(os.environ, {"GITVERSE_TOKEN": "any_token_for_env"}):
-        with patch("requests.get", return_value=mock_response_check) as mock_get, patch("requests.put") as mock_put:
+        with (
+            patch("requests.Session.get", return_value=mock_response_check) as mock_get,
+            patch("requests.Session.put") as mock_put,
+        ):
             # Act
             gitverse_agent_instance.star_repository()
 
@@ -551,8 +870,8 @@ def test_sourcecraft_agent_create_fork_success(sourcecraft_agent_instance, mock_
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
         with (
-            patch("requests.get", return_value=mock_user_response),
-            patch("requests.post", return_value=mock_fork_response) as mock_post,
+            patch("requests.Session.get", return_value=mock_user_response),
+            patch("requests.Session.post", return_value=mock_fork_response) as mock_post,
         ):
             sourcecraft_agent_instance.create_fork()
 
@@ -576,8 +895,8 @@ def test_sourcecraft_agent_create_fork_self_owned(
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
         with (
-            patch("requests.get", return_value=mock_user_response),
-            patch("requests.post") as mock_post,
+            patch("requests.Session.get", return_value=mock_user_response),
+            patch("requests.Session.post") as mock_post,
         ):
             sourcecraft_agent_instance.create_fork()
 
@@ -595,8 +914,8 @@ def test_sourcecraft_agent_create_fork_failure(sourcecraft_agent_instance, mock_
     # Act & Assert
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
         with (
-            patch("requests.get", return_value=mock_user_response),
-            patch("requests.post", return_value=mock_fork_response),
+            patch("requests.Session.get", return_value=mock_user_response),
+            patch("requests.Session.post", return_value=mock_fork_response),
         ):
             with pytest.raises(ValueError, match=r"API operation 'creating SourceCraft fork' failed"):
                 sourcecraft_agent_instance.create_fork()
@@ -605,7 +924,7 @@ def test_sourcecraft_agent_create_fork_failure(sourcecraft_agent_instance, mock_
 @pytest.mark.parametrize("mock_config_manager", ["sourcecraft"], indirect=True)
 def test_sourcecraft_agent_star_repository_noop(sourcecraft_agent_instance):
     # SourceCraft has no starring API - must not call any HTTP endpoint
-    with patch("requests.put") as mock_put, patch("requests.get") as mock_get:
+    with patch("requests.Session.put") as mock_put, patch("requests.Session.get") as mock_get:
         sourcecraft_agent_instance.star_repository()
 
         # Assert
@@ -631,8 +950,8 @@ def test_sourcecraft_agent_create_pull_request_new(
 
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
-        with patch("requests.get", side_effect=[mock_user_response, mock_list_response]):
-            with patch("requests.post", return_value=mock_create_response) as mock_post:
+        with patch("requests.Session.get", side_effect=[mock_user_response, mock_list_response]):
+            with patch("requests.Session.post", return_value=mock_create_response) as mock_post:
                 with patch.object(sourcecraft_agent_instance, "get_attachment_branch_files", return_value=[]):
                     sourcecraft_agent_instance.create_pull_request(changes=True)
 
@@ -662,8 +981,8 @@ def test_sourcecraft_agent_create_pull_request_new_with_reports(
 
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
-        with patch("requests.get", side_effect=[mock_user_response, mock_list_response]):
-            with patch("requests.post", return_value=mock_create_response) as mock_post:
+        with patch("requests.Session.get", side_effect=[mock_user_response, mock_list_response]):
+            with patch("requests.Session.post", return_value=mock_create_response) as mock_post:
                 with patch.object(
                     sourcecraft_agent_instance, "get_attachment_branch_files", return_value=["report.pdf"]
                 ):
@@ -694,9 +1013,9 @@ def test_sourcecraft_agent_create_pull_request_dedup(
 
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
-        with patch("requests.get", side_effect=[mock_user_response, mock_list_response]):
-            with patch("requests.post") as mock_post:
-                with patch("requests.patch") as mock_patch:
+        with patch("requests.Session.get", side_effect=[mock_user_response, mock_list_response]):
+            with patch("requests.Session.post") as mock_post:
+                with patch("requests.Session.patch") as mock_patch:
                     sourcecraft_agent_instance.create_pull_request(changes=True)
 
                     # Assert - no new PR created, no unnecessary PATCH
@@ -726,9 +1045,9 @@ def test_sourcecraft_agent_create_pull_request_update_reports(
 
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
-        with patch("requests.get", side_effect=[mock_user_response, mock_list_response]):
-            with patch("requests.post") as mock_post:
-                with patch("requests.patch", return_value=mock_update_response) as mock_patch:
+        with patch("requests.Session.get", side_effect=[mock_user_response, mock_list_response]):
+            with patch("requests.Session.post") as mock_post:
+                with patch("requests.Session.patch", return_value=mock_update_response) as mock_patch:
                     sourcecraft_agent_instance.create_pull_request(changes=True)
 
                     # Assert - no new PR, description updated with both report links
@@ -748,7 +1067,7 @@ def test_sourcecraft_agent_update_about_section(sourcecraft_agent_instance, mock
 
     # Act
     with patch.dict(os.environ, {"SOURCECRAFT_TOKEN": "any_token"}):
-        with patch("requests.patch", return_value=mock_response) as mock_patch:
+        with patch("requests.Session.patch", return_value=mock_response) as mock_patch:
             sourcecraft_agent_instance.update_about_section({"description": "Test description"})
 
             # Assert - called twice: once for base repo, once for fork
@@ -0,0 +1,92 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from osa_tool.core.git.http_cache import HttpCache
+from osa_tool.core.git.request_utils import request_with_retry, set_http_cache
+
+URL = "https://api.example.com/repos/owner/repo"
+
+
+def make_response(status_code: int, body: dict | None = None, headers: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = URL
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b""
+    return response
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    cache = HttpCache(tmp_path / "http_cache")
+    set_http_cache(cache)
+    yield cache
+    set_http_cache(None)
+
+
+def test_revalidates_with_etag_and_serves_cached_body_on_304(http_cache):
+    # Arrange
+    responses = [
+        make_response(200, {"name": "repo"}, {"ETag": '"v1"', "Content-Type": "application/json"}),
+        make_response(304, headers={"ETag": '"v1"'}),
+    ]
+
+    # Act
+    with patch("osa_tool.core.git.request_utils.requests.Session.get", side_effect=responses) as mock_get:
+        first = request_with_retry("get", URL, headers={"Authorization": "token a"})
+        second = request_with_retry("get", URL, headers={"Authorization": "token a"})
+
+    # Assert
+    assert first.json() == second.json() == {"name": "repo"}
+    assert second.status_code == 200
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert http_cache.revalidated == 1
+
+
+def test_serves_fresh_entry_without_request(http_cache):
+    # Arrange
+    http_cache.max_age = 60
+    responses = [make_response(200, {"name": "repo"}, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})]
+
+    # Act
+    with patch("osa_tool.core.git.request_utils.requests.Session.get", side_effect=responses) as mock_get:
+        request_with_retry("get", URL)
+        cached = request_with_retry("get", URL)
+
+    # Assert
+    assert mock_get.call_count == 1
+    assert cached.json() == {"name": "repo"}
+    assert http_cache.hits == 1
+
+
+def test_does_not_share_entries_between_tokens(http_cache):
+    # Arrange
+    responses = [
+        make_response(200, {"private": False}, {"ETag": '"a"'}),
+        make_response(200, {"private": True}, {"ETag": '"b"'}),
+    ]
+
+    # Act
+    with patch("osa_tool.core.git.request_utils.requests.Session.get", side_effect=responses) as mock_get:
+        request_with_retry("get", URL)
+        request_with_retry("get", URL, headers={"Authorization": "token secret"})
+
+    # Assert
+    assert "If-None-Match" not in (mock_get.call_args_list[1].kwargs.get("headers") or {})
+    assert not any("secret" in path.read_text() for path in http_cache.path.rglob("*.json"))
+
+
+def test_does_not_store_responses_without_validators_or_errors(http_cache):
+    # Arrange
+    responses = [make_response(200, {"name": "repo"}), make_response(404, headers={"ETag": '"x"'})]
+
+    # Act
+    with patch("osa_tool.core.git.request_utils.requests.Session.get", side_effect=responses):
+        request_with_retry("get", URL)
+        request_with_retry("get", URL, params={"page": 2})
+
+    # Assert
+    assert not list(http_cache.path.rglob("*.json"))
@@ -1,8 +1,9 @@
 import os
 
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
+from git import Repo
 
 from osa_tool.core.git.metadata import (
     GitHubMetadataLoader,
@@ -65,7 +66,7 @@ def test_load_platform_data_success(mock_api_raw_data, mock_requests_response_fa
 
     if platform == "sourcecraft":
         mock_response = mock_requests_response_factory(status_code=200, json_data=raw_data)
-        with patch("osa_tool.core.git.request_utils.requests.get", return_value=mock_response) as mock_get:
+        with patch("osa_tool.core.git.request_utils.requests.Session.get", return_value=mock_response) as mock_get:
             with patch.dict(os.environ, TOKEN_ENVS[platform]):
                 result = loader_class._load_platform_data(repo_url, use_token=True)
 
@@ -82,13 +83,9 @@ def test_load_platform_data_success(mock_api_raw_data, mock_requests_response_fa
     mock_response = mock_requests_response_factory(status_code=200, json_data=raw_data)
     languages_response = mock_requests_response_factory(status_code=200, json_data=original_languages)
 
-    metadata_requests = MagicMock()
-    metadata_requests.get.return_value = languages_response
-
-    with (
-        patch("osa_tool.core.git.request_utils.requests.get", return_value=mock_response) as mock_get,
-        patch("osa_tool.core.git.metadata.requests", metadata_requests, create=True),
-    ):
+    with patch(
+        "osa_tool.core.git.request_utils.requests.Session.get", side_effect=[mock_response, languages_response]
+    ) as mock_get:
         with patch.dict(os.environ, TOKEN_ENVS[platform]):
             result = loader_class._load_platform_data(repo_url, use_token=True)
 
@@ -113,8 +110,10 @@ def test_load_platform_data_success(mock_api_raw_data, mock_requests_response_fa
         expected_url = BASE_URLS[platform].format(base=base_url)
         expected_language_url = raw_data["languages_url"]
 
-    mock_get.assert_called_once_with(expected_url, headers=HEADERS[platform], timeout=ANY)
-    metadata_requests.get.assert_called_once_with(url=expected_language_url, headers=HEADERS[platform])
+    assert mock_get.call_args_list == [
+        call(expected_url, headers=HEADERS[platform], timeout=ANY),
+        call(expected_language_url, headers=HEADERS[platform], timeout=ANY),
+    ]
 
 
 @pytest.mark.parametrize("mock_config_manager", ["github", "gitlab", "gitverse", "sourcecraft"], indirect=True)
@@ -124,12 +123,174 @@ def test_load_data_http_errors(status_code, mock_requests_response_factory, repo
     mock_response = mock_requests_response_factory(status_code=status_code)
     loader_class = LOADER_CLASSES[platform]
 
-    with patch("osa_tool.core.git.request_utils.requests.get", return_value=mock_response):
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.get", return_value=mock_response),
+        patch("osa_tool.core.git.request_utils.requests.Session.post", return_value=mock_response),
+    ):
         with patch.dict(os.environ, TOKEN_ENVS[platform]):
             with pytest.raises(Exception):
                 loader_class.load_data(repo_url)
 
 
+# GitHub GraphQL
+
+
+def _make_graphql_repository(name: str = "OSA") -> dict:
+    return {
+        "name": name,
+        "nameWithOwner": f"aimclub/{name}",
+        "owner": {"login": "aimclub", "url": "https://github.com/aimclub"},
+        "description": "Open Source Advisor",
+        "stargazerCount": 10,
+        "forkCount": 2,
+        "issues": {"totalCount": 4},
+        "pullRequests": {"totalCount": 1},
+        "defaultBranchRef": {"name": "main"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-02-01T00:00:00Z",
+        "pushedAt": "2024-03-01T00:00:00Z",
+        "diskUsage": 512,
+        "url": f"https://github.com/aimclub/{name}",
+        "sshUrl": f"git@github.com:aimclub/{name}.git",
+        "primaryLanguage": {"name": "Python"},
+        "languages": {"edges": [{"size": 900, "node": {"name": "Python"}}, {"size": 100, "node": {"name": "Shell"}}]},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "llm"}}]},
+        "hasWikiEnabled": True,
+        "hasIssuesEnabled": True,
+        "hasProjectsEnabled": False,
+        "isPrivate": False,
+        "homepageUrl": None,
+        "licenseInfo": {"name": "BSD 3-Clause License", "key": "bsd-3-clause"},
+    }
+
+
+def test_github_load_data_uses_single_graphql_request(mock_requests_response_factory):
+    # Arrange
+    response = mock_requests_response_factory(200, json_data={"data": {"repository": _make_graphql_repository()}})
+
+    # Act
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.post", return_value=response) as mock_post,
+        patch("osa_tool.core.git.request_utils.requests.Session.get") as mock_get,
+        patch.dict(os.environ, TOKEN_ENVS["github"]),
+    ):
+        metadata = GitHubMetadataLoader.load_data("https://github.com/aimclub/OSA")
+
+    # Assert
+    mock_post.assert_called_once()
+    mock_get.assert_not_called()
+    assert mock_post.call_args.kwargs["json"]["variables"] == {"owner": "aimclub", "name": "OSA"}
+    assert metadata.full_name == "aimclub/OSA"
+    assert metadata.default_branch == "main"
+    assert metadata.open_issues_count == 5
+    assert metadata.language_stats == {"Python": 900.0, "Shell": 100.0}
+    assert metadata.topics == ["llm"]
+    assert metadata.clone_url_http == "https://github.com/aimclub/OSA.git"
+    assert metadata.license_url == "https://api.github.com/licenses/bsd-3-clause"
+    assert metadata.languages_url == "https://api.github.com/repos/aimclub/OSA/languages"
+
+
+def test_github_load_data_falls_back_to_rest(mock_requests_response_factory, mock_api_raw_data, repo_info):
+    # Arrange
+    graphql_response = mock_requests_response_factory(200, json_data={"data": {"repository": None}})
+    rest_response = mock_requests_response_factory(200, json_data=mock_api_raw_data)
+    languages_response = mock_requests_response_factory(200, json_data={"Python": 10})
+
+    # Act
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.post", return_value=graphql_response),
+        patch(
+            "osa_tool.core.git.request_utils.requests.Session.get", side_effect=[rest_response, languages_response]
+        ) as mock_get,
+        patch.dict(os.environ, TOKEN_ENVS["github"]),
+    ):
+        metadata = GitHubMetadataLoader.load_data(repo_info[3])
+
+    # Assert
+    assert mock_get.call_count == 2
+    assert metadata.name == mock_api_raw_data["name"]
+
+
+def test_github_graphql_counters_match_rest(mock_requests_response_factory, mock_api_raw_data):
+    # Arrange
+    graphql_response = mock_requests_response_factory(
+        200, json_data={"data": {"repository": _make_graphql_repository()}}
+    )
+    # REST reports the star count as watchers_count, the real watchers are subscribers
+    rest_data = {**mock_api_raw_data, "stargazers_count": 10, "watchers_count": 10, "subscribers_count": 3}
+    rest_response = mock_requests_response_factory(200, json_data=rest_data)
+    languages_response = mock_requests_response_factory(200, json_data={"Python": 10})
+
+    # Act
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.post", return_value=graphql_response),
+        patch.dict(os.environ, TOKEN_ENVS["github"]),
+    ):
+        graphql_metadata = GitHubMetadataLoader.load_data("https://github.com/aimclub/OSA")
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.post", side_effect=Exception("no GraphQL")),
+        patch(
+            "osa_tool.core.git.request_utils.requests.Session.get", side_effect=[rest_response, languages_response]
+        ) as mock_get,
+        patch.dict(os.environ, TOKEN_ENVS["github"]),
+    ):
+        rest_metadata = GitHubMetadataLoader.load_data("https://github.com/aimclub/OSA")
+
+    # Assert
+    assert mock_get.call_count == 2
+    assert graphql_metadata.stars_count == rest_metadata.stars_count == 10
+    assert graphql_metadata.watchers_count == rest_metadata.watchers_count == 10
+
+
+def test_github_load_batch_aliases_repositories(mock_requests_response_factory):
+    # Arrange
+    urls = ["https://github.com/aimclub/OSA", "https://github.com/aimclub/Missing", "https://github.com/aimclub/FEDOT"]
+    first = mock_requests_response_factory(
+        200, json_data={"data": {"r0": _make_graphql_repository(), "r1": None}, "errors": [{"message": "not found"}]}
+    )
+    second = mock_requests_response_factory(200, json_data={"data": {"r0": _make_graphql_repository("FEDOT")}})
+
+    # Act
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.post", side_effect=[first, second]) as mock_post,
+        patch.dict(os.environ, TOKEN_ENVS["github"]),
+    ):
+        result = GitHubMetadataLoader.load_batch(urls, batch_size=2)
+
+    # Assert
+    assert mock_post.call_count == 2
+    assert set(result) == {urls[0], urls[2]}
+    assert result[urls[2]].name == "FEDOT"
+    assert "r1: repository(owner: $owner1, name: $name1)" in mock_post.call_args_list[0].kwargs["json"]["query"]
+
+
+def test_github_load_batch_skips_malformed_urls(mock_requests_response_factory):
+    # Arrange
+    urls = ["https://github.com/aimclub", "https://github.com/aimclub/OSA"]
+    response = mock_requests_response_factory(200, json_data={"data": {"r0": _make_graphql_repository()}})
+
+    # Act
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.post", return_value=response) as mock_post,
+        patch.dict(os.environ, TOKEN_ENVS["github"]),
+    ):
+        result = GitHubMetadataLoader.load_batch(urls)
+
+    # Assert
+    mock_post.assert_called_once()
+    assert mock_post.call_args.kwargs["json"]["variables"] == {"owner0": "aimclub", "name0": "OSA"}
+    assert set(result) == {urls[1]}
+
+
+def test_github_load_batch_needs_token():
+    # Act
+    with patch.dict(os.environ, {"GIT_TOKEN": "", "GITHUB_TOKEN": ""}):
+        result = GitHubMetadataLoader.load_batch(["https://github.com/aimclub/OSA"])
+
+    # Assert
+    assert result == {}
+
+
 # Sourcecraft
 
 
@@ -327,3 +488,60 @@ def test_local_metadata_loader_falls_back_when_git_user_config_missing(tmp_path)
 
     assert result.owner is None
     assert result.owner_url is None
+
+
+def test_local_metadata_loader_reads_head_snapshot_once(tmp_path):
+    # Arrange
+    repo = Repo.init(tmp_path / "local_repo", initial_branch="main")
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    for day, (path, content) in enumerate(
+        [("LICENSE", "MIT License\n"), ("main.py", "x" * 2048), ("run", "#!/usr/bin/env python\n")]
+    ):
+        with open(os.path.join(repo.working_tree_dir, path), "w", encoding="utf-8") as f:
+            f.write(content)
+        repo.index.add([path])
+        date = f"2024-01-0{day + 1}T00:00:00+0000"
+        repo.index.commit(f"add {path}", author_date=date, commit_date=date)
+    # uncommitted changes are not part of the snapshot
+    with open(os.path.join(repo.working_tree_dir, "main.py"), "w", encoding="utf-8") as f:
+        f.write("x" * 100000)
+
+    # Act
+    first = LocalMetadataLoader._load_platform_data(repo.working_tree_dir, use_token=False)
+    with patch.object(LocalMetadataLoader, "_list_files") as list_files:
+        second = LocalMetadataLoader._load_platform_data(repo.working_tree_dir, use_token=False)
+
+    # Assert
+    assert first.created_at == "2024-01-01T00:00:00Z"
+    assert first.updated_at == "2024-01-03T00:00:00Z"
+    assert first.size_kb == 2
+    assert first.language == "Python"
+    assert first.language_stats == {"Python": 2048.0 + len("#!/usr/bin/env python\n")}
+    assert first.license_name == "MIT"
+    list_files.assert_not_called()
+    assert second == first
+    assert second is not first
+
+
+def test_local_metadata_loader_snapshot_is_not_shared_with_callers(tmp_path):
+    # Arrange
+    repo = Repo.init(tmp_path / "local_repo", initial_branch="main")
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    with open(os.path.join(repo.working_tree_dir, "main.py"), "w", encoding="utf-8") as f:
+        f.write("print('hello')\n")
+    repo.index.add(["main.py"])
+    repo.index.commit("add main.py")
+
+    # Act
+    first = LocalMetadataLoader._load_platform_data(repo.working_tree_dir, use_token=False)
+    first.languages.append("Shell")
+    first.language_stats["Shell"] = 10.0
+    first.topics.append("changed")
+    second = LocalMetadataLoader._load_platform_data(repo.working_tree_dir, use_token=False)
+    second.topics.append("changed again")
+    third = LocalMetadataLoader._load_platform_data(repo.working_tree_dir, use_token=False)
+
+    # Assert
+    assert second.languages == ["Python"]
+    assert second.language_stats == {"Python": float(len("print('hello')\n"))}
+    assert third.topics == []
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+from git import GitCommandError, Repo
+
+from osa_tool.core.git.mirror_cache import LAST_USED_FILE, MirrorCache
+
+
+def _commit(repo: Repo, path: str, content: str) -> str:
+    file = os.path.join(repo.working_tree_dir, path)
+    with open(file, "w", encoding="utf-8") as f:
+        f.write(content)
+    repo.index.add([path])
+    return repo.index.commit(f"update {path}").hexsha
+
+
+@pytest.fixture
+def remote(tmp_path):
+    repo = Repo.init(tmp_path / "remote", initial_branch="main")
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    _commit(repo, "README.md", "first\n")
+    return repo
+
+
+def test_mirror_cache_creates_and_updates_mirror(tmp_path, remote):
+    # Arrange
+    cache = MirrorCache(tmp_path / "mirrors")
+    url = str(remote.working_tree_dir)
+
+    # Act
+    with cache.mirror(url, [url]) as first_path:
+        first_head = Repo(first_path).commit("main").hexsha
+    new_head = _commit(remote, "README.md", "second\n")
+    with cache.mirror(url, [url]) as second_path:
+        second_head = Repo(second_path).commit("main").hexsha
+
+    # Assert
+    assert first_path == second_path
+    assert Repo(first_path).bare
+    assert first_head != second_head
+    assert second_head == new_head
+    # fetch URLs are not stored in the mirror
+    assert not Repo(first_path).remotes
+
+
+def test_mirror_cache_falls_back_to_next_url(tmp_path, remote):
+    # Arrange
+    cache = MirrorCache(tmp_path / "mirrors")
+    url = str(remote.working_tree_dir)
+
+    # Act
+    with cache.mirror(url, [str(tmp_path / "missing"), url]) as path:
+        head = Repo(path).commit("main").hexsha
+
+    # Assert
+    assert head == remote.head.commit.hexsha
+
+
+def test_mirror_cache_removes_mirror_that_was_never_fetched(tmp_path):
+    # Arrange
+    cache = MirrorCache(tmp_path / "mirrors")
+    url = str(tmp_path / "missing")
+
+    # Act & Assert
+    with pytest.raises(GitCommandError):
+        with cache.mirror(url, [url]):
+            pass
+    assert not cache.mirror_path(url).exists()
+
+
+def test_mirror_cache_keys_urls_without_git_suffix():
+    # Arrange
+    cache = MirrorCache("mirrors")
+
+    # Act & Assert
+    assert cache.mirror_path("https://github.com/aimclub/OSA") == cache.mirror_path(
+        "https://github.com/aimclub/OSA.git"
+    )
+    assert cache.mirror_path("https://github.com/aimclub/OSA") != cache.mirror_path("https://github.com/other/OSA")
+
+
+def test_mirror_cache_evicts_least_recently_used(tmp_path, remote):
+    # Arrange
+    cache = MirrorCache(tmp_path / "mirrors", quota_mb=0)
+    url = str(remote.working_tree_dir)
+    with cache.mirror(url, [url]) as kept:
+        pass
+    old = tmp_path / "mirrors" / "old-0000.git"
+    Repo.init(old, bare=True, mkdir=True)
+    (old / LAST_USED_FILE).write_text("0", encoding="utf-8")
+    # any positive quota is exceeded by two mirrors
+    cache.quota_bytes = 1
+
+    # Act
+    cache.evict(keep=kept)
+
+    # Assert
+    assert not old.exists()
+    assert kept.exists()
@@ -0,0 +1,107 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from osa_tool.core.git.rate_limit import RateLimitDeferred, RateLimitLedger
+from osa_tool.core.git.request_utils import request_with_retry, set_rate_limiter
+from tests.utils.mocks.requests_mock import mock_requests_response
+
+URL = "https://api.github.com/repos/aimclub/OSA"
+HEADERS = {"Authorization": "token abc"}
+
+
+def rate_limit_headers(remaining: int, limit: int = 100, reset_in: int = 100) -> dict:
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Reset": str(int(time.time()) + reset_in),
+    }
+
+
+def test_does_not_pace_unknown_or_high_budget():
+    # Arrange
+    ledger = RateLimitLedger()
+
+    # Act
+    unknown = ledger.acquire(URL, HEADERS)
+    ledger.update(URL, HEADERS, rate_limit_headers(remaining=90))
+    high = ledger.acquire(URL, HEADERS)
+
+    # Assert
+    assert unknown == 0.0
+    assert high == 0.0
+
+
+def test_spreads_low_budget_until_reset():
+    # Arrange
+    ledger = RateLimitLedger()
+    ledger.update(URL, HEADERS, rate_limit_headers(remaining=10, reset_in=100))
+
+    # Act
+    first = ledger.acquire(URL, HEADERS)
+    second = ledger.acquire(URL, HEADERS)
+
+    # Assert
+    assert first == pytest.approx(0.0, abs=0.5)
+    assert second == pytest.approx(10.0, abs=0.5)
+
+
+def test_defers_low_priority_requests_on_low_budget():
+    # Arrange
+    ledger = RateLimitLedger()
+    ledger.update(URL, HEADERS, rate_limit_headers(remaining=5))
+
+    # Act & Assert
+    with pytest.raises(RateLimitDeferred):
+        ledger.acquire(URL, HEADERS, priority="low")
+    # other tokens and resources have their own budgets
+    assert ledger.acquire(URL, {"Authorization": "token other"}, priority="low") == 0.0
+    assert ledger.acquire("https://api.github.com/graphql", HEADERS, priority="low") == 0.0
+
+
+def test_shares_budget_through_file(tmp_path):
+    # Arrange
+    path = tmp_path / "rate_limits.json"
+    first_process = RateLimitLedger(path)
+    second_process = RateLimitLedger(path)
+    first_process.update(URL, HEADERS, rate_limit_headers(remaining=5))
+
+    # Act & Assert
+    with pytest.raises(RateLimitDeferred):
+        second_process.acquire(URL, HEADERS, priority="low")
+    assert "abc" not in path.read_text()
+
+
+def test_reads_gitlab_headers_with_relative_reset():
+    # Arrange
+    ledger = RateLimitLedger()
+    url = "https://gitlab.com/api/v4/projects/1"
+
+    # Act
+    ledger.update(url, HEADERS, {"RateLimit-Remaining": "1", "RateLimit-Limit": "100", "RateLimit-Reset": "60"})
+
+    # Assert
+    with pytest.raises(RateLimitDeferred):
+        ledger.acquire(url, HEADERS, priority="low")
+
+
+def test_request_with_retry_paces_and_defers():
+    # Arrange
+    set_rate_limiter(RateLimitLedger())
+    responses = [mock_requests_response(200, headers=rate_limit_headers(remaining=2, reset_in=100))] * 3
+
+    # Act
+    with (
+        patch("osa_tool.core.git.request_utils.requests.Session.get", side_effect=responses),
+        patch("osa_tool.core.git.request_utils.time.sleep") as sleep,
+    ):
+        for _ in range(3):
+            request_with_retry("get", URL, headers=HEADERS)
+        with pytest.raises(RateLimitDeferred):
+            request_with_retry("put", URL, headers=HEADERS, priority="low")
+    set_rate_limiter(RateLimitLedger())
+
+    # Assert
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(50.0, abs=1.0)
@@ -4,7 +4,13 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from osa_tool.core.git.request_utils import RetryConfig, request_with_retry
+from osa_tool.core.git.request_utils import (
+    POOL_MAXSIZE,
+    RetryConfig,
+    close_sessions,
+    get_session,
+    request_with_retry,
+)
 from tests.utils.mocks.requests_mock import mock_requests_response
 
 TEST_CONFIG = RetryConfig(
@@ -24,10 +30,10 @@ URL = "https://api.example.com/resource"
 def patched(side_effect, jitter=0.0):
     caller = Mock(side_effect=side_effect)
     with (
-        patch("osa_tool.core.git.request_utils.requests.get", caller),
-        patch("osa_tool.core.git.request_utils.requests.post", caller),
-        patch("osa_tool.core.git.request_utils.requests.put", caller),
-        patch("osa_tool.core.git.request_utils.requests.patch", caller),
+        patch("osa_tool.core.git.request_utils.requests.Session.get", caller),
+        patch("osa_tool.core.git.request_utils.requests.Session.post", caller),
+        patch("osa_tool.core.git.request_utils.requests.Session.put", caller),
+        patch("osa_tool.core.git.request_utils.requests.Session.patch", caller),
         patch("osa_tool.core.git.request_utils.time.sleep") as sleep,
         patch("osa_tool.core.git.request_utils.random.uniform", return_value=jitter),
     ):
@@ -243,3 +249,31 @@ def test_keeps_caller_timeout():
 
     # Assert
     assert request.call_args.kwargs["timeout"] == 99
+
+
+def test_reuses_session_per_host():
+    # Arrange
+    close_sessions()
+
+    # Act
+    first = get_session("https://api.github.com/repos/aimclub/OSA")
+    second = get_session("https://API.github.com/user")
+    other = get_session("https://gitlab.com/api/v4/user")
+
+    # Assert
+    assert first is second
+    assert first is not other
+    assert first.get_adapter("https://api.github.com")._pool_maxsize == POOL_MAXSIZE
+
+
+def test_creates_new_sessions_after_fork():
+    # Arrange
+    close_sessions()
+    parent = get_session(URL)
+
+    # Act
+    with patch("osa_tool.core.git.request_utils.os.getpid", return_value=-1):
+        child = get_session(URL)
+
+    # Assert
+    assert child is not parent
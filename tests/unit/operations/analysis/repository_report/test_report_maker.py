@@ -38,7 +38,25 @@ def test_report_generator_init(mock_config_manager, mock_git_agent):
         assert report_generator.filename == expected_filename
         assert Path(report_generator.output_path) == expected_output_path
         assert Path(report_generator.logo_path) == expected_logo_path
-        mock_text_generator.assert_called_once_with(mock_config_manager, mock_git_agent.metadata)
+        mock_text_generator.assert_called_once_with(
+            mock_config_manager, mock_git_agent.metadata, sourcerank=report_generator.sourcerank
+        )
+
+
+def test_report_generator_reads_tree_from_content_provider(mock_config_manager, mock_git_agent):
+    # Arrange
+    provider = MagicMock()
+    provider.list_files.return_value = ["README.md", "docs/index.md", "logs/run.txt"]
+    mock_git_agent.content_provider.return_value.__enter__.return_value = provider
+
+    with patch("osa_tool.operations.analysis.repository_report.report_generator.ModelHandlerFactory.build"):
+        # Act
+        report_generator = ReportGenerator(mock_config_manager, mock_git_agent, False)
+
+    # Assert
+    mock_git_agent.content_provider.assert_called_once_with()
+    assert report_generator.sourcerank.tree == "README.md\ndocs\ndocs/index.md"
+    assert report_generator.text_generator.sourcerank is report_generator.sourcerank
 
 
 def test_table_builder_without_coloring():
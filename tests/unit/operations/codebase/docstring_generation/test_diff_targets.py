@@ -0,0 +1,109 @@
+import subprocess
+
+import pytest
+
+from osa_tool.operations.codebase.docstring_generation.core.osa_parser import OSA_TreeSitter
+from osa_tool.operations.codebase.docstring_generation.diff_targets import (
+    changed_line_ranges,
+    files_referencing,
+    select_diff_targets,
+)
+
+MODULE = """def helper(value):
+    return value
+
+
+def caller(value):
+    return helper(value)
+
+
+class Loader:
+    def load(self, value):
+        return value
+
+    def save(self, value):
+        return value
+"""
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=osa", "-c", "user.email=osa@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _repository(tmp_path):
+    module = tmp_path / "module.py"
+    module.write_text(MODULE, encoding="utf-8")
+    (tmp_path / "other.py").write_text("def other():\n    return 1\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return module
+
+
+def test_changed_line_ranges_of_working_tree(tmp_path):
+    # Arrange
+    module = _repository(tmp_path)
+    module.write_text(MODULE.replace("return value\n\n\ndef caller", "return value * 2\n\n\ndef caller"))
+
+    # Act
+    ranges = changed_line_ranges(str(tmp_path), "HEAD")
+
+    # Assert
+    assert ranges == {str(module.resolve()): [(2, 2)]}
+
+
+@pytest.mark.parametrize("name", ["модуль.py", "a b.py", 'say "hi".py'])
+def test_changed_line_ranges_of_quoted_file_names(tmp_path, name):
+    # Arrange
+    _repository(tmp_path)
+    module = tmp_path / name
+    module.write_text("def helper():\n    return 1\n", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "add module")
+    module.write_text("def helper():\n    return 2\n", encoding="utf-8")
+
+    # Act
+    ranges = changed_line_ranges(str(tmp_path), "HEAD")
+
+    # Assert
+    assert ranges == {str(module.resolve()): [(2, 2)]}
+
+
+def test_select_diff_targets_maps_lines_to_symbols_and_callers(tmp_path):
+    # Arrange
+    module = _repository(tmp_path)
+    module.write_text(
+        MODULE.replace("return value\n\n\ndef caller", "return value * 2\n\n\ndef caller").replace(
+            "def save(self, value):\n        return value", "def save(self, value):\n        return None"
+        ),
+        encoding="utf-8",
+    )
+    ranges = changed_line_ranges(str(tmp_path), "HEAD")
+    parsed_structure = OSA_TreeSitter(str(tmp_path), target_files=["module.py"]).analyze_directory(str(tmp_path))
+    file = next(iter(parsed_structure))
+
+    # Act
+    changed = select_diff_targets(parsed_structure, ranges)
+    with_callers = select_diff_targets(parsed_structure, ranges, include_callers=True)
+
+    # Assert
+    assert changed.symbols == {f"{file}:helper", f"{file}:Loader.save"}
+    assert changed.classes == {(file, "Loader")}
+    assert with_callers.symbols == changed.symbols | {f"{file}:caller"}
+
+
+def test_files_referencing_finds_whole_words(tmp_path):
+    # Arrange
+    module = _repository(tmp_path)
+
+    # Act
+    files = files_referencing(str(tmp_path), {"helper", "missing_name"})
+
+    # Assert
+    assert files == [str(module.resolve())]
+    assert files_referencing(str(tmp_path), {"help"}) == []
@@ -4,7 +4,22 @@ from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 
-from osa_tool.operations.codebase.docstring_generation.docgen import ClassDocumentationDetails, DocGen
+from osa_tool.operations.codebase.docstring_generation.dedup import normalize_source
+from osa_tool.operations.codebase.docstring_generation.diff_targets import DiffTargets
+from osa_tool.operations.codebase.docstring_generation.docgen import (
+    BatchedDocstring,
+    BatchedDocstrings,
+    ClassDocumentationDetails,
+    DocGen,
+)
+from osa_tool.operations.codebase.docstring_generation.journal import DocstringJournal
+from osa_tool.operations.codebase.docstring_generation.quality import (
+    DocstringQualityGate,
+    extract_domain_terms,
+    score_docstring,
+)
+from osa_tool.operations.codebase.docstring_generation.summary_cache import SummaryCache
+from osa_tool.operations.codebase.docstring_generation.topology import build_dependency_graph
 
 
 def test_format_class(mock_config_manager):
@@ -199,6 +214,13 @@ def test_count_tokens(mock_config_manager):
     assert count == 2
 
 
+@pytest.fixture(autouse=True)
+def model_size_cache(tmp_path, monkeypatch):
+    path = tmp_path / "model_sizes.json"
+    monkeypatch.setattr(DocGen, "MODEL_SIZE_CACHE_PATH", path)
+    return path
+
+
 @pytest.mark.asyncio
 async def test_classify_model_size_uses_model_self_classification(mock_config_manager):
     docgen = DocGen(mock_config_manager)
@@ -218,6 +240,7 @@ async def test_classify_model_size_uses_model_self_classification(mock_config_ma
 @pytest.mark.asyncio
 async def test_classify_model_size_can_override_name_based_heuristic(mock_config_manager):
     docgen = DocGen(mock_config_manager)
+    docgen.model_settings.model = "provider/example-model"
     docgen.is_small_model = True
     docgen.model_handler.async_request = AsyncMock(return_value="NOT_SMALL")
 
@@ -230,6 +253,7 @@ async def test_classify_model_size_can_override_name_based_heuristic(mock_config
 @pytest.mark.asyncio
 async def test_classify_model_size_keeps_heuristic_for_unrecognized_response(mock_config_manager):
     docgen = DocGen(mock_config_manager)
+    docgen.model_settings.model = "provider/example-model"
     docgen.is_small_model = True
     docgen.model_handler.async_request = AsyncMock(return_value="I do not know")
 
@@ -242,6 +266,7 @@ async def test_classify_model_size_keeps_heuristic_for_unrecognized_response(moc
 @pytest.mark.asyncio
 async def test_classify_model_size_uses_fallback_when_model_is_unsure(mock_config_manager):
     docgen = DocGen(mock_config_manager)
+    docgen.model_settings.model = "provider/example-model"
     docgen.is_small_model = False
     docgen.model_handler.async_request = AsyncMock(return_value="UNSURE")
 
@@ -251,6 +276,55 @@ async def test_classify_model_size_uses_fallback_when_model_is_unsure(mock_confi
     assert docgen.is_small_model is False
 
 
+@pytest.mark.asyncio
+async def test_classify_model_size_is_persisted_per_model(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_settings.model = "provider/example-model"
+    docgen.model_handler.async_request = AsyncMock(return_value="SMALL")
+    await docgen.classify_model_size()
+
+    next_run = DocGen(mock_config_manager)
+    next_run.is_small_model = False
+    next_run.model_handler.async_request = AsyncMock(return_value="NOT_SMALL")
+
+    # Act
+    result = await next_run.classify_model_size()
+
+    # Assert
+    assert result is True
+    next_run.model_handler.async_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("model_name", "small_model", "expected"),
+    [
+        ("openai/gpt-4o", None, False),
+        ("anthropic/claude-haiku-4.5", None, False),
+        ("deepseek-r1:7b", None, True),
+        ("deepseek-ai/deepseek-r1-distill-qwen-7b", None, True),
+        ("google/gemini-1.5-flash-8b", None, True),
+        ("deepseek-r1:70b", None, False),
+        ("provider/example-model", True, True),
+        ("openai/gpt-4o", True, True),
+    ],
+)
+async def test_classify_model_size_without_request(mock_config_manager, model_name, small_model, expected):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_settings.model = model_name
+    docgen.model_settings.small_model = small_model
+    docgen.model_handler.async_request = AsyncMock(return_value="UNSURE")
+
+    # Act
+    result = await docgen.classify_model_size()
+
+    # Assert
+    assert result is expected
+    docgen.model_handler.async_request.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_classify_model_size_reclassifies_active_fallback(mock_config_manager):
     docgen = DocGen(mock_config_manager)
@@ -278,6 +352,9 @@ async def test_classify_model_size_reclassifies_active_fallback(mock_config_mana
         ("meta-llama/Llama-3.1-70B-Instruct", False),
         ("mistralai/Mistral-Large-Instruct", False),
         ("meta-llama/Llama-3.1-405B-Instruct", False),
+        ("deepseek-r1:7b", True),
+        ("deepseek-r1-distill-qwen-7b", True),
+        ("gemini-1.5-flash-8b", True),
     ],
 )
 def test_small_model_name_uses_parameter_count(mock_config_manager, model_name, expected):
@@ -742,6 +819,29 @@ def test_context_extractor(mock_config_manager, method_details, function_index,
         assert result == ""
 
 
+def test_context_extractor_fills_budget_with_same_file_helpers_first(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_handler.available_input_tokens = MagicMock(return_value=DocGen.CONTEXT_PROMPT_OVERHEAD_TOKENS + 30)
+    method_details = {"method_calls": ["hub", "local", "other"], "source_code": "def run(): ..."}
+    function_index = {
+        "other": {"file": "b.py", "docstring": "Other helper."},
+        "hub": {"file": "b.py", "docstring": "Hub helper."},
+        "local": {"file": "a.py", "docstring": "Local helper."},
+    }
+
+    # Act
+    with patch("osa_tool.operations.codebase.docstring_generation.docgen.count_tokens", return_value=10) as mock_count:
+        result = docgen.context_extractor(method_details, {}, function_index, budget_share=1.0, file_path="a.py")
+        docgen.context_extractor(method_details, {}, function_index, budget_share=1.0, file_path="a.py")
+
+    # Assert
+    assert "Helper function name: other" not in result
+    assert result.index("Helper function name: hub") < result.index("Helper function name: local")
+    # system prompt once, the source twice, every helper once
+    assert mock_count.call_count == 1 + 2 + 3
+
+
 def test_format_with_black_calls_black(mock_config_manager, tmp_path):
     # Arrange
     docgen = DocGen(mock_config_manager)
@@ -839,6 +939,44 @@ async def test_summarize_submodules_creates_summaries(mock_config_manager, mocke
     assert summaries[str(sub_dir)] == "Summary of module"
 
 
+@pytest.mark.asyncio
+async def test_summarize_submodules_resummarizes_only_changed_subtrees(mock_config_manager, mocker, tmp_path):
+    # Arrange
+    repo = tmp_path / "repo"
+    pkg_dir, sub_dir, other_dir = repo / "mypkg", repo / "mypkg" / "sub", repo / "other"
+    for directory, name in ((pkg_dir, "core.py"), (sub_dir, "helper.py"), (other_dir, "tool.py")):
+        directory.mkdir(parents=True)
+        (directory / name).write_text(f"def {name[:-3]}(): pass")
+    project_structure = {
+        str(directory / name): {
+            "structure": [{"type": "function", "details": {"method_name": name[:-3], "docstring": None}}]
+        }
+        for directory, name in ((pkg_dir, "core.py"), (sub_dir, "helper.py"), (other_dir, "tool.py"))
+    }
+    cache_path = tmp_path / "summaries.json"
+
+    async def summarize(cache):
+        docgen = DocGen(mock_config_manager, summary_cache=cache)
+        docgen.config_manager.config.git.repository = str(repo)
+        docgen.config_manager.config.git.name = repo.name
+        docgen.readme_model_handler.async_request = mocker.AsyncMock(return_value="Summary of module")
+        summaries = await docgen.summarize_submodules(project_structure)
+        cache.save()
+        return docgen.readme_model_handler.async_request, summaries
+
+    await summarize(SummaryCache(cache_path))
+    (sub_dir / "helper.py").write_text("def helper(): return 1")
+
+    # Act
+    request, summaries = await summarize(SummaryCache(cache_path))
+
+    # Assert
+    assert request.await_count == 2
+    prompts = "".join(call.args[0] for call in request.await_args_list)
+    assert "Module name: sub" in prompts and "Module name: mypkg" in prompts
+    assert summaries[str(other_dir)] == "Summary of module"
+
+
 def test_convert_path_to_dot_notation(mock_config_manager):
     # Arrange
     docgen = DocGen(mock_config_manager)
@@ -935,7 +1073,7 @@ async def test_generate_docstrings_for_functions_methods(mock_config_manager):
     # Arrange
     docgen = DocGen(mock_config_manager)
 
-    async def mock_fetch_docstrings(parsed_structure, docstring_type, semaphore, rate_limit):
+    async def mock_fetch_docstrings(parsed_structure, docstring_type, semaphore, rate_limit, on_file_complete=None):
         return {
             file: {"functions": [("docstring", "func1")], "methods": [("docstring", "method1")], "classes": []}
             for file in parsed_structure
@@ -983,7 +1121,7 @@ async def test_generate_docstrings_for_all_types(mock_config_manager):
     # Arrange
     docgen = DocGen(mock_config_manager)
 
-    async def mock_fetch_docstrings(parsed_structure, docstring_type, semaphore, rate_limit):
+    async def mock_fetch_docstrings(parsed_structure, docstring_type, semaphore, rate_limit, on_file_complete=None):
         return {
             file: {
                 "functions": [("docstring", "func1")],
@@ -1026,64 +1164,6 @@ def test_perform_code_augmentations(mock_config_manager):
     assert '\n\t"""\n\tdoc1\n\t"""\n\t' in result["file1.py"]
 
 
-def test_run_in_executor_with_fake_augment(mock_config_manager):
-    # Arrange
-    docgen = DocGen(mock_config_manager)
-    parsed_structure = {
-        "file1.py": {"structure": True},
-        "file2.py": {"structure": True},
-    }
-    project_source_code = {
-        "file1.py": "def foo(): pass",
-        "file2.py": "def bar(): pass",
-    }
-    generated_docstrings = {
-        "file1.py": {"functions": [("doc1", "foo")], "methods": [], "classes": []},
-        "file2.py": {"functions": [("doc2", "bar")], "methods": [], "classes": []},
-    }
-
-    def fake_augment(args):
-        filename, src, docs = args
-        return {filename: src + "\n# augmented"}
-
-    # Act
-    args = [(file, project_source_code[file], generated_docstrings[file]) for file in parsed_structure]
-    results = []
-    from concurrent.futures import ThreadPoolExecutor
-
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        for result in executor.map(fake_augment, args):
-            results.append(result)
-
-    # Assert
-    expected_results = [
-        {"file1.py": "def foo(): pass\n# augmented"},
-        {"file2.py": "def bar(): pass\n# augmented"},
-    ]
-    assert results == expected_results
-
-
-@pytest.mark.asyncio
-async def test_get_project_source_code_with_config(tmp_path, mock_config_manager):
-    # Arrange
-    files = {"file1.py": "print('hello')", "file2.py": "print('world')"}
-
-    for name, content in files.items():
-        (tmp_path / name).write_text(content, encoding="utf-8")
-    parsed_structure = {str(tmp_path / name): {"structure": True} for name in files}
-
-    sem = asyncio.Semaphore(2)
-
-    docgen = DocGen(config_manager=mock_config_manager)
-
-    # Act
-    result = await docgen._get_project_source_code(parsed_structure, sem)
-
-    # Assert
-    expected = {str(tmp_path / k): v for k, v in files.items()}
-    assert result == expected
-
-
 @pytest.mark.parametrize("mock_config_manager", ["sourcecraft"], indirect=True)
 def test_create_mkdocs_git_workflow_sourcecraft(mock_config_manager, tmp_path):
     # Arrange
@@ -1179,22 +1259,428 @@ def test_create_mkdocs_git_workflow_sourcecraft_merges_existing_ci(mock_config_m
     assert "build_docs" in pr_workflows
 
 
+def _small_functions_structure(file_path: str, names: list[str]) -> dict:
+    return {
+        file_path: {
+            "structure": [
+                {
+                    "type": "function",
+                    "details": {
+                        "method_name": name,
+                        "arguments": ["value"],
+                        "decorators": [],
+                        "docstring": None,
+                        "source_code": f"def {name}(value):\n    return value",
+                        "method_calls": [],
+                    },
+                }
+                for name in names
+            ],
+            "imports": {},
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_batches_small_functions(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager, batch_size=4)
+    docgen.model_settings.max_tokens = 4096
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Single docstring"""')
+    docgen.model_handler.async_send_and_parse = AsyncMock(
+        return_value=BatchedDocstrings(
+            docstrings=[
+                BatchedDocstring(symbol_id=name, docstring=f"Returns {name}.") for name in ("first", "second", "third")
+            ]
+        )
+    )
+    parsed_structure = _small_functions_structure("module.py", ["first", "second", "third"])
+
+    # Act
+    with patch("osa_tool.operations.codebase.docstring_generation.docgen.count_tokens", return_value=10):
+        results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    docgen.model_handler.async_send_and_parse.assert_awaited_once()
+    docgen.model_handler.async_request.assert_not_called()
+    documented = {meta["method_name"]: doc for doc, meta in results["module.py"]["functions"]}
+    assert documented["second"] == '"""\nReturns second.\n"""'
+    assert set(documented) == {"first", "second", "third"}
+    assert docgen.batch_stats == {"requests": 1, "symbols": 3}
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_batch_falls_back_to_single_requests(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager, batch_size=4)
+    docgen.model_settings.max_tokens = 4096
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Single docstring"""')
+    docgen.model_handler.async_send_and_parse = AsyncMock(
+        return_value=BatchedDocstrings(docstrings=[BatchedDocstring(symbol_id="first", docstring="Returns first.")])
+    )
+    parsed_structure = _small_functions_structure("module.py", ["first", "second"])
+
+    # Act
+    with patch("osa_tool.operations.codebase.docstring_generation.docgen.count_tokens", return_value=10):
+        results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    documented = {meta["method_name"]: doc for doc, meta in results["module.py"]["functions"]}
+    assert documented["first"] == '"""\nReturns first.\n"""'
+    assert documented["second"] == '"""\nSingle docstring\n"""'
+    docgen.model_handler.async_request.assert_awaited_once()
+
+
+def test_pack_batch_skips_large_symbols_and_other_files(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager, batch_size=4)
+    docgen.model_settings.max_tokens = 4096
+    parsed_structure = {
+        **_small_functions_structure("a.py", ["first", "second"]),
+        **_small_functions_structure("b.py", ["third"]),
+    }
+    parsed_structure["a.py"]["structure"][1]["details"]["source_code"] = "\n".join(["x = 1"] * 50)
+    dep_graph = build_dependency_graph(parsed_structure)
+    queue = ["a.py:second", "b.py:third"]
+
+    # Act
+    batch = docgen._pack_batch("a.py:first", queue, dep_graph)
+
+    # Assert
+    assert batch == ["a.py:first"]
+    assert queue == ["a.py:second", "b.py:third"]
+
+
+def _duplicate_methods_structure(class_names: list[str]) -> dict:
+    return {
+        f"{class_name.lower()}.py": {
+            "structure": [
+                {
+                    "type": "class",
+                    "name": class_name,
+                    "docstring": None,
+                    "attributes": [],
+                    "methods": [
+                        {
+                            "method_name": "to_dict",
+                            "arguments": ["self"],
+                            "decorators": [],
+                            "docstring": None,
+                            "source_code": "def to_dict(self):\n        return dict(self.__dict__)",
+                            "method_calls": [],
+                        }
+                    ],
+                }
+            ],
+            "imports": {},
+        }
+        for class_name in class_names
+    }
+
+
+def test_normalize_source_ignores_docstring_comments_and_formatting():
+    # Arrange
+    documented = 'def add(a, b):\n        """Adds numbers."""\n        # sum\n        return   a+b\n'
+    plain = "def add(a, b):\n    return a + b  # result"
+
+    # Act & Assert
+    assert normalize_source(documented) == normalize_source(plain)
+    assert normalize_source(plain) != normalize_source("def add(a, b):\n    return a - b")
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_reuses_docstring_for_duplicate_functions(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Returns the value."""')
+    parsed_structure = {
+        **_small_functions_structure("a.py", ["identity"]),
+        **_small_functions_structure("b.py", ["identity"]),
+    }
+    parsed_structure["b.py"]["structure"][0]["details"]["source_code"] = "def identity(value):\n  return value # copy"
+
+    # Act
+    results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    docgen.model_handler.async_request.assert_awaited_once()
+    assert results["a.py"]["functions"][0][0] == results["b.py"]["functions"][0][0]
+    assert results["b.py"]["functions"][0][1]["source_code"].endswith("# copy")
+    assert docgen.reused_docstrings == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reuse_mode, expected_requests", [("body", 1), ("class", 2), ("off", 2)])
+async def test_fetch_docstrings_reuse_modes_for_methods_of_different_classes(
+    mock_config_manager, reuse_mode, expected_requests
+):
+    # Arrange
+    docgen = DocGen(mock_config_manager, reuse_mode=reuse_mode)
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Serializes the object."""')
+    parsed_structure = _duplicate_methods_structure(["User", "Order"])
+
+    # Act
+    results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    assert docgen.model_handler.async_request.await_count == expected_requests
+    assert len(results["user.py"]["methods"]) == len(results["order.py"]["methods"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_retries_duplicate_when_representative_fails(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_handler.async_request = AsyncMock(side_effect=[Exception("LLM error"), '"""Serializes."""'])
+    parsed_structure = _duplicate_methods_structure(["User", "Order"])
+
+    # Act
+    results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    assert docgen.model_handler.async_request.await_count == 2
+    assert sum(len(results[file]["methods"]) for file in results) == 1
+    assert docgen.reused_docstrings == 0
+
+
+GOOD_DOCSTRING = '''"""
+Loads the dataset from the repository storage and normalizes every record.
+
+Args:
+    path: Location of the dataset file.
+"""'''
+
+
+def test_score_docstring_penalizes_missing_and_stale_parameters():
+    # Arrange
+    domain_terms = {"dataset"}
+
+    # Act
+    good = score_docstring(GOOD_DOCSTRING, ["path"], domain_terms)
+    stale = score_docstring(GOOD_DOCSTRING, ["source"], domain_terms)
+
+    # Assert
+    assert good.total == pytest.approx(1.0)
+    assert stale.coverage == 0.0
+    assert stale.freshness == 0.0
+    assert score_docstring('"""Loads data."""', ["path"], domain_terms).total < good.total
+
+
+def test_score_docstring_grades_alignment_with_main_idea():
+    # Arrange
+    domain_terms = extract_domain_terms("A toolkit for dataset loading, dataset validation and record normalization.")
+
+    # Act
+    aligned = score_docstring(GOOD_DOCSTRING, ["path"], domain_terms)
+    partial = score_docstring('"""Loads the dataset file from disk and returns its rows."""', [], domain_terms)
+    unrelated = score_docstring('"""Renders the chart widget with the configured color palette."""', [], domain_terms)
+
+    # Assert
+    assert aligned.domain == 1.0
+    assert partial.domain == 0.5
+    assert unrelated.domain == 0.0
+
+
+def test_quality_gate_counts_skipped_docstrings():
+    # Arrange
+    gate = DocstringQualityGate("A toolkit for dataset loading and dataset validation.", threshold=0.85)
+
+    # Act
+    keep_good = not gate.needs_update("load", GOOD_DOCSTRING, ["path"])
+    keep_short = not gate.needs_update("load", '"""Loads."""', ["path"])
+
+    # Assert
+    assert keep_good is True
+    assert keep_short is False
+    assert gate.stats == {"checked": 2, "skipped": 1}
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_keeps_good_docstrings_during_main_idea_update(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.main_idea = "A toolkit for dataset loading and dataset validation."
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Updated docstring."""')
+    parsed_structure = _small_functions_structure("module.py", ["load", "check"])
+    functions = parsed_structure["module.py"]["structure"]
+    functions[0]["details"].update(source_code="def load(path):\n    return path", docstring=GOOD_DOCSTRING)
+    functions[1]["details"]["docstring"] = '"""Checks."""'
+
+    # Act
+    results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    docgen.model_handler.async_request.assert_awaited_once()
+    assert [meta["method_name"] for _, meta in results["module.py"]["functions"]] == ["check"]
+    assert docgen.quality_stats == {"checked": 2, "skipped": 1}
+
+
 @pytest.mark.asyncio
-async def test_write_augmented_code_with_config(tmp_path, mock_config_manager):
+async def test_fetch_docstrings_reports_each_file_once_its_symbols_are_done(mock_config_manager):
     # Arrange
-    files = ["file1.py", "file2.py"]
-    for f in files:
-        (tmp_path / f).write_text("old code", encoding="utf-8")
-    parsed_structure = {str(tmp_path / f): {"structure": True} for f in files}
-    augmented_code = [{str(tmp_path / files[0]): "new code 1"}, {str(tmp_path / files[1]): "new code 2"}]
+    docgen = DocGen(mock_config_manager)
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Returns the value."""')
+    parsed_structure = {
+        **_small_functions_structure("a.py", ["first", "second"]),
+        **_small_functions_structure("b.py", ["third"]),
+    }
+    completed_files = []
 
-    sem = asyncio.Semaphore(2)
-    docgen = DocGen(config_manager=mock_config_manager)
+    def on_file_complete(file, docstrings):
+        completed_files.append((file, len(docstrings["functions"])))
 
     # Act
-    await docgen._write_augmented_code(parsed_structure, augmented_code, sem)
+    await docgen._fetch_docstrings(
+        parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 1, on_file_complete=on_file_complete
+    )
+
+    # Assert
+    assert completed_files == [("a.py", 2), ("b.py", 1)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_resumes_from_journal(tmp_path, mock_config_manager):
+    # Arrange
+    parsed_structure = _small_functions_structure("module.py", ["first", "second"])
+    journal = DocstringJournal(tmp_path / "journal.jsonl", tmp_path)
+    interrupted = DocGen(mock_config_manager, journal=journal)
+    interrupted.model_handler.async_request = AsyncMock(side_effect=['"""Returns first."""', Exception("outage")])
+    await interrupted._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 1)
+    journal.close()
+
+    resumed = DocGen(mock_config_manager, journal=DocstringJournal(tmp_path / "journal.jsonl", tmp_path, resume=True))
+    resumed.model_handler.async_request = AsyncMock(return_value='"""Returns second."""')
+
+    # Act
+    results = await resumed._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 1)
+
+    # Assert
+    resumed.model_handler.async_request.assert_awaited_once()
+    documented = {meta["method_name"]: doc for doc, meta in results["module.py"]["functions"]}
+    assert documented == {"first": '"""\nReturns first.\n"""', "second": '"""\nReturns second.\n"""'}
+    assert resumed.journal.replayed == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_replays_journaled_batch_candidates(tmp_path, mock_config_manager):
+    # Arrange
+    parsed_structure = _small_functions_structure("module.py", ["first", "second", "third"])
+    journal = DocstringJournal(tmp_path / "journal.jsonl", tmp_path)
+    interrupted = DocGen(mock_config_manager, journal=journal)
+    interrupted.model_handler.async_request = AsyncMock(
+        side_effect=[Exception("outage"), '"""Returns second."""', Exception("outage")]
+    )
+    await interrupted._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 1)
+    journal.close()
+
+    resumed = DocGen(
+        mock_config_manager,
+        journal=DocstringJournal(tmp_path / "journal.jsonl", tmp_path, resume=True),
+        batch_size=4,
+    )
+    resumed.model_settings.max_tokens = 4096
+    resumed.model_handler.async_request = AsyncMock(return_value='"""Single docstring"""')
+    resumed.model_handler.async_send_and_parse = AsyncMock(
+        return_value=BatchedDocstrings(
+            docstrings=[BatchedDocstring(symbol_id=name, docstring=f"Returns {name}.") for name in ("first", "third")]
+        )
+    )
+
+    # Act
+    with patch("osa_tool.operations.codebase.docstring_generation.docgen.count_tokens", return_value=10):
+        results = await resumed._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    resumed.model_handler.async_request.assert_not_called()
+    resumed.model_handler.async_send_and_parse.assert_awaited_once()
+    documented = {meta["method_name"]: doc for doc, meta in results["module.py"]["functions"]}
+    assert documented["second"] == '"""\nReturns second.\n"""'
+    assert set(documented) == {"first", "second", "third"}
+    assert resumed.journal.replayed == 1
+    assert resumed.batch_stats == {"requests": 1, "symbols": 2}
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_only_requests_diff_targets(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Returns the value."""')
+    docgen.targets = DiffTargets(symbols={"module.py:second"})
+    parsed_structure = _small_functions_structure("module.py", ["first", "second"])
+
+    # Act
+    results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 1)
+
+    # Assert
+    docgen.model_handler.async_request.assert_awaited_once()
+    assert [meta["method_name"] for _, meta in results["module.py"]["functions"]] == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_regenerates_documented_diff_targets(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Returns the changed value."""')
+    docgen.targets = DiffTargets(symbols={"module.py:second"})
+    parsed_structure = _small_functions_structure("module.py", ["first", "second"])
+    for item in parsed_structure["module.py"]["structure"]:
+        item["details"]["docstring"] = '"""Returns the value."""'
+
+    # Act
+    results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 1)
+
+    # Assert
+    docgen.model_handler.async_request.assert_awaited_once()
+    assert results["module.py"]["functions"] == [
+        ('"""\nReturns the changed value.\n"""', parsed_structure["module.py"]["structure"][1]["details"])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_batches_documented_diff_targets(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager, batch_size=4)
+    docgen.model_settings.max_tokens = 4096
+    docgen.model_handler.async_request = AsyncMock(return_value='"""Single docstring"""')
+    docgen.model_handler.async_send_and_parse = AsyncMock(
+        return_value=BatchedDocstrings(
+            docstrings=[BatchedDocstring(symbol_id=name, docstring=f"Returns {name}.") for name in ("first", "third")]
+        )
+    )
+    docgen.targets = DiffTargets(symbols={"module.py:first", "module.py:third"})
+    parsed_structure = _small_functions_structure("module.py", ["first", "second", "third"])
+    for item in parsed_structure["module.py"]["structure"]:
+        item["details"]["docstring"] = '"""Returns the value."""'
+
+    # Act
+    with patch("osa_tool.operations.codebase.docstring_generation.docgen.count_tokens", return_value=10):
+        results = await docgen._fetch_docstrings(parsed_structure, ("functions", "methods"), asyncio.Semaphore(1), 4)
+
+    # Assert
+    docgen.model_handler.async_send_and_parse.assert_awaited_once()
+    docgen.model_handler.async_request.assert_not_called()
+    documented = {meta["method_name"]: doc for doc, meta in results["module.py"]["functions"]}
+    assert documented == {"first": '"""\nReturns first.\n"""', "third": '"""\nReturns third.\n"""'}
+
+
+@pytest.mark.asyncio
+async def test_fetch_docstrings_for_class_regenerates_documented_diff_targets(mock_config_manager):
+    # Arrange
+    docgen = DocGen(mock_config_manager)
+    docgen.generate_class_documentation = AsyncMock(return_value='"""Changed class."""')
+    docgen.targets = DiffTargets(classes={("module.py", "Changed")})
+    file_meta = {
+        "structure": [
+            {"type": "class", "name": name, "attributes": [], "methods": [], "docstring": '"""Old class."""'}
+            for name in ("Changed", "Untouched")
+        ]
+    }
+
+    # Act
+    result = await docgen._fetch_docstrings_for_class(
+        "module.py", file_meta, asyncio.Semaphore(1), {"count": 0, "total": 1}
+    )
 
     # Assert
-    for i, f in enumerate(files):
-        content = (tmp_path / f).read_text(encoding="utf-8")
-        assert content == augmented_code[i][str(tmp_path / f)]
+    docgen.generate_class_documentation.assert_awaited_once()
+    assert result == {"classes": [('"""Changed class."""', "Changed")]}
@@ -0,0 +1,53 @@
+from osa_tool.operations.codebase.docstring_generation.journal import DocstringJournal, symbol_hash
+
+
+def test_journal_replays_results_of_unchanged_symbols(tmp_path):
+    # Arrange
+    path = tmp_path / "journal.jsonl"
+    file = str(tmp_path / "repo" / "module.py")
+    source_hash = symbol_hash("def add(a, b):\n    return a + b")
+    journal = DocstringJournal(path, tmp_path / "repo")
+    journal.record("generate", file, "add", source_hash, "Adds numbers.")
+    journal.close()
+
+    # Act
+    resumed = DocstringJournal(path, tmp_path / "repo", resume=True)
+
+    # Assert
+    documented_hash = symbol_hash('def add(a, b):\n    """Adds numbers."""\n    return a + b')
+    assert resumed.get("generate", file, "add", documented_hash) == "Adds numbers."
+    assert resumed.get("generate", file, "add", symbol_hash("def add(a, b):\n    return a - b")) is None
+    assert resumed.get("update", file, "add", source_hash) is None
+    assert resumed.replayed == 1
+
+
+def test_journal_ignores_truncated_last_entry(tmp_path):
+    # Arrange
+    path = tmp_path / "journal.jsonl"
+    journal = DocstringJournal(path, tmp_path)
+    journal.record("generate", str(tmp_path / "a.py"), "first", "hash", "First.")
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"stage": "generate", "file": "a.py", "sym')
+
+    # Act
+    resumed = DocstringJournal(path, tmp_path, resume=True)
+
+    # Assert
+    assert resumed.entries == {("generate", "a.py", "first", "hash"): "First."}
+
+
+def test_journal_starts_empty_without_resume(tmp_path):
+    # Arrange
+    path = tmp_path / "journal.jsonl"
+    journal = DocstringJournal(path, tmp_path)
+    journal.record("generate", "a.py", "first", "hash", "First.")
+    journal.close()
+
+    # Act
+    restarted = DocstringJournal(path, tmp_path)
+    restarted.discard()
+
+    # Assert
+    assert restarted.entries == {}
+    assert not path.exists()
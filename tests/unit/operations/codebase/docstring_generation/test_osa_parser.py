@@ -0,0 +1,151 @@
+import pickle
+
+from osa_tool.operations.codebase.docstring_generation.core.osa_parser import OSA_TreeSitter
+from osa_tool.operations.codebase.docstring_generation.core.symbols import FunctionSymbol
+
+SOURCE = '''import os
+
+
+def helper(path):
+    """Ünïcode docstring."""
+    return os.path.basename(path)
+
+
+class Loader:
+    def load(self, path):
+        return helper(path)
+'''
+
+
+def _parse(tmp_path):
+    file = tmp_path / "module.py"
+    file.write_text(SOURCE, encoding="utf-8")
+    return str(file), OSA_TreeSitter(str(tmp_path)).extract_structure(str(file))
+
+
+def test_extract_structure_returns_offset_based_symbols(tmp_path):
+    # Act
+    file, result = _parse(tmp_path)
+
+    # Assert
+    function = result["structure"][0]["details"]
+    method = result["structure"][1]["methods"][0]
+    assert isinstance(function, FunctionSymbol)
+    assert function["source_code"].startswith("def helper(path):")
+    assert function["source_code"].endswith("return os.path.basename(path)")
+    assert method["source_code"] == "def load(self, path):\n        return helper(path)"
+    assert method["class_name"] == "Loader"
+    assert function.buffer is method.buffer
+    assert {**function}["file"] == file
+
+
+def test_symbols_pickle_with_a_single_shared_buffer(tmp_path):
+    # Arrange
+    _, result = _parse(tmp_path)
+
+    # Act
+    restored = pickle.loads(pickle.dumps(result))
+
+    # Assert
+    function = restored["structure"][0]["details"]
+    method = restored["structure"][1]["methods"][0]
+    assert function.buffer is method.buffer
+    assert method["source_code"] == result["structure"][1]["methods"][0]["source_code"]
+
+
+def test_pickled_buffer_keeps_only_symbol_spans(tmp_path):
+    # Arrange
+    _, result = _parse(tmp_path)
+    function = result["structure"][0]["details"]
+    method = result["structure"][1]["methods"][0]
+
+    # Act
+    restored = pickle.loads(pickle.dumps(result))
+
+    # Assert
+    restored_function = restored["structure"][0]["details"]
+    restored_method = restored["structure"][1]["methods"][0]
+    assert b"import os" not in restored_function.buffer.bytes
+    assert b"class Loader" not in restored_function.buffer.bytes
+    assert len(restored_function.buffer.bytes) == (
+        function.end_byte - function.start_byte + method.end_byte - method.start_byte
+    )
+    assert (restored_function.start_byte, restored_method.start_byte) == (0, function.end_byte - function.start_byte)
+    assert restored_function.source_code == function.source_code
+    assert restored_method.source_code == method.source_code
+    assert pickle.loads(pickle.dumps(restored_method)).source_code == method.source_code
+
+
+def test_extract_structure_keeps_raw_file_bytes(tmp_path):
+    # Arrange
+    file = tmp_path / "module.py"
+    raw = b"# latin-1 comment: caf\xe9\n\n\ndef helper(path):\n    return path\n"
+    file.write_bytes(raw)
+
+    # Act
+    result = OSA_TreeSitter(str(tmp_path)).extract_structure(str(file))
+
+    # Assert
+    function = result["structure"][0]["details"]
+    assert function.buffer.bytes == raw
+    assert function["source_code"] == "def helper(path):\n    return path"
+
+
+def test_build_function_index_references_symbols_without_copying(tmp_path):
+    # Arrange
+    file, result = _parse(tmp_path)
+
+    # Act
+    index = OSA_TreeSitter.build_function_index({file: result})
+
+    # Assert
+    assert index["Loader.load"] is result["structure"][1]["methods"][0]
+    assert index["load"]["class"] == "Loader"
+    assert index["helper"].get("class") is None
+    assert index["helper"]["file"] == file
+
+
+def test_calls_are_attributed_to_the_innermost_function_body(tmp_path):
+    # Arrange
+    file = tmp_path / "module.py"
+    file.write_text(
+        "def outer(x=default()):\n" "    def inner():\n" "        return nested()\n" "    return outer_call(inner())\n",
+        encoding="utf-8",
+    )
+
+    # Act
+    result = OSA_TreeSitter(str(tmp_path)).extract_structure(str(file))
+
+    # Assert
+    outer, inner = (item["details"] for item in result["structure"])
+    assert outer["method_calls"] == ["inner", "outer_call"]
+    assert inner["method_calls"] == ["nested"]
+
+
+def test_extract_structure_handles_deeply_nested_code(tmp_path):
+    # Arrange
+    file = tmp_path / "generated.py"
+    file.write_text("def build():\n    return " + "wrap(" * 2000 + ")" * 2000 + "\n", encoding="utf-8")
+
+    # Act
+    result = OSA_TreeSitter(str(tmp_path)).extract_structure(str(file))
+
+    # Assert
+    assert result["structure"][0]["details"]["method_calls"] == ["wrap"]
+
+
+def test_relative_imports_are_resolved_with_the_module_index(tmp_path):
+    # Arrange
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "models.py").write_text("class Model: pass\n", encoding="utf-8")
+    file = package / "service.py"
+    file.write_text("from .models import Model as Base\nfrom .missing import Other\n", encoding="utf-8")
+
+    # Act
+    result = OSA_TreeSitter(str(tmp_path)).extract_structure(str(file))
+
+    # Assert
+    assert result["imports"] == {
+        "Base": {"module": "pkg.models", "class": "Model", "path": str(package / "models.py")},
+    }
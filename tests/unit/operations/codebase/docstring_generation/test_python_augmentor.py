@@ -0,0 +1,89 @@
+import pytest
+
+from osa_tool.operations.codebase.docstring_generation.insert.python_augmentor import PythonAugmentor
+
+DOCSTRINGS = {
+    "functions": [("Adds numbers.\n\nArgs:\n    a: first\n    b: second", {"method_name": "add"})],
+    "methods": [
+        ('"""Runs the job with "quotes" and \\\\ backslashes."""', {"class_name": "Job", "method_name": "run"}),
+        ("Nested helper.", {"class_name": "Job", "method_name": "helper"}),
+    ],
+    "classes": [("A job.", "Job"), ("Settings.", "Config")],
+}
+
+FAST_PATH_SOURCES = {
+    "insert": (
+        "import os\n\n\ndef add(a, b):\n    return a + b\n\n\n"
+        "class Job:\n    name = 'job'\n\n    def run(self):\n        return add(1, 2)\n"
+    ),
+    "replace": (
+        'def add(a, b):\n    """Old."""  # trailing comment\n    return a + b\n\n\n'
+        "class Job:\n    '''\n    Old job.\n    '''\n\n    @property\n    async def run(self):\n        pass\n"
+    ),
+    "comments_and_blank_lines": (
+        "def add(a, b):  # header comment\n    # leading comment\n\n    return a + b\n\n\n"
+        'class Job:\n\n    """Old job."""\n    def run(self):\n        def helper():\n            pass\n'
+    ),
+    "nested_and_not_docstrings": (
+        "class Job:\n    class Config:\n        extra = 1\n\n"
+        "    def run(self):\n        f\"{self}\"\n\n\ndef add(a, b):\n    'a' 'b'\n    return a\n"
+    ),
+    "one_liners_and_two_space_indent": (
+        "def add(a, b): return a + b\n\n\nclass Job:\n  def run(self):\n    x = 1; y = 2\n"
+    ),
+    "bytes_docstring": 'def add(a, b):\n    b"""bytes doc"""\n    return a\n',
+}
+
+LIBCST_SOURCES = {
+    "tabs": "def add(a, b):\n\treturn a + b\n",
+    "crlf": "def add(a, b):\r\n    return a + b\r\n",
+    "mixed_indent": "class Job:\n    x = 1\n\ndef add(a, b):\n  return a + b\n",
+    "parenthesized_docstring": 'def add(a, b):\n    ("""Old.""")\n    return a\n',
+    "docstring_with_statement": 'def add(a, b):\n    """Old."""; return a\n',
+    "syntax_error": "def add(a, b:\n    return a\n",
+}
+
+
+@pytest.mark.parametrize("name", FAST_PATH_SOURCES)
+def test_fast_path_matches_libcst(name):
+    # Arrange
+    source = FAST_PATH_SOURCES[name]
+    augmentor = PythonAugmentor()
+
+    # Act
+    spliced = augmentor._splice(source, DOCSTRINGS)
+    expected = augmentor._augment_with_libcst("f.py", source, DOCSTRINGS)["f.py"]
+
+    # Assert
+    assert spliced is not None
+    assert spliced == expected
+
+
+@pytest.mark.parametrize("name", LIBCST_SOURCES)
+def test_exotic_sources_fall_back_to_libcst(name):
+    # Arrange
+    source = LIBCST_SOURCES[name]
+    augmentor = PythonAugmentor()
+
+    # Act
+    spliced = augmentor._splice(source, DOCSTRINGS)
+    result = augmentor.augment("f.py", source, DOCSTRINGS)["f.py"]
+
+    # Assert
+    assert spliced is None
+    assert result == augmentor._augment_with_libcst("f.py", source, DOCSTRINGS)["f.py"]
+
+
+def test_augment_inserts_docstring_with_body_indentation():
+    # Arrange
+    source = "class Job:\n    def run(self):\n        return 1\n"
+
+    # Act
+    result = PythonAugmentor().augment(
+        "f.py", source, {"methods": [("Runs.", {"class_name": "Job", "method_name": "run"})]}
+    )
+
+    # Assert
+    assert (
+        result["f.py"] == 'class Job:\n    def run(self):\n        """\n        Runs.\n        """\n        return 1\n'
+    )
@@ -0,0 +1,38 @@
+from osa_tool.operations.codebase.docstring_generation.summary_cache import SummaryCache
+
+
+def test_summary_cache_keeps_only_entries_used_by_the_last_run(tmp_path):
+    # Arrange
+    path = tmp_path / "summaries.json"
+    first_run = SummaryCache(path)
+    first_run.put("module", "old", "Old summary.")
+    first_run.put("module", "stable", "Stable summary.")
+    first_run.put("main_idea", "idea", "Main idea.")
+    first_run.save()
+
+    # Act
+    second_run = SummaryCache(path)
+    stable = second_run.get("module", "stable")
+    second_run.put("module", "new", "New summary.")
+    second_run.save()
+
+    # Assert
+    assert stable == "Stable summary."
+    assert second_run.hits == 1
+    assert SummaryCache(path).entries == {
+        "module": {"stable": "Stable summary.", "new": "New summary."},
+        "main_idea": {"idea": "Main idea."},
+    }
+
+
+def test_summary_cache_ignores_corrupted_file(tmp_path):
+    # Arrange
+    path = tmp_path / "summaries.json"
+    path.write_text('{"module": {"trunc', encoding="utf-8")
+
+    # Act
+    cache = SummaryCache(path)
+
+    # Assert
+    assert cache.entries == {}
+    assert cache.get("module", "trunc") is None
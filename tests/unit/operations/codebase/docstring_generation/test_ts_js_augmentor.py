@@ -112,3 +112,49 @@ def test_format_plain_text_unchanged_behaviour():
     assert "```" not in out
     assert out.count("/**") == 1
     assert out.count("*/") == 1
+
+
+def test_augment_inserts_and_replaces_docs_in_one_pass():
+    """Classes, arrow functions and decorated methods get their JSDoc; an existing block is replaced."""
+    source = (
+        "/** Outdated. */\n"
+        "export const double = (value) => value * 2;\n"
+        "\n"
+        "export class Widget {\n"
+        "  @HostListener('click')\n"
+        "  onClick(event) {\n"
+        "    return double(event.x);\n"
+        "  }\n"
+        "}\n"
+    )
+    docstrings = {
+        "classes": [("A clickable widget.", "Widget")],
+        "functions": [("Doubles the value.", {"method_name": "double"})],
+        "methods": [("Handles clicks.", {"method_name": "onClick", "class_name": "Widget"})],
+    }
+
+    out = TSJSAugmentor().augment("w.ts", source, docstrings)["w.ts"]
+
+    assert out == (
+        "/**\n * Doubles the value.\n */\n"
+        "export const double = (value) => value * 2;\n"
+        "\n"
+        "/**\n * A clickable widget.\n */\n"
+        "export class Widget {\n"
+        "  /**\n   * Handles clicks.\n   */\n"
+        "  @HostListener('click')\n"
+        "  onClick(event) {\n"
+        "    return double(event.x);\n"
+        "  }\n"
+        "}\n"
+    )
+
+
+def test_augment_ignores_calls_and_unknown_symbols():
+    """Only declarations are documented, usages of the same name and missing symbols are left untouched."""
+    source = "function run() {\n  return start();\n}\n\nfunction start() {}\n"
+    docstrings = {"functions": [("Starts.", {"method_name": "start"}), ("Missing.", {"method_name": "absent"})]}
+
+    out = TSJSAugmentor().augment("r.js", source, docstrings)["r.js"]
+
+    assert out == "function run() {\n  return start();\n}\n\n/**\n * Starts.\n */\nfunction start() {}\n"
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from osa_tool.operations.codebase.docstring_generation.worker_pool import WorkerPool
+from osa_tool.operations.codebase.docstring_generation.write_back import FileWriteBack
+
+
+@pytest.mark.asyncio
+async def test_write_back_writes_completed_files_and_skips_files_without_docstrings(tmp_path):
+    # Arrange
+    documented = tmp_path / "documented.py"
+    untouched = tmp_path / "untouched.py"
+    documented.write_text("def foo():\n    pass\n", encoding="utf-8")
+    untouched.write_text("def bar():\n    pass\n", encoding="utf-8")
+
+    # Act
+    with WorkerPool(1) as pool:
+        write_back = FileWriteBack(pool, asyncio.Semaphore(2))
+        write_back.complete(str(documented), {"functions": [("Foo.", {"method_name": "foo"})], "methods": []})
+        write_back.complete(str(untouched), {"functions": [], "methods": [], "classes": []})
+        written = await write_back.drain()
+
+    # Assert
+    assert written == 1
+    assert documented.read_text(encoding="utf-8") == 'def foo():\n    """\n    Foo.\n    """\n    pass\n'
+    assert untouched.read_text(encoding="utf-8") == "def bar():\n    pass\n"
+
+
+@pytest.mark.asyncio
+async def test_write_back_drain_raises_after_finishing_other_files(tmp_path):
+    # Arrange
+    documented = tmp_path / "documented.py"
+    documented.write_text("def foo():\n    pass\n", encoding="utf-8")
+    docstrings = {"functions": [("Foo.", {"method_name": "foo"})]}
+
+    # Act
+    with WorkerPool(1) as pool:
+        write_back = FileWriteBack(pool, asyncio.Semaphore(2))
+        write_back.complete(str(tmp_path / "missing.py"), docstrings)
+        write_back.complete(str(documented), docstrings)
+        with pytest.raises(FileNotFoundError):
+            await write_back.drain()
+
+    # Assert
+    assert '"""\n    Foo.\n    """' in documented.read_text(encoding="utf-8")
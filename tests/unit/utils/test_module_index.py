@@ -0,0 +1,62 @@
+import os
+
+from osa_tool.utils.module_index import ModuleIndex, module_name, relative_import_name
+
+
+def _make_repo(tmp_path):
+    for path in ("pkg/__init__.py", "pkg/mod.py", "pkg/sub/helpers.py", ".venv/lib/site.py", "README.md"):
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("")
+
+
+def test_build_indexes_modules_and_packages(tmp_path):
+    # Arrange
+    _make_repo(tmp_path)
+
+    # Act
+    index = ModuleIndex.build(str(tmp_path))
+
+    # Assert
+    assert index.module_file("pkg.mod") == os.path.join(str(tmp_path), "pkg", "mod.py")
+    assert index.module_file("pkg") is None
+    assert index.resolve("pkg") == os.path.join(str(tmp_path), "pkg", "__init__.py")
+    assert "pkg.sub.helpers" in index
+    assert len(index) == 3
+
+
+def test_lookups_do_not_touch_the_filesystem(tmp_path, monkeypatch):
+    # Arrange
+    _make_repo(tmp_path)
+    index = ModuleIndex.build(str(tmp_path))
+    monkeypatch.setattr(os, "stat", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("stat")))
+
+    # Act
+    resolved = index.resolve("pkg.sub.helpers")
+    missing = index.resolve("pkg.missing")
+
+    # Assert
+    assert resolved.endswith("helpers.py")
+    assert missing is None
+
+
+def test_absolute_name_resolves_relative_imports(tmp_path):
+    # Arrange
+    _make_repo(tmp_path)
+    index = ModuleIndex.build(str(tmp_path))
+    helpers = os.path.join(str(tmp_path), "pkg", "sub", "helpers.py")
+    package = os.path.join(str(tmp_path), "pkg", "__init__.py")
+
+    # Act & Assert
+    assert index.absolute_name(helpers, "..mod") == "pkg.mod"
+    assert index.absolute_name(helpers, ".") == "pkg.sub"
+    assert index.absolute_name(package, ".mod") == "pkg.mod"
+    assert index.absolute_name(helpers, "os.path") == "os.path"
+
+
+def test_module_name_and_relative_import_name():
+    # Act & Assert
+    assert module_name("pkg/__init__.py") == "pkg"
+    assert module_name("pkg\\mod.pyx", (".py", ".pyx")) == "pkg.mod"
+    assert module_name("README.md") is None
+    assert relative_import_name("pkg.sub.helpers", 3, "other") == "other"